@@ -24,8 +24,30 @@
 
 import os
 import sys
+import csv
 import math
+import json
+import time
+import zlib
+import struct
+import hashlib
+import shutil
+import cProfile
+import argparse
+import sqlite3
+import tempfile
+import subprocess
+import urllib.parse
 import bpy
+import bmesh
+import numpy
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 
 bl_info = {
@@ -42,457 +64,3278 @@ bl_info = {
     "category": "Tool"
 }
 
-class HOLOLAB_OT_ModerateWeightReduction(bpy.types.Operator):
-    bl_idname = "hololab.moderate_weight_reduction"
-    bl_label = "Moderate Weight Reduction Tools"
-    bl_description = "Generates models with reduced polygon mesh and optimized textures from the original model."
-    bl_options = {'REGISTER', 'UNDO'}
+# bake maps (map name, bake type, image name suffix, non-color data)
+BAKE_MAPS = [
+    ("base_color", 'DIFFUSE', "", False),
+    ("normal", 'NORMAL', "_normal", True),
+    ("roughness", 'ROUGHNESS', "_roughness", True),
+    ("metallic", 'EMIT', "_metallic", True),
+    ("ao", 'AO', "_ao", True),
+]
 
-    remove_doubles: bpy.props.BoolProperty(
-        name="remove_doubles",
-        description="If the mesh is split, overlapping vertices are joined.",
-        default=False
-    )
+# cycles samples of each bake type in bake profiles
+BAKE_SAMPLES = {
+    'PREVIEW': {'DIFFUSE': 1, 'NORMAL': 1, 'ROUGHNESS': 1, 'EMIT': 1, 'AO': 1},
+    'FINAL': {'DIFFUSE': 4, 'NORMAL': 8, 'ROUGHNESS': 4, 'EMIT': 4, 'AO': 128},
+}
 
-    decimate_rate: bpy.props.FloatProperty(
-        name="decimate_rate",
-        description="Ratio of polygon mesh left after reduction.",
-        default=0.05,
-        min=0.0,
-        max=1.0
-    )
+# render settings that are changed by bake stage
+RENDER_SETTINGS = [
+    ("render", ["engine", "threads_mode", "threads"]),
+    ("render.bake", ["use_pass_direct", "use_pass_indirect", "use_selected_to_active", "cage_extrusion", "max_ray_distance", "use_cage", "cage_object", "margin", "margin_type", "use_clear", "normal_space"]),
+    ("cycles", ["bake_type", "samples", "use_adaptive_sampling", "use_denoising", "device", "use_auto_tile"]),
+    ("render", ["resolution_x", "resolution_y", "resolution_percentage", "filepath", "film_transparent"]),
+    ("render.image_settings", ["file_format", "color_mode"]),
+    ("display.shading", ["light", "color_type"]),
+]
 
-    texture_name: bpy.props.StringProperty(
-        name="texture_name",
-        description="Name of new texture.",
-        default="texture"
-    )
+# number of surface points that are sampled to measure deviation between meshes
+DEVIATION_SAMPLE_COUNT = 100000
 
-    texture_resolution: bpy.props.EnumProperty(
-        name="texture_resolution",
-        description="Resolution of new texture.",
-        default="1024", 
-        items=[
-            ("256", "256 x 256", "256 x 256"),
-            ("512", "512 x 512", "512 x 512"),
-            ("1024", "1024 x 1024", "1024 x 1024"),
-            ("2048", "2048 x 2048", "2048 x 2048"),
-            ("4096", "4096 x 4096", "4096 x 4096")
-        ]
-    )
+# resolution of bake that checks texels missed by rays
+MISSED_TEXEL_RESOLUTION = 512
 
-    def execute(self, context):
-        self.report({'INFO'}, "execute auto decimation and bake function")
+# ratio of missed texels that is reported as warning
+MISSED_TEXEL_WARNING = 0.01
 
-        self.report({'INFO'}, f"{self.remove_doubles=}")
-        self.report({'INFO'}, f"{self.decimate_rate=}")
-        self.report({'INFO'}, f"{self.texture_name=}")
-        self.report({'INFO'}, f"{self.texture_resolution=}")
+# view directions of cameras that render original and result models to compare them
+QUALITY_VIEWS = [
+    ("front", (0.0, -1.0, 0.0)),
+    ("back", (0.0, 1.0, 0.0)),
+    ("left", (-1.0, 0.0, 0.0)),
+    ("right", (1.0, 0.0, 0.0)),
+    ("top", (0.0, 0.0, 1.0)),
+    ("diagonal", (1.0, -1.0, 1.0)),
+]
 
-        previous_language = bpy.context.preferences.view.language
-        bpy.context.preferences.view.language = 'en_US'
+# resolution of renders that compare original and result models
+QUALITY_RENDER_RESOLUTION = 256
+
+# bake maps that are packed into orm texture
+ORM_MAPS = ["ao", "roughness", "metallic"]
+
+# face attribute that stores index of source object in merged mesh
+MERGE_PART_ATTRIBUTE = "hololab_part"
 
+# minimum triangle budget of each source object in merged mesh (small parts are not collapsed)
+MERGE_MIN_PART_TRIANGLES = 12
+
+# operator settings that do not change cached result (excluded from cache key, cache stores lod0 only)
+CACHE_IGNORED_SETTINGS = [
+    "bake_threads", "use_cache", "cache_directory", "cache_max_size", "report_directory", "profile_stage", "measure_quality",
+    "lod_levels", "lod_texture", "bake_check_missed_texels",
+    "export_directory", "export_format", "export_compression", "export_image_format",
+    "export_draco_level", "export_draco_position_bits", "export_draco_normal_bits", "export_draco_texcoord_bits"
+]
+
+# reduction job context that carries object handles through all stages
+class ReductionJob:
+    def __init__(self, object_source, texture_name):
+        self.object_source = object_source
+        self.object_sources = [object_source]
+        self.object_target = None
+        self.texture_name = texture_name
+        self.image = None
+        self.images = {}
+        self.bake_nodes = {}
+        self.cache_key = ""
+        self.object_lods = []
+        self.resolution = 0
+        self.metrics = {}
+        self.object_cage = None
+
+# persistent result cache on disk with least recently used eviction (index is sqlite database shared by worker processes)
+class ResultCache:
+    def __init__(self, directory, max_size):
+        self.directory = directory
+        self.max_size = max_size
+        self.index_path = os.path.join(directory, "index.sqlite3")
+        os.makedirs(directory, exist_ok=True)
+
+        def create_tables(connection):
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, size INTEGER, last_access REAL)")
+            connection.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)")
+            connection.execute("INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0)")
+            self.import_json_index(connection)
+        self.transaction(create_tables)
+
+    # import entries of json index that earlier versions wrote (results are not lost from eviction)
+    def import_json_index(self, connection):
+        json_path = os.path.join(self.directory, "index.json")
+        if not os.path.exists(json_path):
+            return
         try:
-            self.clone_target_object()
-            self.integration_polygon()
-            self.reduction_polygon()
-            self.set_material_and_texture()
-            self.expand_uv()
-            self.apply_auto_smooth()
-            self.settings_bake_configurations()
-            self.execute_bake()
-            self.triangulate_faces()
-            self.export_gltf()
-        except Exception as e:
-            self.report({'ERROR'}, f"{e}")
-            return {'CANCELLED'}
-        finally:
-            bpy.context.preferences.view.language = previous_language
+            with open(json_path, encoding="utf-8") as f:
+                entries = json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            entries = {}
+        for key, entry in entries.items():
+            if os.path.exists(self.get_filepath(key)):
+                connection.execute("INSERT OR IGNORE INTO entries VALUES (?, ?, ?)", (key, entry["size"], entry["last_access"]))
+        os.remove(json_path)
 
-        return {'FINISHED'}
+    # run function in one write transaction (other processes wait for lock)
+    def transaction(self, function):
+        connection = sqlite3.connect(self.index_path, timeout=60.0, isolation_level=None)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = function(connection)
+                connection.execute("COMMIT")
+                return result
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        finally:
+            connection.close()
 
-    # clone tartget object
-    def clone_target_object(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    def get_filepath(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.blend")
 
-        # select source object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_source = bpy.context.active_object
-        if object_source is None:
-            self.report({'ERROR'}, "please turn active the source object in outliner or view port.")
-            raise Exception("source object is not found.")
-        object_source.select_set(True)
-        bpy.context.view_layer.objects.active = object_source
+    # get file path of cached result (empty if not cached)
+    def get(self, key):
+        filepath = self.get_filepath(key)
 
-        # rename source object
-        object_source.name = "Original"
+        def get_entry(connection):
+            row = connection.execute("SELECT key FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None and os.path.exists(filepath):
+                connection.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+                connection.execute("UPDATE counters SET value = value + 1 WHERE name = 'hits'")
+                return filepath
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            connection.execute("UPDATE counters SET value = value + 1 WHERE name = 'misses'")
+            return ""
+        return self.transaction(get_entry)
 
-        # duplicate object
-        bpy.ops.object.duplicate(linked=False)
+    # write result with function and evict least recently used results over max size
+    def put(self, key, write_function):
+        filepath = self.get_filepath(key)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-        # rename target object
-        object_target = bpy.context.active_object
-        object_target.name = "Result"
+        # write into temp file, so other processes do not read result that is being written
+        temp_path = f"{filepath}.{os.getpid()}.tmp"
+        write_function(temp_path)
+        os.replace(temp_path, filepath)
 
-    # integration polygon
-    def integration_polygon(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+        def put_entry(connection):
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, os.path.getsize(filepath), time.time()))
+            total_size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            for old_key, size in connection.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall():
+                if total_size <= self.max_size or old_key == key:
+                    break
+                total_size -= size
+                connection.execute("DELETE FROM entries WHERE key = ?", (old_key,))
+                if os.path.exists(self.get_filepath(old_key)):
+                    os.remove(self.get_filepath(old_key))
+        self.transaction(put_entry)
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+    def stats(self):
+        def get_stats(connection):
+            counters = dict(connection.execute("SELECT name, value FROM counters").fetchall())
+            size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            return counters["hits"], counters["misses"], size
+        return self.transaction(get_stats)
 
-        # apply remove doubles
-        if self.remove_doubles:
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles(threshold=0.001)
-            bpy.ops.object.mode_set(mode='OBJECT')
+# create working copy object that shares mesh and has only decimate modifier
+def create_decimate_work_object(mesh):
+    object_work = bpy.data.objects.new(f"{mesh.name}_decimate_work", mesh)
+    bpy.context.scene.collection.objects.link(object_work)
+    object_work.modifiers.new(name="Decimate", type='DECIMATE')
+    return object_work
 
-    # reduction polygon
-    def reduction_polygon(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+# create new decimated mesh from mesh (uv and materials are kept)
+def decimate_mesh(mesh, ratio):
+    object_work = create_decimate_work_object(mesh)
+    try:
+        object_work.modifiers[0].ratio = ratio
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        depsgraph.update()
+        return bpy.data.meshes.new_from_object(object_work.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+    finally:
+        bpy.data.objects.remove(object_work)
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+# downsample image by scale of 2 ^ level into new image (box or lanczos filter in linear space)
+def downsample_image(image, level, use_lanczos=False):
+    width, height = max(image.size[0] >> level, 1), max(image.size[1] >> level, 1)
+    pixels = image_to_array(image)
+    is_srgb = image.colorspace_settings.name == 'sRGB'
+    if is_srgb:
+        srgb_to_linear(pixels)
+    if use_lanczos:
+        pixels = downsample_lanczos(pixels, width, height)
+    else:
+        pixels = downsample_box(pixels, 1 << level)
+    if is_srgb:
+        linear_to_srgb(pixels)
 
-        # decimation
-        decimate_modifier = object_target.modifiers.new(name="Decimate", type='DECIMATE')
-        decimate_modifier.ratio = self.decimate_rate
-        bpy.ops.object.modifier_apply(modifier=decimate_modifier.name)
+    image_lod = bpy.data.images.new(name=f"{image.name}_LOD{level}", width=width, height=height, alpha=True)
+    image_lod.colorspace_settings.name = image.colorspace_settings.name
+    array_to_image(image_lod, pixels)
+    image_lod.pack()
+    return image_lod
 
-    # settings material and texture
-    def set_material_and_texture(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+# count triangles of decimated mesh on a working copy object (the mesh is not changed)
+def count_decimated_triangles(object_work, ratio):
+    object_work.modifiers[0].ratio = ratio
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    depsgraph.update()
+    mesh = object_work.evaluated_get(depsgraph).data
+    return len(mesh.loops) - len(mesh.polygons) * 2
 
-        # select source object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_source = bpy.data.objects.get("Original")
-        object_source.select_set(True)
-        bpy.context.view_layer.objects.active = object_source
+# find decimate ratio whose triangle count converges on (and does not exceed) target triangle count
+def find_decimate_ratio(object_target, target_triangles, max_iterations=8, tolerance=0.02):
+    mesh = object_target.data
+    triangles = len(mesh.loops) - len(mesh.polygons) * 2
+    if triangles <= target_triangles:
+        return 1.0, triangles, 0
 
-        # rename exist image texture with same name as specified name that are linked in source object material
-        texture_name = self.texture_name if self.texture_name else "texture"
-        for material in object_source.data.materials:
-            principled_bsdf = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-            if principled_bsdf.inputs['Base Color'].is_linked is False:
-                continue
-            image = principled_bsdf.inputs['Base Color'].links[0].from_socket.node.image
-            if image.name == texture_name:
-                image.name += ".original"
+    object_work = create_decimate_work_object(mesh)
 
-        # remove exist image textures that generated at last run　
-        exist_images = [image for image in bpy.data.images if image.name == texture_name]
-        for exist_image in exist_images:
-            bpy.data.images.remove(image=exist_image)
+    best_ratio, best_triangles = 0.0, 0
+    low, high = 0.0, 1.0
+    ratio = target_triangles / triangles
+    iterations = 0
+    try:
+        for iterations in range(1, max_iterations + 1):
+            triangles = count_decimated_triangles(object_work, ratio)
+            if triangles <= target_triangles and triangles > best_triangles:
+                best_ratio, best_triangles = ratio, triangles
+            if triangles <= target_triangles and target_triangles - triangles <= target_triangles * tolerance:
+                break
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+            # narrow bracket and take secant step (bisect if it leaves bracket)
+            if triangles > target_triangles:
+                high = ratio
+            else:
+                low = ratio
+            next_ratio = ratio * target_triangles / max(triangles, 1)
+            ratio = next_ratio if low < next_ratio < high else (low + high) / 2
 
-        # clear materials
-        object_target.data.materials.clear()
+        # keep bisecting lower bracket until triangle count is within target (target is hard limit)
+        while best_ratio == 0.0 and iterations < max_iterations * 4:
+            iterations += 1
+            triangles = count_decimated_triangles(object_work, ratio)
+            if triangles <= target_triangles:
+                best_ratio, best_triangles = ratio, triangles
+            else:
+                high = ratio
+                ratio = (low + high) / 2
 
-        # add new material
-        material = bpy.data.materials.new(name="Material")
-        object_target.data.materials.append(material)
+        # target is not reached (decimation keeps minimal mesh), so smallest ratio that is tried is used
+        if best_ratio == 0.0:
+            best_ratio, best_triangles = high, triangles
+    finally:
+        bpy.data.objects.remove(object_work)
 
-        # add image texture node
-        material.use_nodes = True
-        node_tree = material.node_tree
-        image_texture = node_tree.nodes.new(type='ShaderNodeTexImage')
-        image_texture.location = (-200, 0)
+    return best_ratio, best_triangles, iterations
 
-        # create image texture
-        resolution = int(self.texture_resolution)
-        image_texture.image = bpy.data.images.new(name=texture_name, width=resolution, height=resolution)
+# create object that joins copies of source objects with transforms applied (index of source object is stored in face attribute)
+def create_merged_object(object_sources, name):
+    materials = []
+    bm = bmesh.new()
+    try:
+        for index, object_source in enumerate(object_sources):
+            mesh = object_source.data.copy()
+            try:
+                mesh.transform(object_source.matrix_world)
+                if object_source.matrix_world.determinant() < 0.0:
+                    mesh.flip_normals()
 
-        # link color socket from image texture to principled bsdf
-        principled_bsdf = [node for node in node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-        node_tree.links.new(image_texture.outputs['Color'], principled_bsdf.inputs['Base Color'])
+                # keep only active uv map with common name (bmesh joins layers of same name)
+                active_name = mesh.uv_layers.active.name if mesh.uv_layers.active is not None else None
+                for layer_name in [uv_layer.name for uv_layer in mesh.uv_layers if uv_layer.name != active_name]:
+                    mesh.uv_layers.remove(mesh.uv_layers[layer_name])
+                if active_name is None:
+                    mesh.uv_layers.new(name="UVMap")
+                else:
+                    mesh.uv_layers[active_name].name = "UVMap"
 
-    # expand uv
-    def expand_uv(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+                # remap material indices to material list of merged mesh
+                slot_materials = [slot.material for slot in object_source.material_slots]
+                for material in slot_materials:
+                    if material not in materials:
+                        materials.append(material)
+                if slot_materials and len(mesh.polygons) > 0:
+                    material_indices = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+                    mesh.polygons.foreach_get("material_index", material_indices)
+                    material_map = numpy.array([materials.index(material) for material in slot_materials], dtype=numpy.int32)
+                    mesh.polygons.foreach_set("material_index", material_map[numpy.clip(material_indices, 0, len(material_map) - 1)])
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+                part_attribute = mesh.attributes.new(MERGE_PART_ATTRIBUTE, 'INT', 'FACE')
+                part_attribute.data.foreach_set("value", numpy.full(len(mesh.polygons), index, dtype=numpy.int32))
+                bm.from_mesh(mesh)
+            finally:
+                bpy.data.meshes.remove(mesh)
 
-        # set smart uv project
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.uv.smart_project(angle_limit=0.349066, margin_method='FRACTION', rotate_method='AXIS_ALIGNED', island_margin=0.001, area_weight=0.0, correct_aspect=True, scale_to_bounds=False)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        merged_mesh = bpy.data.meshes.new(name)
+        bm.to_mesh(merged_mesh)
+    finally:
+        bm.free()
 
-    # apply auto smooth
-    def apply_auto_smooth(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    for material in materials:
+        merged_mesh.materials.append(material)
+    object_merged = bpy.data.objects.new(name, merged_mesh)
+    for collection in object_sources[0].users_collection:
+        collection.objects.link(object_merged)
+    return object_merged
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+# create new mesh from polygons of mesh arrays (point, corner and face attributes are kept)
+def create_part_mesh(name, coordinates, loop_vertices, loop_totals, attributes, kept_polygons):
+    kept_loops = numpy.repeat(kept_polygons, loop_totals)
+    kept_vertices, part_loop_vertices = numpy.unique(loop_vertices[kept_loops], return_inverse=True)
+    polygon_totals = loop_totals[kept_polygons]
 
-        # apply auto smooth
-        if bpy.app.version < (4, 1, 0):
-            bpy.context.object.data.use_auto_smooth = True
-            bpy.context.object.data.auto_smooth_angle = math.radians(30)
-        else:
-            bpy.ops.object.shade_smooth_by_angle(angle=math.radians(30))
+    part_mesh = bpy.data.meshes.new(name)
+    part_mesh.vertices.add(len(kept_vertices))
+    part_mesh.vertices.foreach_set("co", coordinates[kept_vertices].ravel())
+    part_mesh.loops.add(len(part_loop_vertices))
+    part_mesh.loops.foreach_set("vertex_index", part_loop_vertices.astype(numpy.int32).ravel())
+    part_mesh.polygons.add(len(polygon_totals))
+    part_mesh.polygons.foreach_set("loop_start", (numpy.cumsum(polygon_totals) - polygon_totals).astype(numpy.int32))
+    if bpy.app.version < (4, 0, 0):
+        part_mesh.polygons.foreach_set("loop_total", polygon_totals)
 
-    # settings bake configurations
-    def settings_bake_configurations(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    kept_elements = {'POINT': kept_vertices, 'CORNER': kept_loops, 'FACE': kept_polygons}
+    for attribute_name, data_type, domain, values in attributes:
+        part_attribute = part_mesh.attributes.get(attribute_name) or part_mesh.attributes.new(attribute_name, data_type, domain)
+        part_attribute.data.foreach_set(ATTRIBUTE_VALUE_TYPES[data_type][0], values[kept_elements[domain]].ravel())
+    part_mesh.update(calc_edges=True)
+    return part_mesh
 
-        # set render engine to cycles
-        bpy.context.scene.render.engine = 'CYCLES'
+# decimate each part of merged mesh with triangle budget split by surface area of part, then join parts again
+def decimate_parts(object_target, budget, min_triangles=MERGE_MIN_PART_TRIANGLES):
+    mesh = object_target.data
+    polygon_count = len(mesh.polygons)
+    coordinates = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", coordinates)
+    loop_vertices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_totals = numpy.empty(polygon_count, dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    areas = numpy.empty(polygon_count, dtype=numpy.float32)
+    mesh.polygons.foreach_get("area", areas)
+    parts = get_attribute_values(mesh.attributes[MERGE_PART_ATTRIBUTE]).ravel()
 
-        # disable pass direct and pass indirect
-        bpy.context.scene.render.bake.use_pass_direct = False
-        bpy.context.scene.render.bake.use_pass_indirect = False
+    # point, corner and face attributes (uv maps, colors, materials and smooth flags)
+    attributes = []
+    for attribute in mesh.attributes:
+        if attribute.name.startswith(".") or attribute.name in ("position", MERGE_PART_ATTRIBUTE):
+            continue
+        if attribute.domain not in ('POINT', 'CORNER', 'FACE') or attribute.data_type not in ATTRIBUTE_VALUE_TYPES:
+            continue
+        attributes.append((attribute.name, attribute.data_type, attribute.domain, get_attribute_values(attribute)))
 
-        # enable selected to active
-        bpy.context.scene.render.bake.use_selected_to_active = True
+    # triangle budget of each part is in proportion to its surface area
+    part_triangles = numpy.bincount(parts, weights=loop_totals - 2)
+    part_areas = numpy.bincount(parts, weights=areas)
+    part_budgets = numpy.maximum(budget * part_areas / max(part_areas.sum(), 1e-12), min_triangles)
+    ratios = numpy.minimum(part_budgets / numpy.maximum(part_triangles, 1), 1.0)
 
-        # set cage extrusion to 0.1m
-        bpy.context.scene.render.bake.cage_extrusion = 0.1
+    # decimate parts one by one and append them into bmesh
+    part_count = 0
+    bm = bmesh.new()
+    try:
+        for part in numpy.nonzero(part_triangles)[0]:
+            part_mesh = create_part_mesh(f"{mesh.name}_part", coordinates.reshape(-1, 3), loop_vertices, loop_totals, attributes, parts == part)
+            decimated_mesh = decimate_mesh(part_mesh, float(ratios[part])) if ratios[part] < 1.0 else part_mesh
+            bm.from_mesh(decimated_mesh)
+            for remove_mesh in {part_mesh, decimated_mesh}:
+                bpy.data.meshes.remove(remove_mesh)
+            part_count += 1
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
 
-        # set margin type to extend
-        bpy.context.scene.render.bake.margin_type = 'EXTEND'
+    mesh.update()
+    return part_count, len(mesh.loops) - len(mesh.polygons) * 2
 
-        # set bake type to diffuse
-        bpy.context.scene.cycles.bake_type = 'DIFFUSE'
-        bpy.context.scene.render.bake.use_clear = True
+# texture resolutions that can be selected
+TEXTURE_RESOLUTIONS = [256, 512, 1024, 2048, 4096, 8192, 16384]
 
-    # execute bake
-    def execute_bake(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+# get area covered by uv islands (in uv space) and surface area (in world space) of mesh object
+def get_uv_and_surface_area(object_mesh):
+    mesh = object_mesh.data
+    if mesh.uv_layers.active is None or len(mesh.polygons) == 0:
+        return 0.0, 0.0
 
-        # deselect all object
-        bpy.ops.object.select_all(action='DESELECT')
+    uvs = numpy.empty(len(mesh.loops) * 2, dtype=numpy.float64)
+    mesh.uv_layers.active.data.foreach_get("uv", uvs)
+    uvs = uvs.reshape(-1, 2)
+    loop_starts = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
 
-        # select source object
-        object_source = bpy.data.objects.get("Original")
-        object_source.select_set(True)
-        
-        # active tartget object
-        object_target = bpy.data.objects.get("Result")
-        bpy.context.view_layer.objects.active = object_target
+    # shoelace formula of each polygon
+    next_loops = numpy.arange(1, len(mesh.loops) + 1)
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+    cross = uvs[:, 0] * uvs[next_loops, 1] - uvs[next_loops, 0] * uvs[:, 1]
+    uv_area = numpy.abs(numpy.add.reduceat(cross, loop_starts)).sum() * 0.5
 
-        # store metallic settings
-        metallic_socket = None
-        metallic_value = 0.0
-        for material in object_source.data.materials:
-            principled_bsdf = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-            if not ('Metallic' in principled_bsdf.inputs.keys()):
-                continue
-            if principled_bsdf.inputs['Metallic'].is_linked:
-                metallic_socket = principled_bsdf.inputs['Metallic'].links[0].from_socket
-                material.node_tree.links.remove(principled_bsdf.inputs['Metallic'].links[0])
-            else:
-                metallic_value = principled_bsdf.inputs['Metallic'].default_value
-                principled_bsdf.inputs['Metallic'].default_value = 0
+    areas = numpy.empty(len(mesh.polygons), dtype=numpy.float64)
+    mesh.polygons.foreach_get("area", areas)
+    scale = abs(object_mesh.matrix_world.to_3x3().determinant()) ** (2.0 / 3.0)
+    return float(uv_area), float(areas.sum() * scale)
 
-        # execute bake
-        bpy.ops.object.bake(type='DIFFUSE')
+# select smallest texture resolution that reaches required resolution
+def select_texture_resolution(required_resolution):
+    for resolution in TEXTURE_RESOLUTIONS:
+        if resolution >= required_resolution:
+            return resolution
+    return TEXTURE_RESOLUTIONS[-1]
 
-        # restore metallic settings
-        for material in object_source.data.materials:
-            principled_bsdf = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-            if not ('Metallic' in principled_bsdf.inputs.keys()):
-                continue
-            if metallic_socket is not None:
-                material.node_tree.links.new(metallic_socket, principled_bsdf.inputs['Metallic'])
-            else:
-                principled_bsdf.inputs['Metallic'].default_value = metallic_value
+# average wall time of each stage in previous runs (estimates remaining time of run)
+class StageTimes:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.times = {}
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, encoding="utf-8") as f:
+                    self.times = json.load(f)
+            except (OSError, ValueError):
+                self.times = {}
 
-    def triangulate_faces(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    # update average time of stage (recent runs are weighted)
+    def update(self, key, wall_time):
+        previous_time = self.times.get(key)
+        self.times[key] = wall_time if previous_time is None else previous_time * 0.5 + wall_time * 0.5
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+    # estimate total time of stages (-1 if no stage has time of previous runs)
+    def estimate(self, keys):
+        if keys and not any(key in self.times for key in keys):
+            return -1.0
+        return sum(self.times.get(key, 0.0) for key in keys)
 
-        # traiangulate faces
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.mesh.select_mode(type='FACE')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.quads_convert_to_tris(quad_method='BEAUTY', ngon_method='BEAUTY')
-        bpy.ops.object.mode_set(mode='OBJECT')
+    # save times (times are only estimates, so failure of saving is ignored)
+    def save(self):
+        temp_filepath = f"{self.filepath}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            with open(temp_filepath, "w", encoding="utf-8") as f:
+                json.dump(self.times, f, indent=2)
+            os.replace(temp_filepath, self.filepath)
+        except OSError:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
 
-    def export_gltf(self):
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        object_target.select_set(True)
-        bpy.context.view_layer.objects.active = object_target
+# build bvh tree of mesh object in world space
+def create_world_bvh_tree(object_mesh):
+    mesh = object_mesh.data
+    mesh.calc_loop_triangles()
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", vertices)
+    triangles = numpy.empty(len(mesh.loop_triangles) * 3, dtype=numpy.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    matrix = numpy.array(object_mesh.matrix_world, dtype=numpy.float64)
+    vertices = vertices.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    return BVHTree.FromPolygons(vertices.tolist(), triangles.reshape(-1, 3).tolist())
 
-        # this is workaround for the issue that gltf 2.0 does not export correctly.
-        temp_file = os.path.join(bpy.app.tempdir, "temp.glb")
-        bpy.ops.export_scene.gltf(filepath=temp_file, use_selection=True)
+# get signed distances from vertices of object (sampled) to nearest surface of other object in world space (positive is outside)
+def get_surface_deviations(object_from, object_to, sample_count=DEVIATION_SAMPLE_COUNT):
+    tree = create_world_bvh_tree(object_to)
+    mesh = object_from.data
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float64)
+    mesh.vertices.foreach_get("co", vertices)
+    vertices = vertices.reshape(-1, 3)[::max(1, len(mesh.vertices) // sample_count)]
+    matrix = numpy.array(object_from.matrix_world, dtype=numpy.float64)
+    vertices = vertices @ matrix[:3, :3].T + matrix[:3, 3]
 
-class HOLOLAB_OT_SaveBakedTexture(bpy.types.Operator):
-    bl_idname = "hololab.save_baked_texture"
-    bl_label = "Save Baked Texture"
-    bl_description = "Save baked texture to PNG file for export the model as FBX file."
-    bl_options = {'REGISTER', 'UNDO'}
+    deviations = numpy.zeros(len(vertices), dtype=numpy.float64)
+    for index, vertex in enumerate(vertices.tolist()):
+        location, normal, _, distance = tree.find_nearest(vertex)
+        if location is None:
+            continue
+        offset = (vertex[0] - location[0]) * normal[0] + (vertex[1] - location[1]) * normal[1] + (vertex[2] - location[2]) * normal[2]
+        deviations[index] = distance if offset >= 0.0 else -distance
+    return deviations
 
-    directory: bpy.props.StringProperty(
-        name="directory_path",
-        default="",
-        maxlen=1024,
-        subtype='DIR_PATH',
-        description="",
-    )
+# create cage object by moving vertices of target object along vertex normals
+def create_cage_object(object_target, extrusion):
+    mesh = object_target.data.copy()
+    mesh.name = f"{object_target.name}_cage"
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", vertices)
+    normals = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("normal", normals)
 
-    filter_folder: bpy.props.BoolProperty(
-        default=True,
-        options={'HIDDEN'},
-    )
+    # extrusion is in world space (vertex normals are in object space)
+    scale = max(abs(value) for value in object_target.matrix_world.to_scale()) or 1.0
+    mesh.vertices.foreach_set("co", vertices + normals * (extrusion / scale))
+    mesh.update()
 
-    def invoke(self, context, event):
-        context.window_manager.fileselect_add(self)
-        return {'RUNNING_MODAL'}
+    object_cage = bpy.data.objects.new(mesh.name, mesh)
+    object_cage.matrix_world = object_target.matrix_world
+    bpy.context.scene.collection.objects.link(object_cage)
+    object_cage.hide_render = True
+    return object_cage
 
-    def execute(self, context):
-        self.report({'INFO'}, "execute save baked texture function")
+# iterate texels covered by uv triangles of mesh in chunks (triangle indices, texel rows, texel columns and barycentric coordinates)
+def iterate_uv_texels(mesh, resolution, chunk_pixels=1 << 22):
+    if mesh.uv_layers.active is None:
+        return
 
-        previous_language = bpy.context.preferences.view.language
-        bpy.context.preferences.view.language = 'en_US'
+    mesh.calc_loop_triangles()
+    loops = numpy.empty(len(mesh.loop_triangles) * 3, dtype=numpy.int32)
+    mesh.loop_triangles.foreach_get("loops", loops)
+    uvs = numpy.empty(len(mesh.loops) * 2, dtype=numpy.float32)
+    mesh.uv_layers.active.data.foreach_get("uv", uvs)
 
-        try:
-            self.save_texture()
-        except Exception as e:
-            self.report({'ERROR'}, f"{e}")
-            return {'CANCELLED'}
-        finally:
-            bpy.context.preferences.view.language = previous_language
+    # triangle corners in pixel coordinates (pixel centers are integer)
+    corners = uvs.reshape(-1, 2)[loops].reshape(-1, 3, 2) * resolution - 0.5
+    yield from iterate_triangle_texels(corners, resolution, chunk_pixels)
 
-        return {'FINISHED'}
+# iterate texels covered by triangles (n x 3 x 2 corners in pixel coordinates) in chunks
+def iterate_triangle_texels(corners, resolution, chunk_pixels=1 << 22):
+    minimums = numpy.clip(numpy.ceil(corners.min(axis=1)), 0, resolution - 1).astype(numpy.int64)
+    maximums = numpy.clip(numpy.floor(corners.max(axis=1)), 0, resolution - 1).astype(numpy.int64)
+    sizes = numpy.maximum(maximums - minimums + 1, 1)
+    order = numpy.argsort(sizes[:, 0] * sizes[:, 1])
 
-    # save texture
-    def save_texture(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    # rasterize triangles with similar bounding box size together
+    start = 0
+    while start < len(order):
+        count = max(1, chunk_pixels // int(sizes[order[start], 0] * sizes[order[start], 1]))
+        while True:
+            chunk = order[start:start + count]
+            width, height = sizes[chunk, 0].max(), sizes[chunk, 1].max()
+            if count == 1 or len(chunk) * width * height <= chunk_pixels:
+                break
+            count //= 2
+        start += len(chunk)
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        if object_target is None:
-            return
+        xs = (minimums[chunk, 0, None, None] + numpy.arange(width)[None, None, :]).astype(numpy.float32)
+        ys = (minimums[chunk, 1, None, None] + numpy.arange(height)[None, :, None]).astype(numpy.float32)
+        points = corners[chunk, :, :, None, None]
+        edges = []
+        for corner in range(3):
+            p, q = points[:, corner], points[:, (corner + 1) % 3]
+            edges.append((q[:, 0] - p[:, 0]) * (ys - p[:, 1]) - (q[:, 1] - p[:, 1]) * (xs - p[:, 0]))
+        areas = edges[0] + edges[1] + edges[2]
+        inside = ((edges[0] >= 0) & (edges[1] >= 0) & (edges[2] >= 0)) | ((edges[0] <= 0) & (edges[1] <= 0) & (edges[2] <= 0))
+        inside &= (areas != 0) & (xs <= maximums[chunk, 0, None, None]) & (ys <= maximums[chunk, 1, None, None])
+        indices, pixel_y, pixel_x = numpy.nonzero(inside)
 
-        # get baked texture name
-        texture_name = ""
-        for material in object_target.data.materials:
-            principled_bsdf = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-            if principled_bsdf.inputs['Base Color'].is_linked is False:
-                continue
-            texture_name = principled_bsdf.inputs['Base Color'].links[0].from_socket.node.image.name
-        if not texture_name:
-            return
+        # barycentric coordinates of corners (edge opposite to corner divided by area)
+        areas = areas[indices, pixel_y, pixel_x]
+        barycentrics = numpy.stack([edges[1][indices, pixel_y, pixel_x], edges[2][indices, pixel_y, pixel_x], edges[0][indices, pixel_y, pixel_x]], axis=1) / areas[:, None]
+        yield chunk[indices], minimums[chunk[indices], 1] + pixel_y, minimums[chunk[indices], 0] + pixel_x, barycentrics
 
-        # get baked texture
-        texture = bpy.data.images[texture_name]
-        if texture is None:
-            return
+# rasterize uv triangles of mesh into coverage mask (resolution x resolution, bottom row first)
+def rasterize_uv_coverage(mesh, resolution):
+    coverage = numpy.zeros((resolution, resolution), dtype=bool)
+    for _, pixel_y, pixel_x, _ in iterate_uv_texels(mesh, resolution):
+        coverage[pixel_y, pixel_x] = True
+    return coverage
 
-        # save baked texture
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.type = 'IMAGE_EDITOR'
-                for space in area.spaces:
-                    if space.type != 'IMAGE_EDITOR':
-                        continue
-                    space.image = texture
-                    filepath = os.path.join(self.directory, f"{texture_name}.png")
-                    self.report({'INFO'}, f"{filepath}")
-                    bpy.ops.image.save_as(filepath=filepath, relative_path=True)
-                    break
-                area.type = 'VIEW_3D'
+# get uv island of each triangle (triangles that share vertex with same uv coordinates are in same island)
+def get_uv_island_labels(triangles, uv_corners):
+    keys = numpy.concatenate([triangles.reshape(-1, 1).astype(numpy.int64), numpy.round(uv_corners.reshape(-1, 2) * (1 << 20)).astype(numpy.int64)], axis=1)
+    _, key_indices = numpy.unique(keys, axis=0, return_inverse=True)
+    labels = get_pair_representatives(len(triangles) + int(key_indices.max(initial=-1)) + 1, numpy.repeat(numpy.arange(len(triangles)), 3), len(triangles) + key_indices.reshape(-1))
+    return labels[:len(triangles)]
 
-class HOLOLAB_OT_DeleteOriginal(bpy.types.Operator):
-    bl_idname = "hololab.delete_original"
-    bl_label = "Delete Original"
-    bl_description = "Delete unnecessary original object and tetextures from project for export the model as USDZ file."
-    bl_options = {'REGISTER', 'UNDO'}
+# get barycentric coordinates of points in triangles (n x 3 x 3 corners)
+def get_barycentrics(corners, points):
+    v0 = corners[:, 1] - corners[:, 0]
+    v1 = corners[:, 2] - corners[:, 0]
+    v2 = points - corners[:, 0]
+    d00 = (v0 * v0).sum(axis=1)
+    d01 = (v0 * v1).sum(axis=1)
+    d11 = (v1 * v1).sum(axis=1)
+    d20 = (v2 * v0).sum(axis=1)
+    d21 = (v2 * v1).sum(axis=1)
+    denominator = d00 * d11 - d01 * d01
+    denominator = numpy.where(denominator == 0.0, 1.0, denominator)
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+    barycentrics = numpy.clip(numpy.stack([1.0 - v - w, v, w], axis=1), 0.0, 1.0)
+    return barycentrics / numpy.maximum(barycentrics.sum(axis=1, keepdims=True), 1e-12)
 
-    def execute(self, context):
-        self.report({'INFO'}, "execute delete Original object and texture function")
+# sample pixels (height x width x 4) bilinearly at uv coordinates (uv is repeated)
+def sample_pixels(pixels, uvs):
+    height, width = pixels.shape[:2]
+    x = uvs[:, 0] * width - 0.5
+    y = uvs[:, 1] * height - 0.5
+    x0 = numpy.floor(x)
+    y0 = numpy.floor(y)
+    fx = (x - x0)[:, None]
+    fy = (y - y0)[:, None]
+    x0 = x0.astype(numpy.int64) % width
+    y0 = y0.astype(numpy.int64) % height
+    x1 = (x0 + 1) % width
+    y1 = (y0 + 1) % height
+    return (pixels[y0, x0] * (1.0 - fx) * (1.0 - fy) + pixels[y0, x1] * fx * (1.0 - fy) +
+            pixels[y1, x0] * (1.0 - fx) * fy + pixels[y1, x1] * fx * fy)
 
-        previous_language = bpy.context.preferences.view.language
-        bpy.context.preferences.view.language = 'en_US'
+# get source of base color of material ('IMAGE' with image, 'COLOR' for color attribute, or 'VALUE' with linear color)
+def get_base_color_source(material):
+    principled_bsdf = get_principled_bsdf(material)
+    if principled_bsdf is None:
+        return 'VALUE', (0.8, 0.8, 0.8)
+    socket = principled_bsdf.inputs['Base Color']
+    if not socket.is_linked:
+        return 'VALUE', tuple(socket.default_value[:3])
+    node = socket.links[0].from_node
+    if node.bl_idname == 'ShaderNodeTexImage' and node.image is not None:
+        return 'IMAGE', node.image
+    return 'COLOR', None
 
-        try:
-            self.delete_texture()
-            self.delete_object()
-        except Exception as e:
-            self.report({'ERROR'}, f"{e}")
-            return {'CANCELLED'}
-        finally:
-            bpy.context.preferences.view.language = previous_language
+# transfer base color of source object to texels of target uv layout through nearest source surface points (no render engine)
+def transfer_base_color(object_source, object_target, resolution):
+    # sample evaluated source mesh (with modifiers) like cycles bake
+    object_evaluated = object_source.evaluated_get(bpy.context.evaluated_depsgraph_get())
+    source_mesh = object_evaluated.to_mesh()
+    try:
+        return transfer_mesh_base_color(source_mesh, object_source.matrix_world, object_target, resolution)
+    finally:
+        object_evaluated.to_mesh_clear()
 
-        return {'FINISHED'}
+# transfer base color of source mesh to texels of target uv layout
+def transfer_mesh_base_color(source_mesh, matrix_world, object_target, resolution):
+    # source triangles in world space
+    source_mesh.calc_loop_triangles()
+    triangle_count = len(source_mesh.loop_triangles)
+    source_loops = numpy.empty(triangle_count * 3, dtype=numpy.int32)
+    source_mesh.loop_triangles.foreach_get("loops", source_loops)
+    source_loops = source_loops.reshape(-1, 3)
+    source_triangles = numpy.empty(triangle_count * 3, dtype=numpy.int32)
+    source_mesh.loop_triangles.foreach_get("vertices", source_triangles)
+    source_triangles = source_triangles.reshape(-1, 3)
+    material_indices = numpy.empty(triangle_count, dtype=numpy.int32)
+    source_mesh.loop_triangles.foreach_get("material_index", material_indices)
+    source_vertices = numpy.empty(len(source_mesh.vertices) * 3, dtype=numpy.float64)
+    source_mesh.vertices.foreach_get("co", source_vertices)
+    matrix = numpy.array(matrix_world, dtype=numpy.float64)
+    source_vertices = source_vertices.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    source_corners = source_vertices[source_triangles]
+    tree = BVHTree.FromPolygons(source_vertices.tolist(), source_triangles.tolist())
 
-    # delete texture
-    def delete_texture(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    # source uv coordinates and color attribute (linear color of each loop)
+    source_uvs = None
+    if source_mesh.uv_layers.active is not None:
+        source_uvs = numpy.empty(len(source_mesh.loops) * 2, dtype=numpy.float32)
+        source_mesh.uv_layers.active.data.foreach_get("uv", source_uvs)
+        source_uvs = source_uvs.reshape(-1, 2)
+    source_colors = None
+    color_attribute = source_mesh.color_attributes.active_color if hasattr(source_mesh, "color_attributes") else None
+    if color_attribute is not None and color_attribute.domain in ['POINT', 'CORNER']:
+        source_colors = numpy.empty(len(color_attribute.data) * 4, dtype=numpy.float32)
+        color_attribute.data.foreach_get("color", source_colors)
+        source_colors = source_colors.reshape(-1, 4)
+        if color_attribute.domain == 'POINT':
+            loop_vertices = numpy.empty(len(source_mesh.loops), dtype=numpy.int32)
+            source_mesh.loops.foreach_get("vertex_index", loop_vertices)
+            source_colors = source_colors[loop_vertices]
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_target = bpy.data.objects.get("Result")
-        if object_target is None:
-            return
+    # base color source of each material (pixels of images are srgb)
+    sources = [get_base_color_source(material) for material in source_mesh.materials] or [('VALUE', (0.8, 0.8, 0.8))]
+    source_pixels = {}
+    for index, (kind, value) in enumerate(sources):
+        if kind == 'IMAGE':
+            source_pixels[index] = image_to_array(value)
+            if value.is_float:
+                linear_to_srgb(source_pixels[index])
 
-        # get baked texture name
-        texture_name = ""
-        for material in object_target.data.materials:
-            principled_bsdf = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
-            if principled_bsdf.inputs['Base Color'].is_linked is False:
+    # interpolate uv or color of source triangles at barycentric coordinates and sample base color
+    def sample_colors(triangles, weights):
+        materials = numpy.minimum(material_indices[triangles], len(sources) - 1)
+        colors = numpy.ones((len(triangles), 4), dtype=numpy.float32)
+        for material_index, (kind, value) in enumerate(sources):
+            mask = materials == material_index
+            if not mask.any():
                 continue
-            texture_name = principled_bsdf.inputs['Base Color'].links[0].from_socket.node.image.name
-        if not texture_name:
-            return
+            loops = source_loops[triangles[mask]]
+            if kind == 'IMAGE' and source_uvs is not None:
+                uvs = numpy.einsum('ni,nij->nj', weights[mask], source_uvs[loops])
+                colors[mask, :3] = sample_pixels(source_pixels[material_index], uvs)[:, :3]
+            elif kind == 'COLOR' and source_colors is not None:
+                colors[mask] = linear_to_srgb(numpy.einsum('ni,nij->nj', weights[mask], source_colors[loops]))
+                colors[mask, 3] = 1.0
+            else:
+                color = numpy.array([*(value if kind == 'VALUE' else (0.8, 0.8, 0.8)), 1.0], dtype=numpy.float32)
+                colors[mask] = linear_to_srgb(color[None, :])
+        return colors
 
-        # delete all textures without specified texture
-        images = [image for image in bpy.data.images if image.name != texture_name]
-        for image in images:
-            bpy.data.images.remove(image=image)
+    # target triangles in world space and their uv coordinates
+    target_mesh = object_target.data
+    target_mesh.calc_loop_triangles()
+    target_triangles = numpy.empty(len(target_mesh.loop_triangles) * 3, dtype=numpy.int32)
+    target_mesh.loop_triangles.foreach_get("vertices", target_triangles)
+    target_triangles = target_triangles.reshape(-1, 3)
+    target_loops = numpy.empty(len(target_mesh.loop_triangles) * 3, dtype=numpy.int32)
+    target_mesh.loop_triangles.foreach_get("loops", target_loops)
+    target_uvs = numpy.empty(len(target_mesh.loops) * 2, dtype=numpy.float32)
+    target_mesh.uv_layers.active.data.foreach_get("uv", target_uvs)
+    target_uv_corners = target_uvs.reshape(-1, 2)[target_loops].reshape(-1, 3, 2)
+    target_vertices = numpy.empty(len(target_mesh.vertices) * 3, dtype=numpy.float64)
+    target_mesh.vertices.foreach_get("co", target_vertices)
+    matrix = numpy.array(object_target.matrix_world, dtype=numpy.float64)
+    target_vertices = target_vertices.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    target_corners = target_vertices[target_triangles]
 
-    # delete object
-    def delete_object(self):
-        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+    pixels = numpy.zeros((resolution, resolution, 4), dtype=numpy.float32)
+    coverage = rasterize_uv_coverage(target_mesh, resolution)
 
-        # select target object
-        bpy.ops.object.select_all(action='DESELECT')
-        object_source = bpy.data.objects.get("Original")
-        if object_source is None:
-            return
+    # rasterize source triangles into target uv layout through nearest target surface points of source vertices
+    # (bvh is queried per source vertex instead of per texel, when source has less vertices than texels)
+    if triangle_count > 0 and len(source_vertices) < int(coverage.sum()):
+        target_tree = BVHTree.FromPolygons(target_vertices.tolist(), target_triangles.tolist())
+        vertex_triangles = numpy.full(len(source_vertices), -1, dtype=numpy.int64)
+        vertex_locations = numpy.zeros((len(source_vertices), 3), dtype=numpy.float64)
+        vertex_distances = numpy.zeros(len(source_vertices), dtype=numpy.float32)
+        find_nearest = target_tree.find_nearest
+        for index, position in enumerate(source_vertices.tolist()):
+            location, _, triangle, distance = find_nearest(position)
+            if location is not None:
+                vertex_triangles[index] = triangle
+                vertex_locations[index] = location
+                vertex_distances[index] = distance
+        hit = vertex_triangles >= 0
+        vertex_uvs = numpy.zeros((len(source_vertices), 2), dtype=numpy.float64)
+        vertex_uvs[hit] = numpy.einsum('ni,nij->nj', get_barycentrics(target_corners[vertex_triangles[hit]], vertex_locations[hit]), target_uv_corners[vertex_triangles[hit]])
 
-        # delete object
-        with bpy.context.temp_override(selected_objects=[object_source]):
-            bpy.ops.object.delete()
+        # source triangles that cross uv seams of target are left to nearest search of texels
+        islands = numpy.full(len(source_vertices), -1, dtype=numpy.int64)
+        islands[hit] = get_uv_island_labels(target_triangles, target_uv_corners)[vertex_triangles[hit]]
+        source_triangle_islands = islands[source_triangles]
+        rasterized = numpy.nonzero((source_triangle_islands >= 0).all(axis=1) & (source_triangle_islands == source_triangle_islands[:, :1]).all(axis=1))[0]
 
-class HOLOLAB_PT_SideBar(bpy.types.Panel):
-    bl_idname = "HOLOLAB_PT_SideBar"
-    bl_label = "HoloLab"
-    bl_space_type = "VIEW_3D"
-    bl_region_type = "UI"
-    bl_category = "HoloLab"
+        # nearest source surface (interpolated distance to target) wins where source triangles overlap
+        depths = numpy.full((resolution, resolution), numpy.inf, dtype=numpy.float32)
+        corners = vertex_uvs[source_triangles[rasterized]] * resolution - 0.5
+        for triangles, pixel_y, pixel_x, barycentrics in iterate_triangle_texels(corners, resolution, 1 << 20):
+            inside = coverage[pixel_y, pixel_x]
+            if not inside.any():
+                continue
+            triangles, pixel_y, pixel_x, barycentrics = rasterized[triangles[inside]], pixel_y[inside], pixel_x[inside], barycentrics[inside]
+            texel_depths = (barycentrics * vertex_distances[source_triangles[triangles]]).sum(axis=1)
+            texels = pixel_y * resolution + pixel_x
+            order = numpy.lexsort((texel_depths, texels))
+            first = order[numpy.r_[True, texels[order][1:] != texels[order][:-1]]]
+            nearer = texel_depths[first] < depths[pixel_y[first], pixel_x[first]]
+            first = first[nearer]
+            depths[pixel_y[first], pixel_x[first]] = texel_depths[first]
+            pixels[pixel_y[first], pixel_x[first]] = sample_colors(triangles[first], barycentrics[first])
 
-    def draw_header(self, context):
+    # nearest source surface points of remaining texels in bvh tree
+    find_nearest = tree.find_nearest
+    for triangles, pixel_y, pixel_x, barycentrics in iterate_uv_texels(target_mesh, resolution, 1 << 20):
+        remaining = pixels[pixel_y, pixel_x, 3] == 0.0
+        triangles, pixel_y, pixel_x, barycentrics = triangles[remaining], pixel_y[remaining], pixel_x[remaining], barycentrics[remaining]
+        positions = numpy.einsum('ni,nij->nj', barycentrics, target_corners[triangles])
+        nearest_triangles = numpy.full(len(positions), -1, dtype=numpy.int64)
+        locations = numpy.zeros((len(positions), 3), dtype=numpy.float64)
+        for index, position in enumerate(positions.tolist()):
+            location, _, triangle, _ = find_nearest(position)
+            if location is not None:
+                nearest_triangles[index] = triangle
+                locations[index] = location
+        hit = nearest_triangles >= 0
+        nearest_triangles = nearest_triangles[hit]
+        weights = get_barycentrics(source_corners[nearest_triangles], locations[hit])
+        pixels[pixel_y[hit], pixel_x[hit]] = sample_colors(nearest_triangles, weights)
+    return pixels
+
+# get mean, max and rms of distances between surfaces of original and result objects in both directions
+def get_deviation_metrics(object_source, object_target):
+    distances = numpy.abs(numpy.concatenate([get_surface_deviations(object_source, object_target), get_surface_deviations(object_target, object_source)]))
+    if len(distances) == 0:
+        return {"deviation_mean": 0.0, "deviation_max": 0.0, "deviation_rms": 0.0, "deviation_relative_max": 0.0}
+    diagonal = max(object_source.dimensions.length, 1e-12)
+    return {
+        "deviation_mean": float(distances.mean()),
+        "deviation_max": float(distances.max()),
+        "deviation_rms": float(numpy.sqrt((distances ** 2).mean())),
+        "deviation_relative_max": float(distances.max() / diagonal),
+    }
+
+# average values in size x size windows (only windows inside of array)
+def box_filter(values, size):
+    sums = numpy.pad(values, ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+    return (sums[size:, size:] - sums[:-size, size:] - sums[size:, :-size] + sums[:-size, :-size]) / (size * size)
+
+# get peak signal to noise ratio of rgb pixels (mask selects compared pixels)
+def compute_psnr(pixels_a, pixels_b, mask):
+    if not mask.any():
+        return float("inf")
+    mse = float(((pixels_a[..., :3] - pixels_b[..., :3]) ** 2)[mask].mean())
+    return float("inf") if mse == 0.0 else 10.0 * math.log10(1.0 / mse)
+
+# get mean structural similarity of luminance of pixels (8 x 8 windows that overlap mask)
+def compute_ssim(pixels_a, pixels_b, mask, size=8):
+    if not mask.any():
+        return 1.0
+    luminance = numpy.array([0.2126, 0.7152, 0.0722])
+    a = pixels_a[..., :3].astype(numpy.float64) @ luminance
+    b = pixels_b[..., :3].astype(numpy.float64) @ luminance
+    c1, c2 = 0.01 ** 2, 0.03 ** 2
+    mean_a, mean_b = box_filter(a, size), box_filter(b, size)
+    variance_a = box_filter(a * a, size) - mean_a ** 2
+    variance_b = box_filter(b * b, size) - mean_b ** 2
+    covariance = box_filter(a * b, size) - mean_a * mean_b
+    ssim = ((2 * mean_a * mean_b + c1) * (2 * covariance + c2)) / ((mean_a ** 2 + mean_b ** 2 + c1) * (variance_a + variance_b + c2))
+    return float(ssim[box_filter(mask.astype(numpy.float64), size) > 0.0].mean())
+
+# render scene camera to png file and load pixels (render result has no pixels in background mode)
+def render_view_pixels(filepath):
+    bpy.context.scene.render.filepath = filepath
+    bpy.ops.render.render(write_still=True)
+    image = bpy.data.images.load(filepath)
+    try:
+        return image_to_array(image).copy()
+    finally:
+        bpy.data.images.remove(image)
+        os.remove(filepath)
+
+# get vertex, face and triangle counts of mesh object
+def get_mesh_counts(object_mesh):
+    if object_mesh is None or object_mesh.type != 'MESH':
+        return None, None, None
+    mesh = object_mesh.data
+    return len(mesh.vertices), len(mesh.polygons), len(mesh.loops) - len(mesh.polygons) * 2
+
+# profiler that records wall time, cpu time, peak memory and mesh counts of each stage
+class StageProfiler:
+    def __init__(self, profile_stage="NONE"):
+        self.profile_stage = profile_stage
+        self.records = []
+        self.profiles = {}
+        self.metrics = {}
+        self.start_time = time.perf_counter()
+
+    # run stage function of job and record it
+    def run(self, job, stage_function):
+        stage = stage_function.__name__
+        self.metrics[job.object_source.name] = job.metrics
+        vertices_before, faces_before, triangles_before = get_mesh_counts(job.object_target)
+        wall_time = time.perf_counter()
+        cpu_time = time.process_time()
+        try:
+            if stage == self.profile_stage:
+                profile = self.profiles.setdefault(stage, cProfile.Profile())
+                return profile.runcall(stage_function, job)
+            return stage_function(job)
+        finally:
+            vertices_after, faces_after, triangles_after = get_mesh_counts(job.object_target)
+            self.records.append({
+                "object": job.object_source.name,
+                "stage": stage,
+                "wall_time": time.perf_counter() - wall_time,
+                "cpu_time": time.process_time() - cpu_time,
+                "peak_memory": get_peak_memory(),
+                "memory": get_current_memory(),
+                "vertices_before": vertices_before,
+                "faces_before": faces_before,
+                "triangles_before": triangles_before,
+                "vertices_after": vertices_after,
+                "faces_after": faces_after,
+                "triangles_after": triangles_after,
+            })
+
+    # write json and csv report (and cprofile statistics) into directory
+    def write_report(self, directory, settings):
+        os.makedirs(directory, exist_ok=True)
+        timestamp = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        filepaths = []
+
+        filepath = os.path.join(directory, f"report_{timestamp}.json")
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump({
+                "blender_version": bpy.app.version_string,
+                "settings": settings,
+                "elapsed": time.perf_counter() - self.start_time,
+                "peak_memory": get_peak_memory(),
+                "final_memory": get_current_memory(),
+                "stages": self.records,
+                "metrics": self.metrics,
+            }, f, indent=2)
+        filepaths.append(filepath)
+
+        filepath = os.path.join(directory, f"report_{timestamp}.csv")
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(self.records[0].keys()) if self.records else ["object", "stage"])
+            writer.writeheader()
+            writer.writerows(self.records)
+        filepaths.append(filepath)
+
+        for stage, profile in self.profiles.items():
+            filepath = os.path.join(directory, f"profile_{stage}_{timestamp}.prof")
+            profile.dump_stats(filepath)
+            filepaths.append(filepath)
+
+        return filepaths
+
+# hash pixels of image
+def hash_image_pixels(hasher, image):
+    pixels = image_to_array(image)
+    hasher.update(f"{image.size[0]}x{image.size[1]}:{image.colorspace_settings.name}".encode())
+    hasher.update(pixels.tobytes())
+
+# hash nodes, input values, links and image pixels of node tree
+def hash_node_tree(hasher, node_tree):
+    for node in sorted(node_tree.nodes, key=lambda n: n.name):
+        hasher.update(f"{node.name}:{node.bl_idname}".encode())
+        for socket in node.inputs:
+            value = getattr(socket, "default_value", None)
+            hasher.update(repr(tuple(value) if hasattr(value, "__len__") and not isinstance(value, str) else value).encode())
+        if getattr(node, "image", None) is not None:
+            hash_image_pixels(hasher, node.image)
+        if node.bl_idname == 'ShaderNodeGroup' and node.node_tree is not None:
+            hash_node_tree(hasher, node.node_tree)
+    links = [f"{l.from_node.name}.{l.from_socket.identifier}>{l.to_node.name}.{l.to_socket.identifier}" for l in node_tree.links]
+    hasher.update("|".join(sorted(links)).encode())
+
+# convert rna or id property value into value with stable repr (ids are named, arrays are tuples)
+def get_hashable_value(value):
+    if isinstance(value, bpy.types.ID):
+        return f"{type(value).__name__}:{value.name}"
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    if hasattr(value, "to_dict"):
+        return repr(sorted(value.to_dict().items()))
+    if hasattr(value, "to_list"):
+        return tuple(value.to_list())
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(get_hashable_value(item) for item in value)
+    return value
+
+# hash values of all rna properties of struct (collections and nested structs are skipped)
+def hash_rna_properties(hasher, struct):
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.type == 'COLLECTION':
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == 'POINTER' and not isinstance(value, bpy.types.ID):
+            continue
+        hasher.update(f"{prop.identifier}={get_hashable_value(value)!r}".encode())
+
+# compute cache key from source mesh data, referenced image pixels and settings
+def compute_cache_key(object_source, settings):
+    hasher = hashlib.sha256()
+    hasher.update(bpy.app.version_string.encode())
+    hasher.update(json.dumps(settings, sort_keys=True).encode())
+
+    # object transform and modifiers (all parameters, node groups and inputs of geometry nodes)
+    hasher.update(numpy.array(object_source.matrix_world, dtype=numpy.float32).tobytes())
+    for modifier in object_source.modifiers:
+        hash_rna_properties(hasher, modifier)
+        hasher.update(repr([(key, get_hashable_value(modifier[key])) for key in sorted(modifier.keys())]).encode())
+        if getattr(modifier, "node_group", None) is not None:
+            hash_node_tree(hasher, modifier.node_group)
+
+    # mesh data
+    mesh = object_source.data
+    for collection, attribute, size, dtype in [
+        (mesh.vertices, "co", 3, numpy.float32),
+        (mesh.loops, "vertex_index", 1, numpy.int32),
+        (mesh.polygons, "loop_start", 1, numpy.int32),
+        (mesh.polygons, "material_index", 1, numpy.int32),
+        (mesh.polygons, "use_smooth", 1, bool),
+        (mesh.edges, "vertices", 2, numpy.int32),
+        (mesh.edges, "use_edge_sharp", 1, bool),
+    ]:
+        values = numpy.empty(len(collection) * size, dtype=dtype)
+        collection.foreach_get(attribute, values)
+        hasher.update(values.tobytes())
+    for uv_layer in mesh.uv_layers:
+        values = numpy.empty(len(uv_layer.data) * 2, dtype=numpy.float32)
+        uv_layer.data.foreach_get("uv", values)
+        hasher.update(values.tobytes())
+
+    # color attributes (fast transfer and color attribute nodes read them)
+    color_attributes = mesh.color_attributes if hasattr(mesh, "color_attributes") else []
+    for color_attribute in color_attributes:
+        hasher.update(f"{color_attribute.name}:{color_attribute.domain}:{color_attribute.data_type}".encode())
+        values = numpy.empty(len(color_attribute.data) * 4, dtype=numpy.float32)
+        color_attribute.data.foreach_get("color", values)
+        hasher.update(values.tobytes())
+    if color_attributes and color_attributes.active_color is not None:
+        hasher.update(color_attributes.active_color.name.encode())
+
+    # auto smooth and custom split normals (they change normal bake)
+    if bpy.app.version < (4, 1, 0):
+        hasher.update(repr((mesh.use_auto_smooth, round(mesh.auto_smooth_angle, 6))).encode())
+    if mesh.has_custom_normals:
+        if bpy.app.version < (4, 1, 0):
+            mesh.calc_normals_split()
+        values = numpy.empty(len(mesh.loops) * 3, dtype=numpy.float32)
+        mesh.loops.foreach_get("normal", values)
+        hasher.update(values.tobytes())
+
+    # materials
+    for material in mesh.materials:
+        hasher.update(material.name.encode() if material is not None else b"None")
+        if material is not None and material.node_tree is not None:
+            hash_node_tree(hasher, material.node_tree)
+
+    return hasher.hexdigest()
+
+# get objects, meshes, materials and images (data blocks that runs create)
+def get_data_blocks():
+    return list(bpy.data.objects) + list(bpy.data.meshes) + list(bpy.data.materials) + list(bpy.data.images)
+
+# get session ids of data blocks (ids are not reused after removal of data blocks unlike names)
+def get_data_block_ids():
+    return set(data_block.session_uid for data_block in get_data_blocks())
+
+# get principled bsdf node of material
+def get_principled_bsdf(material):
+    if material is None or material.node_tree is None:
+        return None
+    principled_bsdfs = [node for node in material.node_tree.nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled']
+    return principled_bsdfs[0] if principled_bsdfs else None
+
+# get name of emission color input of principled bsdf
+def get_emission_input_name():
+    return "Emission Color" if bpy.app.version >= (4, 0, 0) else "Emission"
+
+# store links and values of principled bsdf inputs of source materials
+def store_principled_inputs(object_source, input_names):
+    stored_inputs = []
+    for material in object_source.data.materials:
+        principled_bsdf = get_principled_bsdf(material)
+        if principled_bsdf is None:
+            continue
+        for input_name in input_names:
+            if not (input_name in principled_bsdf.inputs.keys()):
+                continue
+            socket = principled_bsdf.inputs[input_name]
+            from_socket = socket.links[0].from_socket if socket.is_linked else None
+            default_value = socket.default_value
+            if hasattr(default_value, "__len__"):
+                default_value = tuple(default_value)
+            stored_inputs.append((material, principled_bsdf, input_name, from_socket, default_value))
+    return stored_inputs
+
+# restore links and values of principled bsdf inputs of source materials
+def restore_principled_inputs(stored_inputs):
+    for material, principled_bsdf, input_name, from_socket, default_value in stored_inputs:
+        socket = principled_bsdf.inputs[input_name]
+        for link in list(socket.links):
+            material.node_tree.links.remove(link)
+        if from_socket is not None:
+            material.node_tree.links.new(from_socket, socket)
+        socket.default_value = default_value
+
+# store render settings of scene
+def store_render_settings(scene):
+    stored_settings = []
+    for path, names in RENDER_SETTINGS:
+        owner = scene.path_resolve(path)
+        for name in names:
+            if hasattr(owner, name):
+                stored_settings.append((owner, name, getattr(owner, name)))
+    return stored_settings
+
+# restore render settings of scene
+def restore_render_settings(stored_settings):
+    for owner, name, value in stored_settings:
+        setattr(owner, name, value)
+
+# get cycles device (use gpu if it is configured in preferences)
+def get_cycles_device():
+    addon = bpy.context.preferences.addons.get("cycles")
+    if addon is None or addon.preferences.compute_device_type == 'NONE':
+        return 'CPU'
+    return 'GPU' if addon.preferences.has_active_device() else 'CPU'
+
+# get peak memory usage (resident set size) of this process in bytes
+def get_peak_memory():
+    if resource is None:
+        return 0
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+# get current resident memory of process in bytes (0 if it is not available)
+def get_current_memory():
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+# copy pixels of image into float32 array (height x width x 4, bottom row first) without python list
+def image_to_array(image, pixels=None):
+    width, height = image.size
+    if pixels is None:
+        pixels = numpy.empty((height, width, 4), dtype=numpy.float32)
+    image.pixels.foreach_get(pixels.reshape(-1))
+    return pixels.reshape(height, width, 4)
+
+# copy float32 array (height x width x 4, bottom row first) into pixels of image
+def array_to_image(image, pixels):
+    height, width = pixels.shape[:2]
+    if tuple(image.size) != (width, height):
+        image.scale(width, height)
+    image.pixels.foreach_set(numpy.ascontiguousarray(pixels, dtype=numpy.float32).reshape(-1))
+    image.update()
+
+# sum pixels of each 2x2 block (odd size is padded with zero)
+def reduce_pixels(pixels):
+    height, width = pixels.shape[:2]
+    pixels = numpy.pad(pixels, [(0, height % 2), (0, width % 2)] + [(0, 0)] * (pixels.ndim - 2))
+    return pixels.reshape(pixels.shape[0] // 2, 2, pixels.shape[1] // 2, 2, *pixels.shape[2:]).sum(axis=(1, 3))
+
+# fill texels that are not baked (alpha is 0) with colors of nearby baked texels by push-pull pyramid, and strip alpha
+def pad_pixels(pixels):
+    coverage = pixels[..., 3] > 0.0
+    if coverage.any() and not coverage.all():
+        colors = [numpy.where(coverage[..., None], pixels[..., :3], 0.0).astype(numpy.float32)]
+        weights = [coverage.astype(numpy.float32)]
+        while max(weights[-1].shape) > 1:
+            colors.append(reduce_pixels(colors[-1]))
+            weights.append(reduce_pixels(weights[-1]))
+        fill = colors[-1] / weights[-1][..., None]
+        for color, weight in zip(reversed(colors[:-1]), reversed(weights[:-1])):
+            height, width = weight.shape
+            upsampled = fill.repeat(2, axis=0).repeat(2, axis=1)[:height, :width]
+            fill = numpy.where(weight[..., None] > 0.0, color / numpy.maximum(weight, 1e-8)[..., None], upsampled)
+        pixels[..., :3] = fill
+    pixels[..., 3] = 1.0
+    return pixels
+
+# downsample pixels by averaging factor x factor blocks
+def downsample_box(pixels, factor):
+    height, width = max(pixels.shape[0] // factor, 1), max(pixels.shape[1] // factor, 1)
+    factor_y, factor_x = pixels.shape[0] // height, pixels.shape[1] // width
+    pixels = pixels[:height * factor_y, :width * factor_x]
+    return pixels.reshape(height, factor_y, width, factor_x, -1).mean(axis=(1, 3), dtype=numpy.float32)
+
+# get source indices and weights of lanczos filter for each target pixel
+def get_lanczos_weights(source_size, target_size, lobes=3):
+    scale = source_size / target_size
+    support = lobes * scale
+    centers = (numpy.arange(target_size) + 0.5) * scale - 0.5
+    taps = int(numpy.ceil(support * 2)) + 1
+    indices = numpy.floor(centers - support).astype(numpy.int64)[:, None] + 1 + numpy.arange(taps)[None, :]
+    x = (indices - centers[:, None]) / scale
+    weights = numpy.where(numpy.abs(x) < lobes, numpy.sinc(x) * numpy.sinc(x / lobes), 0.0)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return numpy.clip(indices, 0, source_size - 1), weights.astype(numpy.float32)
+
+# downsample pixels with separable lanczos filter
+def downsample_lanczos(pixels, width, height, lobes=3):
+    rows, row_weights = get_lanczos_weights(pixels.shape[0], height, lobes)
+    columns, column_weights = get_lanczos_weights(pixels.shape[1], width, lobes)
+    pixels_rows = numpy.zeros((height,) + pixels.shape[1:], dtype=numpy.float32)
+    for tap in range(rows.shape[1]):
+        pixels_rows += pixels[rows[:, tap]] * row_weights[:, tap, None, None]
+    pixels_result = numpy.zeros((height, width) + pixels.shape[2:], dtype=numpy.float32)
+    for tap in range(columns.shape[1]):
+        pixels_result += pixels_rows[:, columns[:, tap]] * column_weights[None, :, tap, None]
+    return numpy.clip(pixels_result, 0.0, 1.0)
+
+# convert color channels between srgb and linear (filters average colors in linear space)
+def srgb_to_linear(pixels):
+    colors = pixels[..., :3]
+    pixels[..., :3] = numpy.where(colors <= 0.04045, colors / 12.92, ((colors + 0.055) / 1.055) ** 2.4)
+    return pixels
+
+def linear_to_srgb(pixels):
+    colors = numpy.clip(pixels[..., :3], 0.0, 1.0)
+    pixels[..., :3] = numpy.where(colors <= 0.0031308, colors * 12.92, 1.055 * colors ** (1.0 / 2.4) - 0.055)
+    return pixels
+
+# quantize float pixels to 8 bit
+def quantize_pixels(pixels):
+    return numpy.clip(pixels * 255.0 + 0.5, 0, 255).astype(numpy.uint8)
+
+# write rgba pixels (height x width x 4 uint8 array, bottom row first) to png file row block by row block
+def write_png(filepath, pixels, block_rows=256):
+    height, width = pixels.shape[:2]
+
+    def write_chunk(f, chunk_type, data):
+        f.write(struct.pack(">I", len(data)))
+        f.write(chunk_type)
+        f.write(data)
+        f.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xffffffff))
+
+    compressor = zlib.compressobj(6)
+    with open(filepath, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        write_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        for top in range(0, height, block_rows):
+            bottom = min(top + block_rows, height)
+            rows = pixels[height - bottom:height - top][::-1]
+            scanlines = numpy.zeros((rows.shape[0], width * 4 + 1), dtype=numpy.uint8)
+            scanlines[:, 1:] = rows.reshape(rows.shape[0], width * 4)
+            data = compressor.compress(scanlines.tobytes())
+            if data:
+                write_chunk(f, b"IDAT", data)
+        write_chunk(f, b"IDAT", compressor.flush())
+        write_chunk(f, b"IEND", b"")
+
+# get node group that is recognized as glTF material output by glTF exporter (used for occlusion)
+def get_gltf_material_output_group():
+    node_group = bpy.data.node_groups.get("glTF Material Output")
+    if node_group is None:
+        node_group = bpy.data.node_groups.new("glTF Material Output", 'ShaderNodeTree')
+        if bpy.app.version < (4, 0, 0):
+            node_group.inputs.new('NodeSocketFloat', "Occlusion")
+        else:
+            node_group.interface.new_socket(name="Occlusion", in_out='INPUT', socket_type='NodeSocketFloat')
+    return node_group
+
+# pack ambient occlusion, roughness and metallic into red, green and blue channel
+def pack_orm_image(image_orm, image_ao, image_roughness, image_metallic):
+    pixels = numpy.ones((image_orm.size[1], image_orm.size[0], 4), dtype=numpy.float32)
+    channel = None
+    for index, image in enumerate([image_ao, image_roughness, image_metallic]):
+        channel = image_to_array(image, channel)
+        pixels[..., index] = channel[..., 0]
+    array_to_image(image_orm, pixels)
+
+# remove doubles with bmesh without entering edit mode
+def remove_doubles_bmesh(object_target, threshold):
+    mesh = object_target.data
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=threshold)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+# remove doubles with edit mode operators
+def remove_doubles_operator(object_target, threshold):
+    bpy.ops.object.select_all(action='DESELECT')
+    object_target.select_set(True)
+    bpy.context.view_layer.objects.active = object_target
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.mesh.remove_doubles(threshold=threshold)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+# attribute value key and numpy type of attribute data types
+ATTRIBUTE_VALUE_TYPES = {
+    'FLOAT': ("value", numpy.float32),
+    'INT': ("value", numpy.int32),
+    'INT8': ("value", numpy.int32),
+    'BOOLEAN': ("value", bool),
+    'FLOAT_VECTOR': ("vector", numpy.float32),
+    'FLOAT2': ("vector", numpy.float32),
+    'INT32_2D': ("value", numpy.int32),
+    'FLOAT_COLOR': ("color", numpy.float32),
+    'BYTE_COLOR': ("color", numpy.float32),
+    'QUATERNION': ("value", numpy.float32),
+}
+
+# get values of attribute as numpy array (rows are elements)
+def get_attribute_values(attribute):
+    key, dtype = ATTRIBUTE_VALUE_TYPES[attribute.data_type]
+    count = len(attribute.data)
+    if count == 0:
+        return numpy.empty(0, dtype=dtype)
+    value = getattr(attribute.data[0], key)
+    components = len(value) if hasattr(value, "__len__") else 1
+    values = numpy.empty(count * components, dtype=dtype)
+    attribute.data.foreach_get(key, values)
+    return values.reshape(count, components)
+
+# offsets of cell and half of its 26 neighbour cells (each pair of neighbour cells is visited once)
+NEIGHBOUR_CELL_OFFSETS = [(0, 0, 0)] + [(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1) if (x, y, z) > (0, 0, 0)]
+
+# find pairs of vertices within threshold distance (candidates in same and neighbour grid cells are compared by real distance)
+def find_close_vertex_pairs(coordinates, threshold):
+    cells = numpy.floor(coordinates.astype(numpy.float64) / threshold).astype(numpy.int64)
+    cells -= cells.min(axis=0) - 1
+    dimensions = cells.max(axis=0) + 2
+
+    # cells are encoded into int64 keys (keys of far cells may collide, which only adds candidates)
+    def encode(cell_indices):
+        return (cell_indices[:, 0] * dimensions[1] + cell_indices[:, 1]) * dimensions[2] + cell_indices[:, 2]
+
+    keys = encode(cells)
+    order = numpy.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    vertex_indices = numpy.arange(len(coordinates))
+
+    pairs_first, pairs_second = [], []
+    for offset in NEIGHBOUR_CELL_OFFSETS:
+        neighbour_keys = encode(cells + numpy.array(offset, dtype=numpy.int64))
+        starts = numpy.searchsorted(sorted_keys, neighbour_keys, side='left')
+        counts = numpy.searchsorted(sorted_keys, neighbour_keys, side='right') - starts
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        first = numpy.repeat(vertex_indices, counts)
+        second = order[numpy.repeat(starts, counts) + numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts, counts)]
+        candidates = first < second if offset == (0, 0, 0) else first != second
+        first, second = first[candidates], second[candidates]
+        close = numpy.sum((coordinates[first].astype(numpy.float64) - coordinates[second]) ** 2, axis=1) <= threshold * threshold
+        pairs_first.append(first[close])
+        pairs_second.append(second[close])
+
+    if not pairs_first:
+        return numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64)
+    return numpy.concatenate(pairs_first), numpy.concatenate(pairs_second)
+
+# map each vertex to smallest vertex index of its connected pairs (union find by label propagation and pointer jumping)
+def get_pair_representatives(vertex_count, first, second):
+    labels = numpy.arange(vertex_count)
+    while True:
+        previous_labels = labels.copy()
+        minimum_labels = numpy.minimum(labels[first], labels[second])
+        numpy.minimum.at(labels, first, minimum_labels)
+        numpy.minimum.at(labels, second, minimum_labels)
+        while True:
+            jumped_labels = labels[labels]
+            if numpy.array_equal(jumped_labels, labels):
+                break
+            labels = jumped_labels
+        if numpy.array_equal(labels, previous_labels):
+            return labels
+
+# copy seams and edge attributes (sharp edges and creases) to edges of welded mesh that join same welded vertices
+def copy_welded_edge_attributes(mesh, welded_mesh, vertex_map):
+    if len(mesh.edges) == 0 or len(welded_mesh.edges) == 0:
+        return
+    edge_vertices = numpy.empty(len(mesh.edges) * 2, dtype=numpy.int32)
+    mesh.edges.foreach_get("vertices", edge_vertices)
+    edge_vertices = numpy.sort(vertex_map[edge_vertices].reshape(-1, 2), axis=1).astype(numpy.int64)
+    welded_edge_vertices = numpy.empty(len(welded_mesh.edges) * 2, dtype=numpy.int32)
+    welded_mesh.edges.foreach_get("vertices", welded_edge_vertices)
+    welded_edge_vertices = numpy.sort(welded_edge_vertices.reshape(-1, 2), axis=1).astype(numpy.int64)
+
+    # find source edge of each welded edge by key of its vertex pair
+    vertex_count = len(welded_mesh.vertices)
+    keys = edge_vertices[:, 0] * vertex_count + edge_vertices[:, 1]
+    welded_keys = welded_edge_vertices[:, 0] * vertex_count + welded_edge_vertices[:, 1]
+    order = numpy.argsort(keys, kind='stable')
+    positions = numpy.minimum(numpy.searchsorted(keys[order], welded_keys), len(keys) - 1)
+    source_edges = order[positions]
+    found = keys[source_edges] == welded_keys
+
+    # seams are edge flags (hidden attribute in newer versions)
+    use_seam = numpy.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_seam", use_seam)
+    welded_mesh.edges.foreach_set("use_seam", use_seam[source_edges] & found)
+    for attribute in mesh.attributes:
+        if attribute.domain != 'EDGE' or attribute.name.startswith(".") or attribute.data_type not in ATTRIBUTE_VALUE_TYPES:
+            continue
+        values = get_attribute_values(attribute)[source_edges]
+        values[~found] = 0
+        welded_attribute = welded_mesh.attributes.get(attribute.name) or welded_mesh.attributes.new(attribute.name, attribute.data_type, attribute.domain)
+        welded_attribute.data.foreach_set(ATTRIBUTE_VALUE_TYPES[attribute.data_type][0], values.ravel())
+
+# weld vertices within threshold distance vectorized by numpy (vertices connected by close pairs are joined)
+def remove_doubles_numpy(object_target, threshold):
+    mesh = object_target.data
+    vertex_count = len(mesh.vertices)
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+    if vertex_count == 0 or threshold <= 0.0:
+        return
+
+    coordinates = numpy.empty(vertex_count * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", coordinates)
+    coordinates = coordinates.reshape(-1, 3)
+
+    # map each vertex to smallest vertex index of vertices that are connected by pairs within threshold
+    first, second = find_close_vertex_pairs(coordinates, threshold)
+    representatives = get_pair_representatives(vertex_count, first, second)
+    kept_vertices = numpy.unique(representatives)
+    if len(kept_vertices) == vertex_count:
+        return
+    vertex_map = numpy.empty(vertex_count, dtype=numpy.int32)
+    vertex_map[kept_vertices] = numpy.arange(len(kept_vertices), dtype=numpy.int32)
+    vertex_map = vertex_map[representatives]
+
+    # remap loops in bulk and remove loops that follow same vertex in polygon
+    loop_vertices = numpy.empty(loop_count, dtype=numpy.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+    loop_vertices = vertex_map[loop_vertices]
+    loop_starts = numpy.empty(polygon_count, dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = numpy.empty(polygon_count, dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    next_loops = numpy.arange(1, loop_count + 1, dtype=numpy.int32)
+    next_loops[loop_starts + loop_totals - 1] = loop_starts
+    kept_loops = loop_vertices != loop_vertices[next_loops]
+
+    # remove polygons that have less than 3 loops
+    polygon_totals = numpy.add.reduceat(kept_loops.astype(numpy.int32), loop_starts)
+    kept_polygons = polygon_totals >= 3
+    kept_loops &= numpy.repeat(kept_polygons, loop_totals)
+    polygon_totals = polygon_totals[kept_polygons]
+
+    # build welded mesh
+    welded_mesh = bpy.data.meshes.new(mesh.name)
+    welded_mesh.vertices.add(len(kept_vertices))
+    welded_mesh.vertices.foreach_set("co", coordinates[kept_vertices].ravel())
+    welded_mesh.loops.add(int(numpy.count_nonzero(kept_loops)))
+    welded_mesh.loops.foreach_set("vertex_index", loop_vertices[kept_loops])
+    welded_mesh.polygons.add(len(polygon_totals))
+    welded_mesh.polygons.foreach_set("loop_start", (numpy.cumsum(polygon_totals) - polygon_totals).astype(numpy.int32))
+    if bpy.app.version < (4, 0, 0):
+        welded_mesh.polygons.foreach_set("loop_total", polygon_totals.astype(numpy.int32))
+
+    # copy point, corner and face attributes (uv maps, colors, materials and smooth flags, edge attributes are copied after edges are built)
+    kept_elements = {'POINT': kept_vertices, 'CORNER': kept_loops, 'FACE': kept_polygons}
+    for attribute in mesh.attributes:
+        if attribute.name.startswith(".") or attribute.name == "position":
+            continue
+        if attribute.domain not in kept_elements or attribute.data_type not in ATTRIBUTE_VALUE_TYPES:
+            continue
+        values = get_attribute_values(attribute)[kept_elements[attribute.domain]]
+        welded_attribute = welded_mesh.attributes.get(attribute.name) or welded_mesh.attributes.new(attribute.name, attribute.data_type, attribute.domain)
+        welded_attribute.data.foreach_set(ATTRIBUTE_VALUE_TYPES[attribute.data_type][0], values.ravel())
+    if bpy.app.version < (4, 0, 0):
+        use_smooth = numpy.empty(polygon_count, dtype=bool)
+        mesh.polygons.foreach_get("use_smooth", use_smooth)
+        welded_mesh.polygons.foreach_set("use_smooth", use_smooth[kept_polygons])
+    if mesh.uv_layers.active is not None:
+        welded_mesh.uv_layers.active_index = mesh.uv_layers.active_index
+        for uv_layer in mesh.uv_layers:
+            welded_mesh.uv_layers[uv_layer.name].active_render = uv_layer.active_render
+    for material in mesh.materials:
+        welded_mesh.materials.append(material)
+
+    welded_mesh.update(calc_edges=True)
+    welded_mesh.validate(clean_customdata=False)
+    copy_welded_edge_attributes(mesh, welded_mesh, vertex_map)
+
+    # replace mesh of target object
+    mesh_name = mesh.name
+    object_target.data = welded_mesh
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+    welded_mesh.name = mesh_name
+
+# triangulate faces with bmesh without entering edit mode
+def triangulate_bmesh(object_target):
+    mesh = object_target.data
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bmesh.ops.triangulate(bm, faces=bm.faces[:], quad_method='BEAUTY', ngon_method='BEAUTY')
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+# triangulate faces with edit mode operators
+def triangulate_operator(object_target):
+    bpy.ops.object.select_all(action='DESELECT')
+    object_target.select_set(True)
+    bpy.context.view_layer.objects.active = object_target
+
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='DESELECT')
+    bpy.ops.mesh.select_mode(type='FACE')
+    bpy.ops.mesh.select_all(action='SELECT')
+    bpy.ops.mesh.quads_convert_to_tris(quad_method='BEAUTY', ngon_method='BEAUTY')
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+# settings and stages of moderate weight reduction operators (normal operator and lean operator without undo)
+class ModerateWeightReductionOperator:
+    # lean mode is decided by operator class, so undo and freeing of data are switched together
+    lean_mode = False
+
+    remove_doubles: bpy.props.BoolProperty(
+        name="remove_doubles",
+        description="If the mesh is split, overlapping vertices are joined.",
+        default=False
+    )
+
+    remove_doubles_threshold: bpy.props.FloatProperty(
+        name="remove_doubles_threshold",
+        description="Maximum distance between vertices to be joined.",
+        default=0.001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    mesh_processing: bpy.props.EnumProperty(
+        name="mesh_processing",
+        description="Method of mesh integration and triangulation.",
+        default="BMESH",
+        items=[
+            ("NUMPY", "NumPy", "Weld vertices within merge distance found by vectorized grid search and triangulate with bmesh."),
+            ("BMESH", "BMesh", "Process mesh data directly without entering edit mode."),
+            ("OPERATOR", "Operator", "Process mesh with edit mode operators.")
+        ]
+    )
+
+    merge_mode: bpy.props.EnumProperty(
+        name="merge_mode",
+        description="Reduce source objects separately or join them into one result with one texture.",
+        default="SEPARATE",
+        items=[
+            ("SEPARATE", "Separate", "Reduce each selected object into its own result."),
+            ("SELECTION", "Selection", "Join selected objects into one result with one texture."),
+            ("COLLECTION", "Collection", "Join mesh objects in collection into one result with one texture.")
+        ]
+    )
+
+    merge_collection: bpy.props.StringProperty(
+        name="merge_collection",
+        description="Name of collection whose mesh objects are joined.",
+        default=""
+    )
+
+    decimate_mode: bpy.props.EnumProperty(
+        name="decimate_mode",
+        description="Specify polygon mesh left after reduction by ratio or triangle count.",
+        default="RATIO",
+        items=[
+            ("RATIO", "Ratio", "Ratio of polygon mesh left after reduction."),
+            ("TRIANGLES", "Triangle Count", "Triangle count left after reduction.")
+        ]
+    )
+
+    target_triangles: bpy.props.IntProperty(
+        name="target_triangles",
+        description="Maximum triangle count left after reduction.",
+        default=20000,
+        min=4
+    )
+
+    decimate_rate: bpy.props.FloatProperty(
+        name="decimate_rate",
+        description="Ratio of polygon mesh left after reduction.",
+        default=0.05,
+        min=0.0,
+        max=1.0
+    )
+
+    lod_levels: bpy.props.StringProperty(
+        name="lod_levels",
+        description="Comma separated ratios (or triangle counts) of coarser LODs. Each LOD is decimated from previous LOD and reuses its UV and textures.",
+        default=""
+    )
+
+    lod_texture: bpy.props.EnumProperty(
+        name="lod_texture",
+        description="Textures of coarser LODs.",
+        default="SHARE",
+        items=[
+            ("SHARE", "Share", "Coarser LODs share material and textures of LOD0."),
+            ("DOWNSAMPLE", "Downsample", "Textures of coarser LODs are downsampled to half resolution per level with box filter."),
+            ("DOWNSAMPLE_LANCZOS", "Downsample (Lanczos)", "Textures of coarser LODs are downsampled to half resolution per level with lanczos filter.")
+        ]
+    )
+
+    texture_name: bpy.props.StringProperty(
+        name="texture_name",
+        description="Name of new texture.",
+        default="texture"
+    )
+
+    texture_resolution: bpy.props.EnumProperty(
+        name="texture_resolution",
+        description="Resolution of new texture.",
+        default="1024", 
+        items=[
+            ("256", "256 x 256", "256 x 256"),
+            ("512", "512 x 512", "512 x 512"),
+            ("1024", "1024 x 1024", "1024 x 1024"),
+            ("2048", "2048 x 2048", "2048 x 2048"),
+            ("4096", "4096 x 4096", "4096 x 4096"),
+            ("8192", "8192 x 8192", "8192 x 8192"),
+            ("16384", "16384 x 16384", "16384 x 16384")
+        ]
+    )
+
+    uv_method: bpy.props.EnumProperty(
+        name="uv_method",
+        description="Method of uv unwrap.",
+        default="SMART_PROJECT",
+        items=[
+            ("SMART_PROJECT", "Smart UV Project", "Unwrap islands split by angle."),
+            ("LIGHTMAP", "Lightmap Pack", "Fast unwrap with one island per face for already low poly mesh.")
+        ]
+    )
+
+    uv_island_margin: bpy.props.FloatProperty(
+        name="uv_island_margin",
+        description="Margin between uv islands.",
+        default=0.001,
+        min=0.0,
+        max=1.0
+    )
+
+    uv_pack_islands: bpy.props.BoolProperty(
+        name="uv_pack_islands",
+        description="Pack uv islands to fill texture space.",
+        default=False
+    )
+
+    uv_pack_rotate: bpy.props.BoolProperty(
+        name="uv_pack_rotate",
+        description="Rotate uv islands for best fit in packing.",
+        default=True
+    )
+
+    uv_texel_density: bpy.props.FloatProperty(
+        name="uv_texel_density",
+        description="Texel density (pixels per meter) that selects texture resolution. (0 uses resolution setting.)",
+        default=0.0,
+        min=0.0
+    )
+
+    bake_normal: bpy.props.BoolProperty(
+        name="bake_normal",
+        description="Bake tangent space normal map.",
+        default=False
+    )
+
+    bake_roughness: bpy.props.BoolProperty(
+        name="bake_roughness",
+        description="Bake roughness map.",
+        default=False
+    )
+
+    bake_metallic: bpy.props.BoolProperty(
+        name="bake_metallic",
+        description="Bake metallic map.",
+        default=False
+    )
+
+    bake_ao: bpy.props.BoolProperty(
+        name="bake_ao",
+        description="Bake ambient occlusion map.",
+        default=False
+    )
+
+    pack_orm: bpy.props.BoolProperty(
+        name="pack_orm",
+        description="Bake ambient occlusion, roughness and metallic and pack them into one ORM texture.",
+        default=False
+    )
+
+    bake_profile: bpy.props.EnumProperty(
+        name="bake_profile",
+        description="Quality profile of bake.",
+        default="FINAL",
+        items=[
+            ("PREVIEW", "Preview", "Fast bake with 1 sample and low resolution texture."),
+            ("FINAL", "Final", "Bake with samples tuned for each map.")
+        ]
+    )
+
+    bake_threads: bpy.props.IntProperty(
+        name="bake_threads",
+        description="Number of CPU threads of bake. (0 is all cores.)",
+        default=0,
+        min=0,
+        max=1024
+    )
+
+    bake_tile_size: bpy.props.EnumProperty(
+        name="bake_tile_size",
+        description="Textures larger than tile size are baked tile by tile in uv space to bound memory usage.",
+        default="4096",
+        items=[
+            ("1024", "1024 x 1024", "1024 x 1024"),
+            ("2048", "2048 x 2048", "2048 x 2048"),
+            ("4096", "4096 x 4096", "4096 x 4096")
+        ]
+    )
+
+    bake_method: bpy.props.EnumProperty(
+        name="bake_method",
+        description="Method to create base color texture.",
+        default="CYCLES",
+        items=[
+            ("CYCLES", "Cycles Bake", "Bake maps with selected to active bake of cycles."),
+            ("TRANSFER", "Fast Transfer", "Transfer base color of image texture or color attribute from nearest surface of original mesh without render engine.")
+        ]
+    )
+
+    bake_ray_mode: bpy.props.EnumProperty(
+        name="bake_ray_mode",
+        description="How extrusion and max ray distance of bake are decided.",
+        default="FIXED",
+        items=[
+            ("FIXED", "Fixed", "Use fixed cage extrusion."),
+            ("AUTO", "Auto", "Derive extrusion and max ray distance from deviation between original and reduced mesh."),
+            ("CAGE", "Auto Cage", "Derive extrusion from deviation and bake with explicit cage object.")
+        ]
+    )
+
+    bake_cage_extrusion: bpy.props.FloatProperty(
+        name="bake_cage_extrusion",
+        description="Cage extrusion of fixed ray mode.",
+        default=0.1,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    bake_check_missed_texels: bpy.props.BoolProperty(
+        name="bake_check_missed_texels",
+        description="Report ratio of texels whose rays missed original mesh after bake.",
+        default=True
+    )
+
+    measure_quality: bpy.props.BoolProperty(
+        name="measure_quality",
+        description="Measure geometric deviation and render difference (PSNR and SSIM) between original and result models after bake.",
+        default=False
+    )
+
+    use_cache: bpy.props.BoolProperty(
+        name="use_cache",
+        description="Reuse result of same source mesh, textures and settings from cache.",
+        default=False
+    )
+
+    cache_directory: bpy.props.StringProperty(
+        name="cache_directory",
+        description="Directory of result cache. (Empty is user data directory.)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    cache_max_size: bpy.props.IntProperty(
+        name="cache_max_size",
+        description="Maximum size of result cache in MB. Least recently used results are removed.",
+        default=4096,
+        min=1
+    )
+
+    report_directory: bpy.props.StringProperty(
+        name="report_directory",
+        description="Directory to write timing and memory report of each stage. (Empty is not written.)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    profile_stage: bpy.props.EnumProperty(
+        name="profile_stage",
+        description="Stage to capture cProfile statistics into report directory.",
+        default="NONE",
+        items=[
+            ("NONE", "None", "Do not capture cProfile statistics."),
+            ("clone_target_object", "Clone", "clone_target_object"),
+            ("integration_polygon", "Mesh Integration", "integration_polygon"),
+            ("reduction_polygon", "Reduction", "reduction_polygon"),
+            ("expand_uv", "UV", "expand_uv"),
+            ("set_material_and_texture", "Material", "set_material_and_texture"),
+            ("apply_auto_smooth", "Auto Smooth", "apply_auto_smooth"),
+            ("settings_bake_configurations", "Bake Settings", "settings_bake_configurations"),
+            ("execute_bake", "Bake", "execute_bake"),
+            ("measure_quality_metrics", "Quality", "measure_quality_metrics"),
+            ("purge_orphan_data", "Purge", "purge_orphan_data"),
+            ("triangulate_faces", "Triangulate", "triangulate_faces"),
+            ("export_gltf", "Export", "export_gltf")
+        ]
+    )
+
+    export_directory: bpy.props.StringProperty(
+        name="export_directory",
+        description="Directory to export reduced models as glTF files. (If empty, models are not exported.)",
+        default="",
+        maxlen=1024,
+        subtype='DIR_PATH'
+    )
+
+    export_format: bpy.props.EnumProperty(
+        name="export_format",
+        description="Format of exported glTF files.",
+        default="GLB",
+        items=[
+            ("GLB", "glTF Binary (.glb)", "Mesh and textures are embedded in one file."),
+            ("GLTF_SEPARATE", "glTF Separate (.gltf + .bin + textures)", "Mesh and textures are written as external files.")
+        ]
+    )
+
+    export_compression: bpy.props.EnumProperty(
+        name="export_compression",
+        description="Compression of mesh data.",
+        default="NONE",
+        items=[
+            ("NONE", "None", "Do not compress mesh data."),
+            ("DRACO", "Draco", "Compress mesh data with Draco (KHR_draco_mesh_compression)."),
+            ("MESHOPT", "Meshopt", "Compress mesh data with gltfpack (EXT_meshopt_compression). gltfpack must be found in PATH.")
+        ]
+    )
+
+    export_image_format: bpy.props.EnumProperty(
+        name="export_image_format",
+        description="Format of textures in exported glTF files.",
+        default="AUTO",
+        items=[
+            ("AUTO", "Automatic", "Save PNG textures as PNG and JPEG textures as JPEG."),
+            ("JPEG", "JPEG", "Save textures as JPEG."),
+            ("WEBP", "WebP", "Save textures as WebP. (Blender 4.1 or later.)")
+        ]
+    )
+
+    export_draco_level: bpy.props.IntProperty(
+        name="export_draco_level",
+        description="Compression level of Draco (higher is smaller and slower).",
+        default=6,
+        min=0,
+        max=10
+    )
+
+    export_draco_position_bits: bpy.props.IntProperty(
+        name="export_draco_position_bits",
+        description="Quantization bits of position.",
+        default=14,
+        min=0,
+        max=30
+    )
+
+    export_draco_normal_bits: bpy.props.IntProperty(
+        name="export_draco_normal_bits",
+        description="Quantization bits of normal.",
+        default=10,
+        min=0,
+        max=30
+    )
+
+    export_draco_texcoord_bits: bpy.props.IntProperty(
+        name="export_draco_texcoord_bits",
+        description="Quantization bits of texture coordinates.",
+        default=12,
+        min=0,
+        max=30
+    )
+
+    def execute(self, context):
+        self.report({'INFO'}, "execute auto decimation and bake function")
+        self.report_settings()
+
+        self.start_run()
+        try:
+            for job, stage_function in self.steps:
+                self.run_stage(job, stage_function)
+            self.finish_run()
+        except Exception as e:
+            self.report({'ERROR'}, f"{e}")
+            return {'CANCELLED'}
+        finally:
+            self.end_run()
+
+        return {'FINISHED'}
+
+    # run stages one by one on timer, so ui is not frozen and esc cancels the run (background mode runs all stages at once)
+    def invoke(self, context, event):
+        if bpy.app.background or context.window is None:
+            return self.execute(context)
+
+        self.report({'INFO'}, "invoke auto decimation and bake function")
+        self.report_settings()
+
+        # times of stages estimate remaining time of modal run only (background runs do not share the file)
+        self.start_run()
+        self.stage_times = StageTimes(os.path.join(bpy.utils.user_resource('CONFIG'), "moderate_weight_reduction_stage_times.json"))
+        window_manager = context.window_manager
+        window_manager.hololab_running = True
+        window_manager.hololab_stage = "create_jobs"
+        window_manager.hololab_progress = 0.0
+        window_manager.hololab_elapsed = 0.0
+        window_manager.hololab_eta = -1.0
+        self.timer = window_manager.event_timer_add(0.1, window=context.window)
+        window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.report({'WARNING'}, "moderate weight reduction is cancelled.")
+            self.stop_modal(context, rollback=True)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # run next stage
+        try:
+            step = next(self.steps, None)
+            if step is None:
+                self.finish_run()
+                self.stop_modal(context, rollback=False)
+                return {'FINISHED'}
+            self.run_stage(*step)
+            self.update_progress(context)
+        except Exception as e:
+            self.report({'ERROR'}, f"{e}")
+            self.stop_modal(context, rollback=True)
+            return {'CANCELLED'}
+
+        return {'RUNNING_MODAL'}
+
+    # stop modal run (data blocks created by cancelled run are removed)
+    def stop_modal(self, context, rollback):
+        window_manager = context.window_manager
+        window_manager.event_timer_remove(self.timer)
+        window_manager.hololab_running = False
+        self.end_run()
+        if rollback:
+            self.remove_run_data()
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+    # prepare run of all jobs
+    def start_run(self):
+        self.previous_language = bpy.context.preferences.view.language
+        bpy.context.preferences.view.language = 'en_US'
+        self.stored_render_settings = store_render_settings(bpy.context.scene)
+        self.data_before_run = get_data_block_ids()
+        self.profiler = StageProfiler(self.profile_stage)
+        self.stage_times = None
+        self.jobs = []
+        self.job_index = 0
+        self.stage_names = []
+        self.stage_index = 0
+        self.steps = self.iterate_steps()
+
+    # iterate stage functions of all jobs
+    def iterate_steps(self):
+        self.jobs = self.create_jobs()
+        for job_index, job in enumerate(self.jobs):
+            stages = self.get_stages(job, self.profiler)
+            self.job_index = job_index
+            self.stage_names = [stage_function.__name__ for stage_function in stages]
+            for stage_index, stage_function in enumerate(stages):
+                self.stage_index = stage_index
+                yield job, stage_function
+
+    # run stage function of job
+    def run_stage(self, job, stage_function):
+        self.profiler.run(job, stage_function)
+        wall_time = self.profiler.records[-1]['wall_time']
+        if self.stage_times is not None:
+            self.stage_times.update(self.get_stage_time_key(stage_function.__name__), wall_time)
+        self.report({'INFO'}, f"{stage_function.__name__}: {wall_time:.2f}s")
+
+    # report results of all jobs
+    def finish_run(self):
+        if self.use_cache:
+            hits, misses, size = self.get_result_cache().stats()
+            self.report({'INFO'}, f"cache hits {hits}, misses {misses}, size {size / 1024 ** 2:.1f}MB")
+        self.report({'INFO'}, f"memory peak {get_peak_memory() / 1024 ** 2:.0f}MB, final {get_current_memory() / 1024 ** 2:.0f}MB")
+
+    # restore settings and write report
+    def end_run(self):
+        restore_render_settings(self.stored_render_settings)
+        self.remove_merged_objects()
+        bpy.context.preferences.view.language = self.previous_language
+        if self.stage_times is not None:
+            self.stage_times.save()
+        if self.report_directory:
+            for filepath in self.profiler.write_report(bpy.path.abspath(self.report_directory), self.get_settings()):
+                self.report({'INFO'}, f"report: {filepath}")
+
+    # remove objects, meshes, materials and images that are created during run (results replaced by run are not restored)
+    def remove_run_data(self):
+        created = [data_block for data_block in get_data_blocks() if data_block.session_uid not in self.data_before_run]
+        bpy.data.batch_remove(created)
+        self.report({'INFO'}, f"remove {len(created)} data blocks created by run")
+
+    # remove merged objects that are created as bake source of merge jobs
+    def remove_merged_objects(self):
+        for job in self.jobs:
+            object_merged = job.object_source
+            if object_merged in job.object_sources:
+                continue
+            mesh = object_merged.data
+            bpy.data.objects.remove(object_merged)
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+
+    # get key of stage time (time of material and bake stages depends on resolution and profile)
+    def get_stage_time_key(self, stage_name):
+        if stage_name in ["set_material_and_texture", "execute_bake"]:
+            return f"{stage_name}:{self.texture_resolution}:{self.bake_profile}"
+        return stage_name
+
+    # update progress, elapsed time and estimated remaining time shown in side panel
+    def update_progress(self, context):
+        job_count = max(1, len(self.jobs))
+        stage_count = max(1, len(self.stage_names))
+        remaining_stages = self.stage_names[self.stage_index + 1:]
+        remaining_jobs = job_count - self.job_index - 1
+        remaining_keys = [self.get_stage_time_key(name) for name in remaining_stages + self.stage_names * remaining_jobs]
+
+        window_manager = context.window_manager
+        window_manager.hololab_stage = f"{remaining_stages[0] if remaining_stages else 'next object'} ({self.job_index + 1}/{job_count})"
+        window_manager.hololab_progress = (self.job_index + (self.stage_index + 1) / stage_count) / job_count * 100.0
+        window_manager.hololab_elapsed = time.perf_counter() - self.profiler.start_time
+        window_manager.hololab_eta = self.stage_times.estimate(remaining_keys)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+    # report all settings
+    def report_settings(self):
+        self.report({'INFO'}, f"{self.remove_doubles=}")
+        self.report({'INFO'}, f"{self.remove_doubles_threshold=}")
+        self.report({'INFO'}, f"{self.mesh_processing=}")
+        self.report({'INFO'}, f"{self.merge_mode=}")
+        self.report({'INFO'}, f"{self.merge_collection=}")
+        self.report({'INFO'}, f"{self.decimate_mode=}")
+        self.report({'INFO'}, f"{self.target_triangles=}")
+        self.report({'INFO'}, f"{self.decimate_rate=}")
+        self.report({'INFO'}, f"{self.lod_levels=}")
+        self.report({'INFO'}, f"{self.lod_texture=}")
+        self.report({'INFO'}, f"{self.texture_name=}")
+        self.report({'INFO'}, f"{self.texture_resolution=}")
+        self.report({'INFO'}, f"{self.uv_method=}")
+        self.report({'INFO'}, f"{self.uv_island_margin=}")
+        self.report({'INFO'}, f"{self.uv_pack_islands=}")
+        self.report({'INFO'}, f"{self.uv_pack_rotate=}")
+        self.report({'INFO'}, f"{self.uv_texel_density=}")
+        self.report({'INFO'}, f"{self.bake_normal=}")
+        self.report({'INFO'}, f"{self.bake_roughness=}")
+        self.report({'INFO'}, f"{self.bake_metallic=}")
+        self.report({'INFO'}, f"{self.bake_ao=}")
+        self.report({'INFO'}, f"{self.pack_orm=}")
+        self.report({'INFO'}, f"{self.bake_profile=}")
+        self.report({'INFO'}, f"{self.bake_threads=}")
+        self.report({'INFO'}, f"{self.bake_tile_size=}")
+        self.report({'INFO'}, f"{self.bake_method=}")
+        self.report({'INFO'}, f"{self.bake_ray_mode=}")
+        self.report({'INFO'}, f"{self.bake_cage_extrusion=}")
+        self.report({'INFO'}, f"{self.bake_check_missed_texels=}")
+        self.report({'INFO'}, f"{self.use_cache=}")
+        self.report({'INFO'}, f"{self.measure_quality=}")
+        self.report({'INFO'}, f"{self.lean_mode=}")
+        self.report({'INFO'}, f"{self.report_directory=}")
+        self.report({'INFO'}, f"{self.profile_stage=}")
+        self.report({'INFO'}, f"{self.export_directory=}")
+        self.report({'INFO'}, f"{self.export_format=}")
+        self.report({'INFO'}, f"{self.export_compression=}")
+        self.report({'INFO'}, f"{self.export_image_format=}")
+        self.report({'INFO'}, f"{self.export_draco_level=}")
+        self.report({'INFO'}, f"{self.export_draco_position_bits=}")
+        self.report({'INFO'}, f"{self.export_draco_normal_bits=}")
+        self.report({'INFO'}, f"{self.export_draco_texcoord_bits=}")
+
+    # get stage functions of job (cached result skips reduction and bake stages)
+    def get_stages(self, job, profiler):
+        if self.use_cache and profiler.run(job, self.load_cached_result):
+            return [self.apply_auto_smooth, self.generate_lod_chain, self.export_gltf]
+
+        stages = [
+            self.clone_target_object,
+            self.integration_polygon,
+            self.reduction_polygon,
+            self.expand_uv,
+            self.set_material_and_texture,
+            self.apply_auto_smooth,
+            self.settings_bake_configurations,
+            self.execute_bake,
+        ]
+        if self.measure_quality:
+            stages.append(self.measure_quality_metrics)
+        if self.lean_mode:
+            stages.insert(stages.index(self.expand_uv), self.purge_orphan_data)
+            stages.append(self.purge_orphan_data)
+        stages.append(self.triangulate_faces)
+        if self.use_cache:
+            stages.append(self.store_cached_result)
+        stages.append(self.generate_lod_chain)
+        stages.append(self.export_gltf)
+        return stages
+
+    # get resolution of new textures (texel density selects resolution of job, preview profile bakes low resolution textures)
+    def get_texture_resolution(self, job):
+        resolution = job.resolution if job.resolution > 0 else int(self.texture_resolution)
+        if self.bake_profile == 'PREVIEW':
+            resolution = max(256, resolution // 4)
+        return resolution
+
+    # get tile size of bake (0 is not tiled)
+    def get_bake_tile_size(self, job):
+        tile_size = int(self.bake_tile_size)
+        if self.bake_method == 'TRANSFER':
+            return 0
+        return tile_size if self.get_texture_resolution(job) > tile_size else 0
+
+    # get resolution of images that are baked (tiles have margin on each side)
+    def get_bake_image_resolution(self, job):
+        tile_size = self.get_bake_tile_size(job)
+        if tile_size == 0:
+            return self.get_texture_resolution(job)
+        return tile_size + bpy.context.scene.render.bake.margin * 2
+
+    # create jobs from selected source objects
+    def create_jobs(self):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+
+        # collect source objects (active object first, results of last run are excluded)
+        object_sources = []
+        object_active = bpy.context.active_object
+        if self.merge_mode == 'COLLECTION':
+            collection = bpy.data.collections.get(self.merge_collection)
+            if collection is None:
+                raise Exception(f"collection is not found: {self.merge_collection}.")
+            object_sources.extend(collection.all_objects)
+        else:
+            if object_active is not None and object_active.select_get():
+                object_sources.append(object_active)
+            for selected_object in bpy.context.selected_objects:
+                if selected_object not in object_sources:
+                    object_sources.append(selected_object)
+            if not object_sources and object_active is not None:
+                object_sources.append(object_active)
+        object_sources = [o for o in object_sources if o.type == 'MESH' and not o.hololab_result]
+        if not object_sources:
+            self.report({'ERROR'}, "please turn active the source object in outliner or view port.")
+            raise Exception("source object is not found.")
+        if self.bake_method == 'TRANSFER' and len(self.get_bake_maps()) > 1:
+            raise Exception("fast transfer creates base color only. disable normal, roughness, metallic, ambient occlusion and orm.")
+        if self.bake_method == 'TRANSFER' and self.uv_texel_density == 0.0 and int(self.texture_resolution) > int(self.bake_tile_size):
+            raise Exception(f"fast transfer is not tiled. select texture resolution up to bake tile size {self.bake_tile_size}.")
+        try:
+            lod_levels = self.get_lod_levels()
+        except ValueError:
+            raise Exception(f"lod levels are not comma separated numbers: {self.lod_levels}.")
+        if any(value <= 0 for value in lod_levels) or (self.decimate_mode != 'TRIANGLES' and any(value > 1.0 for value in lod_levels)):
+            raise Exception(f"lod levels must be ratios in (0, 1] or positive triangle counts: {self.lod_levels}.")
+
+        # texture name of each job
+        texture_name = self.texture_name if self.texture_name else "texture"
+
+        # one job bakes all source objects joined into merged object into one texture atlas
+        if self.merge_mode != 'SEPARATE' and len(object_sources) > 1:
+            merged_name = self.merge_collection if self.merge_mode == 'COLLECTION' else object_sources[0].name
+            job = ReductionJob(create_merged_object(object_sources, f"{merged_name}_merged"), texture_name)
+            job.object_sources = object_sources
+            self.report({'INFO'}, f"merge {len(object_sources)} objects into {job.object_source.name}")
+            return [job]
+        if len(object_sources) == 1:
+            return [ReductionJob(object_sources[0], texture_name)]
+        return [ReductionJob(object_source, f"{texture_name}_{object_source.name}") for object_source in object_sources]
+
+    # get result cache
+    def get_result_cache(self):
+        directory = bpy.path.abspath(self.cache_directory) if self.cache_directory else bpy.utils.user_resource('DATAFILES', path="moderate_weight_reduction_cache")
+        return ResultCache(directory, self.cache_max_size * 1024 ** 2)
+
+    # get all operator settings
+    def get_settings(self):
+        return {key: getattr(self, key) for key in self.properties.bl_rna.properties.keys() if key != "rna_type"}
+
+    # get settings that change result
+    def get_cache_settings(self, job):
+        settings = {key: value for key, value in self.get_settings().items() if key not in CACHE_IGNORED_SETTINGS}
+        settings["texture_name"] = job.texture_name
+        return settings
+
+    # load cached result (return false if result is not cached)
+    def load_cached_result(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        start_time = time.perf_counter()
+        job.cache_key = compute_cache_key(job.object_source, self.get_cache_settings(job))
+        filepath = self.get_result_cache().get(job.cache_key)
+        if not filepath:
+            self.report({'INFO'}, f"cache miss: {job.cache_key[:16]}")
+            return False
+
+        # append cached mesh with its material and textures
+        self.remove_exist_textures(job)
+        with bpy.data.libraries.load(filepath, link=False) as (data_from, data_to):
+            data_to.meshes = data_from.meshes[:1]
+        mesh = data_to.meshes[0]
+        mesh.use_fake_user = False
+        for material in mesh.materials:
+            material.use_fake_user = False
+        self.clone_target_object(job, mesh)
+
+        # restore textures of job
+        for texture in get_baked_textures(job.object_target):
+            texture.use_fake_user = False
+            for map_name, _, suffix, _ in BAKE_MAPS + [("orm", None, "_orm", True)]:
+                if texture.name == job.texture_name + suffix:
+                    job.images[map_name] = texture
+        job.image = job.images.get("base_color")
+
+        self.report({'INFO'}, f"cache hit: {job.cache_key[:16]} ({(time.perf_counter() - start_time) * 1000:.0f}ms)")
+        return True
+
+    # store result mesh, material and textures in cache
+    def store_cached_result(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        mesh = job.object_target.data
+        textures = get_baked_textures(job.object_target)
+        for texture in textures:
+            if texture.packed_file is None:
+                texture.pack()
+
+        def write_function(filepath):
+            bpy.data.libraries.write(filepath, {mesh, *mesh.materials, *textures}, fake_user=True, compress=True)
+
+        self.get_result_cache().put(job.cache_key, write_function)
+
+    # clone tartget object (mesh is duplicated from source object if it is not specified)
+    def clone_target_object(self, job, mesh=None):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # remove result object that generated at last run (or that source objects are joined into)
+        object_source = job.object_source
+        merged_results = [o.hololab_merged_result for o in job.object_sources if o.hololab_merged_result is not None]
+        exist_objects = [o for o in bpy.data.objects if o.hololab_result and (o.hololab_source in job.object_sources or o in merged_results)]
+        for exist_object in exist_objects:
+            exist_mesh = exist_object.data
+            bpy.data.objects.remove(exist_object)
+            if exist_mesh.users == 0:
+                bpy.data.meshes.remove(exist_mesh)
+
+        # duplicate object
+        object_target = object_source.copy()
+        object_target.data = mesh if mesh is not None else object_source.data.copy()
+        for collection in object_source.users_collection:
+            collection.objects.link(object_target)
+
+        # rename target object
+        object_target.name = f"{job.object_sources[0].name}_LOD"
+        object_target.hololab_result = True
+        object_target.hololab_source = job.object_sources[0]
+        job.object_target = object_target
+
+        # merged object is removed after run, so source objects keep their result
+        if object_source not in job.object_sources:
+            for merged_source in job.object_sources:
+                merged_source.hololab_merged_result = object_target
+
+    # integration polygon
+    def integration_polygon(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # apply remove doubles
+        if not self.remove_doubles:
+            return
+        if self.mesh_processing == 'NUMPY':
+            remove_doubles_numpy(job.object_target, self.remove_doubles_threshold)
+        elif self.mesh_processing == 'BMESH':
+            remove_doubles_bmesh(job.object_target, self.remove_doubles_threshold)
+        else:
+            remove_doubles_operator(job.object_target, self.remove_doubles_threshold)
+
+    # reduction polygon
+    def reduction_polygon(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # select target object
+        bpy.ops.object.select_all(action='DESELECT')
+        object_target = job.object_target
+        object_target.select_set(True)
+        bpy.context.view_layer.objects.active = object_target
+
+        # decimate merged object part by part with triangle budget split by surface area of source objects
+        mesh = object_target.data
+        if MERGE_PART_ATTRIBUTE in mesh.attributes:
+            triangles = len(mesh.loops) - len(mesh.polygons) * 2
+            budget = self.target_triangles if self.decimate_mode == 'TRIANGLES' else triangles * self.decimate_rate
+            part_count, triangles = decimate_parts(object_target, budget)
+            mesh.attributes.remove(mesh.attributes[MERGE_PART_ATTRIBUTE])
+            self.report({'INFO'}, f"decimate {part_count} parts: {triangles} triangles (budget {budget:.0f})")
+            return
+
+        # find ratio of target triangle count
+        ratio = self.decimate_rate
+        if self.decimate_mode == 'TRIANGLES':
+            ratio, triangles, iterations = find_decimate_ratio(object_target, self.target_triangles)
+            self.report({'INFO'}, f"decimate ratio {ratio:.5f}: {triangles} triangles (target {self.target_triangles}, {iterations} iterations)")
+            if triangles > self.target_triangles:
+                self.report({'WARNING'}, f"{job.object_source.name} can not be decimated to {self.target_triangles} triangles: {triangles} triangles")
+
+        # decimation (lean mode frees high poly mesh as soon as decimated mesh replaces it)
+        if self.lean_mode:
+            mesh_high = object_target.data
+            object_target.data = decimate_mesh(mesh_high, ratio)
+            mesh_name = mesh_high.name
+            bpy.data.meshes.remove(mesh_high)
+            object_target.data.name = mesh_name
+            return
+        decimate_modifier = object_target.modifiers.new(name="Decimate", type='DECIMATE')
+        decimate_modifier.ratio = ratio
+        bpy.ops.object.modifier_apply(modifier=decimate_modifier.name)
+
+    # get enabled bake maps
+    def get_bake_maps(self):
+        enabled = {
+            "base_color": True,
+            "normal": self.bake_normal,
+            "roughness": self.bake_roughness or self.pack_orm,
+            "metallic": self.bake_metallic or self.pack_orm,
+            "ao": self.bake_ao or self.pack_orm,
+        }
+        return [bake_map for bake_map in BAKE_MAPS if enabled[bake_map[0]]]
+
+    # remove textures that generated at last run
+    def remove_exist_textures(self, job):
+        # rename exist image texture with same name as specified name that are linked in source object material
+        object_source = job.object_source
+        texture_name = job.texture_name
+        for material in object_source.data.materials:
+            kind, image = get_base_color_source(material)
+            if kind == 'IMAGE' and image.name == texture_name:
+                image.name += ".original"
+
+        # remove exist image textures that generated at last run　
+        texture_names = [texture_name + suffix for _, _, suffix, _ in BAKE_MAPS] + [f"{texture_name}_orm"]
+        exist_images = [image for image in bpy.data.images if image.name in texture_names or image.name.rsplit("_LOD", 1)[0] in texture_names]
+        for exist_image in exist_images:
+            bpy.data.images.remove(image=exist_image)
+
+    # settings material and texture
+    def set_material_and_texture(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        self.remove_exist_textures(job)
+        texture_name = job.texture_name
+
+        # clear materials
+        object_target = job.object_target
+        object_target.data.materials.clear()
+
+        # add new material
+        material = bpy.data.materials.new(name="Material")
+        object_target.data.materials.append(material)
+
+        # add image texture node and create image texture of each bake map
+        material.use_nodes = True
+        node_tree = material.node_tree
+        resolution = self.get_bake_image_resolution(job)
+        for index, (map_name, _, suffix, non_color) in enumerate(self.get_bake_maps()):
+            image_texture = node_tree.nodes.new(type='ShaderNodeTexImage')
+            image_texture.location = (-600, -300 * index)
+            image_texture.image = bpy.data.images.new(name=texture_name + suffix, width=resolution, height=resolution, alpha=True)
+            if non_color:
+                image_texture.image.colorspace_settings.name = 'Non-Color'
+            job.images[map_name] = image_texture.image
+            job.bake_nodes[map_name] = image_texture
+        job.image = job.images["base_color"]
+
+        # link color socket from image texture to principled bsdf
+        principled_bsdf = get_principled_bsdf(material)
+        node_tree.links.new(job.bake_nodes["base_color"].outputs['Color'], principled_bsdf.inputs['Base Color'])
+
+        # link normal map
+        if "normal" in job.bake_nodes:
+            normal_map = node_tree.nodes.new(type='ShaderNodeNormalMap')
+            normal_map.location = (-250, -300)
+            node_tree.links.new(job.bake_nodes["normal"].outputs['Color'], normal_map.inputs['Color'])
+            node_tree.links.new(normal_map.outputs['Normal'], principled_bsdf.inputs['Normal'])
+
+        # link packed orm texture (ambient occlusion, roughness and metallic images are baked and packed into it)
+        if self.pack_orm:
+            image_texture = node_tree.nodes.new(type='ShaderNodeTexImage')
+            image_texture.location = (-600, 300)
+            image_texture.image = bpy.data.images.new(name=f"{texture_name}_orm", width=resolution, height=resolution)
+            image_texture.image.colorspace_settings.name = 'Non-Color'
+            job.images["orm"] = image_texture.image
+            job.bake_nodes["orm"] = image_texture
+
+            separate_color = node_tree.nodes.new(type='ShaderNodeSeparateColor')
+            separate_color.location = (-250, 300)
+            node_tree.links.new(image_texture.outputs['Color'], separate_color.inputs['Color'])
+            node_tree.links.new(separate_color.outputs['Green'], principled_bsdf.inputs['Roughness'])
+            node_tree.links.new(separate_color.outputs['Blue'], principled_bsdf.inputs['Metallic'])
+            occlusion_socket = separate_color.outputs['Red']
+        else:
+            if "roughness" in job.bake_nodes:
+                node_tree.links.new(job.bake_nodes["roughness"].outputs['Color'], principled_bsdf.inputs['Roughness'])
+            if "metallic" in job.bake_nodes:
+                node_tree.links.new(job.bake_nodes["metallic"].outputs['Color'], principled_bsdf.inputs['Metallic'])
+            occlusion_socket = job.bake_nodes["ao"].outputs['Color'] if "ao" in job.bake_nodes else None
+
+        # link ambient occlusion to glTF material output
+        if occlusion_socket is not None:
+            gltf_material_output = node_tree.nodes.new(type='ShaderNodeGroup')
+            gltf_material_output.node_tree = get_gltf_material_output_group()
+            gltf_material_output.location = (0, -600)
+            node_tree.links.new(occlusion_socket, gltf_material_output.inputs['Occlusion'])
+
+    # expand uv
+    def expand_uv(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # select target object
+        bpy.ops.object.select_all(action='DESELECT')
+        object_target = job.object_target
+        object_target.select_set(True)
+        bpy.context.view_layer.objects.active = object_target
+
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.select_all(action='SELECT')
+        if self.uv_method == 'LIGHTMAP':
+            # set lightmap pack (one island per face, fast for low poly mesh)
+            bpy.ops.uv.lightmap_pack(PREF_CONTEXT='ALL_FACES', PREF_PACK_IN_ONE=True, PREF_NEW_UVLAYER=False, PREF_MARGIN_DIV=max(self.uv_island_margin * 100, 0.001))
+        else:
+            # set smart uv project
+            bpy.ops.uv.smart_project(angle_limit=0.349066, margin_method='FRACTION', rotate_method='AXIS_ALIGNED', island_margin=self.uv_island_margin, area_weight=0.0, correct_aspect=True, scale_to_bounds=False)
+
+        # pack islands
+        if self.uv_pack_islands:
+            bpy.ops.uv.select_all(action='SELECT')
+            bpy.ops.uv.pack_islands(rotate=self.uv_pack_rotate, margin=self.uv_island_margin)
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        # report packing efficiency and texel density
+        uv_area, surface_area = get_uv_and_surface_area(object_target)
+        efficiency = min(uv_area, 1.0)
+        if self.uv_texel_density > 0.0 and uv_area > 0.0:
+            job.resolution = select_texture_resolution(self.uv_texel_density * math.sqrt(surface_area / uv_area))
+            # fast transfer is not tiled (full resolution float pixels are kept in memory)
+            if self.bake_method == 'TRANSFER' and job.resolution > int(self.bake_tile_size):
+                self.report({'WARNING'}, f"fast transfer resolution {job.resolution}px is limited to bake tile size {self.bake_tile_size}px")
+                job.resolution = int(self.bake_tile_size)
+        resolution = self.get_texture_resolution(job)
+        texel_density = resolution * math.sqrt(uv_area / surface_area) if surface_area > 0.0 else 0.0
+        job.metrics["uv_packing_efficiency"] = efficiency
+        job.metrics["texel_density"] = texel_density
+        job.metrics["texture_resolution"] = resolution
+        self.report({'INFO'}, f"uv packing efficiency {efficiency * 100:.1f}%, texel density {texel_density:.1f}px/m at {resolution}px")
+
+    # apply auto smooth
+    def apply_auto_smooth(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # select target object
+        bpy.ops.object.select_all(action='DESELECT')
+        object_target = job.object_target
+        object_target.select_set(True)
+        bpy.context.view_layer.objects.active = object_target
+
+        # apply auto smooth
+        if bpy.app.version < (4, 1, 0):
+            object_target.data.use_auto_smooth = True
+            object_target.data.auto_smooth_angle = math.radians(30)
+        else:
+            bpy.ops.object.shade_smooth_by_angle(angle=math.radians(30))
+
+    # settings bake configurations
+    def settings_bake_configurations(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # fast transfer does not use render engine
+        if self.bake_method == 'TRANSFER':
+            return
+
+        # set render engine to cycles
+        bpy.context.scene.render.engine = 'CYCLES'
+
+        # disable pass direct and pass indirect
+        bpy.context.scene.render.bake.use_pass_direct = False
+        bpy.context.scene.render.bake.use_pass_indirect = False
+
+        # enable selected to active
+        bpy.context.scene.render.bake.use_selected_to_active = True
+
+        # set cage extrusion and max ray distance
+        self.settings_bake_rays(job)
+
+        # set margin type to extend
+        bpy.context.scene.render.bake.margin_type = 'EXTEND'
+
+        # set bake type to diffuse
+        bpy.context.scene.cycles.bake_type = 'DIFFUSE'
+        bpy.context.scene.render.bake.use_clear = True
+
+        # set normal space to tangent
+        bpy.context.scene.render.bake.normal_space = 'TANGENT'
+
+        # set sampling and device (denoising and adaptive sampling are not used for bake)
+        bpy.context.scene.cycles.device = get_cycles_device()
+        bpy.context.scene.cycles.use_adaptive_sampling = False
+        bpy.context.scene.cycles.use_denoising = False
+        if hasattr(bpy.context.scene.cycles, "use_auto_tile"):
+            bpy.context.scene.cycles.use_auto_tile = False
+
+        # set thread count explicitly
+        bpy.context.scene.render.threads_mode = 'FIXED'
+        bpy.context.scene.render.threads = self.bake_threads if self.bake_threads > 0 else (os.cpu_count() or 1)
+
+    # set cage extrusion and max ray distance (auto modes derive them from deviation of original mesh from reduced mesh)
+    def settings_bake_rays(self, job):
+        bake = bpy.context.scene.render.bake
+        bake.use_cage = False
+        bake.cage_object = None
+        if self.bake_ray_mode == 'FIXED':
+            bake.cage_extrusion = self.bake_cage_extrusion
+            bake.max_ray_distance = 0.0
+            return
+
+        # extrusion covers original surface outside of reduced mesh, rays reach original surface inside of reduced mesh
+        deviations = get_surface_deviations(job.object_source, job.object_target)
+        dimensions = job.object_target.dimensions
+        epsilon = max(dimensions.length * 1e-4, 1e-6)
+        deviation_outside = float(max(deviations.max(initial=0.0), 0.0))
+        deviation_inside = float(max(-deviations.min(initial=0.0), 0.0))
+        extrusion = deviation_outside * 1.1 + epsilon
+        max_ray_distance = extrusion + deviation_inside * 1.1 + epsilon
+        bake.cage_extrusion = extrusion
+        bake.max_ray_distance = max_ray_distance
+        job.metrics["deviation_outside"] = deviation_outside
+        job.metrics["deviation_inside"] = deviation_inside
+        job.metrics["cage_extrusion"] = extrusion
+        job.metrics["max_ray_distance"] = max_ray_distance
+        self.report({'INFO'}, f"deviation outside {deviation_outside:.4f}m, inside {deviation_inside:.4f}m, extrusion {extrusion:.4f}m, max ray distance {max_ray_distance:.4f}m")
+
+        # explicit cage object (removed after bake)
+        if self.bake_ray_mode == 'CAGE':
+            job.object_cage = create_cage_object(job.object_target, extrusion)
+            bake.use_cage = True
+            bake.cage_object = job.object_cage
+
+    # execute bake
+    def execute_bake(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # transfer base color without render engine
+        if self.bake_method == 'TRANSFER':
+            start_time = time.perf_counter()
+            pixels = transfer_base_color(job.object_source, job.object_target, job.image.size[0])
+            array_to_image(job.image, pad_pixels(pixels))
+            self.report({'INFO'}, f"transfer base_color: {time.perf_counter() - start_time:.2f}s, peak memory {get_peak_memory() / 1024 ** 2:.0f}MB")
+            return
+
+        # deselect all object
+        bpy.ops.object.select_all(action='DESELECT')
+
+        # select source object
+        object_source = job.object_source
+        object_source.select_set(True)
+        
+        # active tartget object
+        object_target = job.object_target
+        object_target.select_set(True)
+        bpy.context.view_layer.objects.active = object_target
+
+        # execute bake of all maps with same selection and bake settings
+        node_tree = object_target.data.materials[0].node_tree
+        bake_maps = self.get_bake_maps()
+        total_start_time = time.perf_counter()
+        try:
+            if self.get_bake_tile_size(job) > 0:
+                self.bake_tiles(job, node_tree, bake_maps)
+            else:
+                self.bake_maps(job, node_tree, bake_maps)
+            if self.bake_check_missed_texels:
+                self.check_missed_texels(job, node_tree)
+        finally:
+            self.remove_cage_object(job)
+
+        # remove ambient occlusion, roughness and metallic images that are packed into orm texture
+        if "orm" in job.images:
+            for map_name in ORM_MAPS:
+                node_tree.nodes.remove(job.bake_nodes.pop(map_name))
+                bpy.data.images.remove(image=job.images.pop(map_name))
+        node_tree.nodes.active = job.bake_nodes["base_color"]
+
+        self.report({'INFO'}, f"bake {len(bake_maps)} maps: {time.perf_counter() - total_start_time:.2f}s, peak memory {get_peak_memory() / 1024 ** 2:.0f}MB")
+
+    # remove cage object of bake
+    def remove_cage_object(self, job):
+        if job.object_cage is None:
+            return
+        bpy.context.scene.render.bake.use_cage = False
+        bpy.context.scene.render.bake.cage_object = None
+        mesh = job.object_cage.data
+        bpy.data.objects.remove(job.object_cage)
+        bpy.data.meshes.remove(mesh)
+        job.object_cage = None
+
+    # check ratio of texels in uv islands whose rays missed original mesh (bake without margin writes alpha only on hit texels)
+    def check_missed_texels(self, job, node_tree):
+        resolution = min(MISSED_TEXEL_RESOLUTION, self.get_texture_resolution(job))
+        image = bpy.data.images.new(name=f"{job.texture_name}_hit", width=resolution, height=resolution, alpha=True)
+        image_node = node_tree.nodes.new(type='ShaderNodeTexImage')
+        image_node.image = image
+        bake = bpy.context.scene.render.bake
+        margin = bake.margin
+        samples = bpy.context.scene.cycles.samples
+        try:
+            node_tree.nodes.active = image_node
+            bake.margin = 0
+            bpy.context.scene.cycles.samples = 1
+            bpy.ops.object.bake(type='EMIT')
+            hits = image_to_array(image)[..., 3] > 0.0
+        finally:
+            bake.margin = margin
+            bpy.context.scene.cycles.samples = samples
+            node_tree.nodes.remove(image_node)
+            bpy.data.images.remove(image)
+
+        coverage = rasterize_uv_coverage(job.object_target.data, resolution)
+        covered_count = int(coverage.sum())
+        missed_ratio = float((coverage & ~hits).sum()) / covered_count if covered_count > 0 else 0.0
+        job.metrics["missed_texel_ratio"] = missed_ratio
+        self.report({'INFO'}, f"missed texels {missed_ratio * 100:.2f}%")
+        if missed_ratio > MISSED_TEXEL_WARNING:
+            self.report({'WARNING'}, f"{missed_ratio * 100:.2f}% of texels of {job.object_source.name} missed original mesh. Try auto ray mode or larger extrusion.")
+
+    # bake maps into images of bake nodes
+    def bake_maps(self, job, node_tree, bake_maps):
+        object_source = job.object_source
+        for map_name, bake_type, _, _ in bake_maps:
+            start_time = time.perf_counter()
+            node_tree.nodes.active = job.bake_nodes[map_name]
+            bpy.context.scene.cycles.samples = BAKE_SAMPLES[self.bake_profile][bake_type]
+            if map_name == "base_color":
+                stored_inputs = self.prepare_base_color_bake(object_source)
+            elif map_name == "metallic":
+                stored_inputs = self.prepare_metallic_bake(object_source)
+            else:
+                stored_inputs = []
+            try:
+                bpy.ops.object.bake(type=bake_type)
+            finally:
+                restore_principled_inputs(stored_inputs)
+            self.report({'INFO'}, f"bake {map_name}: {time.perf_counter() - start_time:.2f}s")
+        self.pad_baked_images(job, bake_maps)
+
+        # pack ambient occlusion, roughness and metallic into orm texture
+        if "orm" in job.images:
+            pack_orm_image(job.images["orm"], job.images["ao"], job.images["roughness"], job.images["metallic"])
+
+    # pad texels that are not baked (baked images are cleared to alpha 0 before bake)
+    def pad_baked_images(self, job, bake_maps):
+        pixels = None
+        for map_name, _, _, _ in bake_maps:
+            image = job.images[map_name]
+            pixels = image_to_array(image, pixels)
+            array_to_image(image, pad_pixels(pixels))
+
+    # bake maps tile by tile in uv space and stitch tiles into final images (memory is bounded by tile size)
+    def bake_tiles(self, job, node_tree, bake_maps):
+        resolution = self.get_texture_resolution(job)
+        tile_size = self.get_bake_tile_size(job)
+        tile_resolution = self.get_bake_image_resolution(job)
+        margin = (tile_resolution - tile_size) // 2
+        tile_count = resolution // tile_size
+
+        # stitch 8 bit pixels of final images in files on disk
+        map_names = [map_name for map_name in job.images if not ("orm" in job.images and map_name in ORM_MAPS)]
+        stitch_files = {map_name: os.path.join(bpy.app.tempdir, f"{job.images[map_name].name}.raw") for map_name in map_names}
+        stitch_buffers = {}
+        png_files = {map_name: os.path.join(bpy.app.tempdir, f"{job.images[map_name].name}.png") for map_name in map_names}
+
+        # store uv coordinates
+        mesh = job.object_target.data
+        uv_layer = mesh.uv_layers.active
+        uvs = numpy.empty(len(uv_layer.data) * 2, dtype=numpy.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+
+        tile_pixels = numpy.empty((tile_resolution, tile_resolution, 4), dtype=numpy.float32)
+        try:
+            for map_name in map_names:
+                stitch_buffers[map_name] = numpy.memmap(stitch_files[map_name], dtype=numpy.uint8, mode='w+', shape=(resolution, resolution, 4))
+
+            for tile_y in range(tile_count):
+                for tile_x in range(tile_count):
+                    start_time = time.perf_counter()
+
+                    # transform uv coordinates so that the tile (and its margin) covers the bake images
+                    offset = numpy.array([tile_x * tile_size - margin, tile_y * tile_size - margin], dtype=numpy.float32)
+                    tile_uvs = (uvs.reshape(-1, 2) * resolution - offset) / tile_resolution
+                    uv_layer.data.foreach_set("uv", tile_uvs.ravel())
+                    mesh.update()
+
+                    self.bake_maps(job, node_tree, bake_maps)
+
+                    # copy tile without margin into stitch buffers
+                    for map_name in map_names:
+                        tile = image_to_array(job.images[map_name], tile_pixels)[margin:margin + tile_size, margin:margin + tile_size]
+                        stitch_buffers[map_name][tile_y * tile_size:(tile_y + 1) * tile_size, tile_x * tile_size:(tile_x + 1) * tile_size] = quantize_pixels(tile)
+
+                    self.report({'INFO'}, f"bake tile ({tile_x}, {tile_y}): {time.perf_counter() - start_time:.2f}s, peak memory {get_peak_memory() / 1024 ** 2:.0f}MB")
+
+            # write stitched images to png files and replace tile images with them
+            for map_name in map_names:
+                write_png(png_files[map_name], stitch_buffers[map_name])
+            for map_name in map_names:
+                image_tile = job.images[map_name]
+                image_name = image_tile.name
+                colorspace = image_tile.colorspace_settings.name
+                bpy.data.images.remove(image=image_tile)
+                image = bpy.data.images.load(png_files[map_name])
+                image.name = image_name
+                image.colorspace_settings.name = colorspace
+                image.pack()
+                job.bake_nodes[map_name].image = image
+                job.images[map_name] = image
+        finally:
+            # restore uv coordinates
+            uv_layer.data.foreach_set("uv", uvs)
+            mesh.update()
+
+            # close and remove stitch files and png files (images are packed, also when bake is cancelled or fails)
+            stitch_buffers.clear()
+            for temp_file in list(stitch_files.values()) + list(png_files.values()):
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+        job.image = job.images["base_color"]
+
+    # disable metallic of source materials (metallic surface has no diffuse color)
+    def prepare_base_color_bake(self, object_source):
+        stored_inputs = store_principled_inputs(object_source, ['Metallic'])
+        for material, principled_bsdf, input_name, _, _ in stored_inputs:
+            socket = principled_bsdf.inputs[input_name]
+            for link in list(socket.links):
+                material.node_tree.links.remove(link)
+            socket.default_value = 0
+        return stored_inputs
+
+    # route metallic of source materials to emission (cycles has no metallic bake type)
+    def prepare_metallic_bake(self, object_source):
+        emission_input_name = get_emission_input_name()
+        stored_inputs = store_principled_inputs(object_source, [emission_input_name, 'Emission Strength'])
+        for material in object_source.data.materials:
+            principled_bsdf = get_principled_bsdf(material)
+            if principled_bsdf is None:
+                continue
+            emission_socket = principled_bsdf.inputs[emission_input_name]
+            strength_socket = principled_bsdf.inputs['Emission Strength']
+            for link in list(emission_socket.links) + list(strength_socket.links):
+                material.node_tree.links.remove(link)
+            strength_socket.default_value = 1.0
+            metallic_socket = principled_bsdf.inputs['Metallic']
+            if metallic_socket.is_linked:
+                material.node_tree.links.new(metallic_socket.links[0].from_socket, emission_socket)
+            else:
+                value = metallic_socket.default_value
+                emission_socket.default_value = (value, value, value, 1.0)
+        return stored_inputs
+
+    # remove orphan meshes, images and materials that are created during run (intermediate data) in lean mode
+    def purge_orphan_data(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        memory = get_current_memory()
+        job.images = {map_name: image for map_name, image in job.images.items() if image.users > 0}
+        job.image = job.images.get("base_color")
+
+        # only data blocks created during run are removed (orphan data of project is kept)
+        # removed materials release their images, so repeat until no orphan is left
+        count = 0
+        while True:
+            orphans = [mesh for mesh in bpy.data.meshes if mesh.users == 0]
+            orphans += [material for material in bpy.data.materials if material.users == 0]
+            orphans += [image for image in bpy.data.images if image.users == 0 and image.type not in ('RENDER_RESULT', 'COMPOSITING')]
+            orphans = [orphan for orphan in orphans if orphan.session_uid not in self.data_before_run]
+            if not orphans:
+                break
+            bpy.data.batch_remove(orphans)
+            count += len(orphans)
+        self.report({'INFO'}, f"purge {count} orphan data blocks: memory {memory / 1024 ** 2:.0f}MB -> {get_current_memory() / 1024 ** 2:.0f}MB")
+
+    # measure geometric deviation and difference of renders between original and result models
+    def measure_quality_metrics(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        object_source = job.object_source
+        object_target = job.object_target
+        deviation_metrics = get_deviation_metrics(object_source, object_target)
+        job.metrics.update(deviation_metrics)
+        self.report({'INFO'}, f"deviation mean {deviation_metrics['deviation_mean']:.5f}m, max {deviation_metrics['deviation_max']:.5f}m, rms {deviation_metrics['deviation_rms']:.5f}m")
+
+        # render settings of workbench with texture color
+        scene = bpy.context.scene
+        scene.render.engine = 'BLENDER_WORKBENCH'
+        scene.render.resolution_x = QUALITY_RENDER_RESOLUTION
+        scene.render.resolution_y = QUALITY_RENDER_RESOLUTION
+        scene.render.resolution_percentage = 100
+        scene.render.film_transparent = True
+        scene.render.image_settings.file_format = 'PNG'
+        scene.render.image_settings.color_mode = 'RGBA'
+        scene.display.shading.light = 'STUDIO'
+        scene.display.shading.color_type = 'TEXTURE'
+
+        # orthographic camera that frames bounding box of original model
+        corners = [object_source.matrix_world @ Vector(corner) for corner in object_source.bound_box]
+        center = sum(corners, Vector()) / len(corners)
+        size = max((corner - center).length for corner in corners) * 2.0 or 1.0
+        camera_data = bpy.data.cameras.new(name="hololab_quality_camera")
+        camera_data.type = 'ORTHO'
+        camera_data.ortho_scale = size * 1.1
+        camera_data.clip_end = size * 4.0
+        object_camera = bpy.data.objects.new(name="hololab_quality_camera", object_data=camera_data)
+        scene.collection.objects.link(object_camera)
+        previous_camera = scene.camera
+        scene.camera = object_camera
+
+        # render only original or result model
+        hidden_objects = {o: o.hide_render for o in scene.objects}
+        views = []
+        try:
+            for view_name, direction in QUALITY_VIEWS:
+                direction = Vector(direction).normalized()
+                object_camera.location = center + direction * size * 2.0
+                object_camera.rotation_euler = (-direction).to_track_quat('-Z', 'Y').to_euler()
+                renders = []
+                for object_render in [object_source, object_target]:
+                    for o in scene.objects:
+                        o.hide_render = o != object_render
+                    renders.append(render_view_pixels(os.path.join(bpy.app.tempdir, f"hololab_quality_{view_name}.png")))
+                mask = (renders[0][..., 3] > 0.0) | (renders[1][..., 3] > 0.0)
+                views.append({"view": view_name, "psnr": compute_psnr(renders[0], renders[1], mask), "ssim": compute_ssim(renders[0], renders[1], mask)})
+        finally:
+            for o, hide_render in hidden_objects.items():
+                o.hide_render = hide_render
+            scene.camera = previous_camera
+            bpy.data.objects.remove(object_camera)
+            bpy.data.cameras.remove(camera_data)
+
+        job.metrics["views"] = views
+        job.metrics["psnr"] = min(view["psnr"] for view in views)
+        job.metrics["ssim"] = min(view["ssim"] for view in views)
+        self.report({'INFO'}, f"render psnr {job.metrics['psnr']:.2f}dB, ssim {job.metrics['ssim']:.4f} (worst view)")
+
+    def triangulate_faces(self, job):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # traiangulate faces
+        if self.mesh_processing in ('NUMPY', 'BMESH'):
+            triangulate_bmesh(job.object_target)
+        else:
+            triangulate_operator(job.object_target)
+
+    # get ratios (or triangle counts) of coarser lods
+    def get_lod_levels(self):
+        values = [value.strip() for value in self.lod_levels.split(",") if value.strip()]
+        if self.decimate_mode == 'TRIANGLES':
+            return [int(float(value)) for value in values]
+        return [float(value) for value in values]
+
+    # generate coarser lods progressively from previous lod with uv and textures of lod0
+    def generate_lod_chain(self, job):
+        levels = self.get_lod_levels()
+        if not levels:
+            return
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # lods belong to original source object (merged object is removed after run)
+        object_original = job.object_sources[0]
+        object_previous = job.object_target
+        previous_value = self.target_triangles if self.decimate_mode == 'TRIANGLES' else self.decimate_rate
+        for level, value in enumerate(levels, start=1):
+            start_time = time.perf_counter()
+
+            # decimate from previous lod
+            if self.decimate_mode == 'TRIANGLES':
+                ratio, triangles, _ = find_decimate_ratio(object_previous, value)
+                if triangles > value:
+                    self.report({'WARNING'}, f"LOD{level} can not be decimated to {value} triangles: {triangles} triangles")
+            else:
+                ratio = min(value / previous_value, 1.0) if previous_value > 0 else 1.0
+            mesh = decimate_mesh(object_previous.data, ratio)
+            mesh.name = f"{object_original.name}_LOD{level}"
+
+            # downsample textures of lod0 for lod
+            if self.lod_texture in ['DOWNSAMPLE', 'DOWNSAMPLE_LANCZOS']:
+                for index, material in enumerate(job.object_target.data.materials):
+                    if material is None or index >= len(mesh.materials):
+                        continue
+                    material_lod = material.copy()
+                    material_lod.name = f"{material.name}_LOD{level}"
+                    for node in material_lod.node_tree.nodes:
+                        if node.bl_idname == 'ShaderNodeTexImage' and node.image is not None:
+                            node.image = downsample_image(node.image, level, self.lod_texture == 'DOWNSAMPLE_LANCZOS')
+                    mesh.materials[index] = material_lod
+
+            # create lod object
+            object_lod = object_previous.copy()
+            object_lod.data = mesh
+            for collection in object_previous.users_collection:
+                collection.objects.link(object_lod)
+            object_lod.name = f"{object_original.name}_LOD{level}"
+            object_lod.hololab_result = True
+            object_lod.hololab_source = object_original
+            object_lod.hololab_lod_level = level
+            job.object_lods.append(object_lod)
+
+            _, _, triangles = get_mesh_counts(object_lod)
+            self.report({'INFO'}, f"LOD{level}: {triangles} triangles ({time.perf_counter() - start_time:.2f}s)")
+            object_previous = object_lod
+            previous_value = value
+
+    def export_gltf(self, job):
+        # select target object
+        bpy.ops.object.select_all(action='DESELECT')
+        object_target = job.object_target
+        object_target.select_set(True)
+        bpy.context.view_layer.objects.active = object_target
+
+        # this is workaround for the issue that gltf 2.0 does not export correctly.
+        # (background commands export results by themselves, so the workaround is skipped)
+        if self.export_directory == "":
+            if bpy.app.background:
+                return
+            temp_file = os.path.join(bpy.app.tempdir, "temp.glb")
+            bpy.ops.export_scene.gltf(filepath=temp_file, use_selection=True)
+            return
+
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}: {job.object_source.name}")
+
+        # export each lod to separate file
+        directory = bpy.path.abspath(self.export_directory)
+        os.makedirs(directory, exist_ok=True)
+        extension = ".glb" if self.export_format == 'GLB' else ".gltf"
+        export_options = get_gltf_export_options(self.export_format, self.export_compression, self.export_image_format, self.export_draco_level, self.export_draco_position_bits, self.export_draco_normal_bits, self.export_draco_texcoord_bits)
+        start_time = time.perf_counter()
+        export_size = 0
+        for level, object_lod in enumerate([object_target] + job.object_lods):
+            name = job.object_sources[0].name if level == 0 else f"{job.object_sources[0].name}_LOD{level}"
+            filepath = os.path.join(directory, f"{name}{extension}")
+            size = export_gltf_file([object_lod], filepath, export_options, self.export_compression == 'MESHOPT')
+            self.report({'INFO'}, f"{filepath}: {size / 1024:.1f}KB")
+            export_size += size
+        export_time = time.perf_counter() - start_time
+
+        job.metrics["export_size"] = export_size
+        job.metrics["export_time"] = export_time
+        self.report({'INFO'}, f"export size {export_size / 1024:.1f}KB ({export_time:.2f}s)")
+
+# get options of gltf exporter
+def get_gltf_export_options(export_format, compression, image_format, draco_level, draco_position_bits, draco_normal_bits, draco_texcoord_bits):
+    if image_format == 'WEBP' and bpy.app.version < (4, 1, 0):
+        raise Exception("webp texture of gltf requires blender 4.1 or later.")
+
+    export_options = {
+        "export_format": export_format,
+        "export_image_format": image_format,
+    }
+    if compression == 'DRACO':
+        export_options.update({
+            "export_draco_mesh_compression_enable": True,
+            "export_draco_mesh_compression_level": draco_level,
+            "export_draco_position_quantization": draco_position_bits,
+            "export_draco_normal_quantization": draco_normal_bits,
+            "export_draco_texcoord_quantization": draco_texcoord_bits,
+        })
+    return export_options
+
+# get size of gltf file and external buffers and images that are referenced by it
+def get_gltf_file_size(filepath):
+    size = os.path.getsize(filepath)
+    if not filepath.lower().endswith(".gltf"):
+        return size
+
+    with open(filepath, encoding="utf-8") as f:
+        gltf = json.load(f)
+    directory = os.path.dirname(filepath)
+    uris = set(item["uri"] for item in gltf.get("buffers", []) + gltf.get("images", []) if "uri" in item and not item["uri"].startswith("data:"))
+    for uri in uris:
+        uri_path = os.path.join(directory, bpy.path.native_pathsep(urllib.parse.unquote(uri)))
+        if os.path.exists(uri_path):
+            size += os.path.getsize(uri_path)
+    return size
+
+# export objects to gltf file (meshopt compression is applied by gltfpack) and return size of written files
+def export_gltf_file(objects, filepath, export_options, use_meshopt=False):
+    bpy.ops.object.select_all(action='DESELECT')
+    for o in objects:
+        o.select_set(True)
+    bpy.context.view_layer.objects.active = objects[0]
+
+    # external textures are written into directory of each model to avoid collision of same texture names
+    base_path, extension = os.path.splitext(filepath)
+    export_options = dict(export_options)
+    if export_options["export_format"] == 'GLTF_SEPARATE':
+        export_options["export_texture_dir"] = f"{os.path.basename(base_path)}_images"
+
+    if not use_meshopt:
+        bpy.ops.export_scene.gltf(filepath=filepath, use_selection=True, **export_options)
+        return get_gltf_file_size(filepath)
+
+    gltfpack_path = shutil.which("gltfpack")
+    if gltfpack_path is None:
+        raise Exception("gltfpack is not found in PATH.")
+
+    raw_path = f"{base_path}_raw{extension}"
+    bpy.ops.export_scene.gltf(filepath=raw_path, use_selection=True, **export_options)
+    try:
+        result = subprocess.run([gltfpack_path, "-i", raw_path, "-o", filepath, "-cc"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        if result.returncode != 0:
+            raise Exception(f"gltfpack failed: {result.stdout.decode(errors='replace').strip()}")
+    finally:
+        os.remove(raw_path)
+        if os.path.exists(f"{base_path}_raw.bin"):
+            os.remove(f"{base_path}_raw.bin")
+    return get_gltf_file_size(filepath)
+
+# get result objects that generated by moderate weight reduction
+def get_result_objects():
+    return [o for o in bpy.data.objects if o.type == 'MESH' and o.hololab_result]
+
+# get baked textures of result object
+def get_baked_textures(object_target):
+    textures = []
+    for material in object_target.data.materials:
+        if material is None or material.node_tree is None:
+            continue
+        for node in material.node_tree.nodes:
+            if node.bl_idname == 'ShaderNodeTexImage' and node.image is not None and node.image not in textures:
+                textures.append(node.image)
+    return textures
+
+# texture file formats (file format of image, extension)
+TEXTURE_FORMATS = {
+    'PNG': ('PNG', ".png"),
+    'JPEG': ('JPEG', ".jpg"),
+    'WEBP': ('WEBP', ".webp"),
+    'KTX2': ('PNG', ".ktx2"),
+}
+
+# lowest quality that is searched to fit texture file in max bytes
+TEXTURE_MIN_QUALITY = 10
+
+# lowest resolution that is searched to fit texture file in max bytes
+TEXTURE_MIN_RESOLUTION = 256
+
+# find local ktx2 encoder (toktx of KTX-Software or basisu of Basis Universal)
+def find_ktx2_encoder():
+    for encoder in ["toktx", "basisu"]:
+        encoder_path = shutil.which(encoder)
+        if encoder_path is not None:
+            return encoder_path
+    return None
+
+# encode png file to ktx2 file (basis universal etc1s with mipmaps) with local encoder
+def encode_ktx2(encoder_path, input_path, output_path, quality, non_color):
+    quality_level = max(1, min(255, quality * 255 // 100))
+    if os.path.basename(encoder_path).lower().startswith("toktx"):
+        command = [encoder_path, "--t2", "--encode", "etc1s", "--qlevel", str(quality_level), "--genmipmap"]
+        if non_color:
+            command += ["--assign_oetf", "linear"]
+        command += [output_path, input_path]
+    else:
+        command = [encoder_path, "-ktx2", "-mipmap", "-q", str(quality_level), "-output_file", output_path, input_path]
+        if non_color:
+            command.append("-linear")
+
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if result.returncode != 0:
+        raise Exception(f"ktx2 encoder failed: {result.stdout.decode(errors='replace').strip()}")
+
+# write image to file without image editor (pixels are copied to temporary image, so baked image is not changed)
+def write_image_file(image, filepath, file_format, quality, resolution):
+    width, height = image.size
+    pixels = image_to_array(image)
+
+    image_file = bpy.data.images.new(name=f"{image.name}_save", width=width, height=height, alpha=True)
+    try:
+        image_file.colorspace_settings.name = image.colorspace_settings.name
+        array_to_image(image_file, pixels)
+        if resolution < max(width, height):
+            image_file.scale(max(1, width * resolution // max(width, height)), max(1, height * resolution // max(width, height)))
+        image_file.file_format = file_format
+        image_file.save(filepath=filepath, quality=quality)
+    finally:
+        bpy.data.images.remove(image_file)
+
+# save texture file in format, searching quality and resolution that fit in max bytes (0 is not limited)
+def save_texture_file(image, directory, texture_format, quality, max_bytes, encoder_path=None):
+    file_format, extension = TEXTURE_FORMATS[texture_format]
+    filepath = os.path.join(directory, f"{image.name}{extension}")
+    non_color = image.colorspace_settings.name == 'Non-Color'
+    written = {"quality": quality, "resolution": max(image.size)}
+
+    def write(quality, resolution):
+        if texture_format == 'KTX2':
+            png_path = f"{os.path.splitext(filepath)[0]}_ktx2.png"
+            write_image_file(image, png_path, 'PNG', 100, resolution)
+            try:
+                encode_ktx2(encoder_path, png_path, filepath, quality, non_color)
+            finally:
+                os.remove(png_path)
+        else:
+            write_image_file(image, filepath, file_format, quality, resolution)
+        written["quality"] = quality
+        written["resolution"] = resolution
+        return os.path.getsize(filepath)
+
+    resolution = max(image.size)
+    while True:
+        size = write(quality, resolution)
+        if max_bytes <= 0 or size <= max_bytes:
+            break
+
+        # binary search highest quality that fits in max bytes at this resolution (png is lossless)
+        if texture_format != 'PNG':
+            low, high, best_quality = TEXTURE_MIN_QUALITY, quality - 1, 0
+            while low <= high:
+                middle = (low + high) // 2
+                size = write(middle, resolution)
+                if size <= max_bytes:
+                    best_quality = middle
+                    low = middle + 1
+                else:
+                    high = middle - 1
+            if best_quality > 0:
+                if written["quality"] != best_quality:
+                    size = write(best_quality, resolution)
+                break
+
+        # halve resolution and search again
+        if resolution // 2 < TEXTURE_MIN_RESOLUTION:
+            break
+        resolution //= 2
+
+    return {"texture": image.name, "filepath": filepath, "size": size, "quality": written["quality"], "resolution": written["resolution"]}
+
+# save baked textures of all result objects to directory
+def save_baked_textures(directory, texture_format, quality, max_bytes):
+    encoder_path = None
+    if texture_format == 'KTX2':
+        encoder_path = find_ktx2_encoder()
+        if encoder_path is None:
+            raise Exception("ktx2 encoder (toktx or basisu) is not found in PATH.")
+
+    os.makedirs(directory, exist_ok=True)
+    results = []
+    for object_target in get_result_objects():
+        for texture in get_baked_textures(object_target):
+            if texture.name in [result["texture"] for result in results]:
+                continue
+            results.append(save_texture_file(texture, directory, texture_format, quality, max_bytes, encoder_path))
+    return results
+
+class HOLOLAB_OT_ModerateWeightReduction(ModerateWeightReductionOperator, bpy.types.Operator):
+    bl_idname = "hololab.moderate_weight_reduction"
+    bl_label = "Moderate Weight Reduction Tools"
+    bl_description = "Generates models with reduced polygon mesh and optimized textures from the original model."
+    bl_options = {'REGISTER', 'UNDO'}
+
+class HOLOLAB_OT_ModerateWeightReductionLean(ModerateWeightReductionOperator, bpy.types.Operator):
+    bl_idname = "hololab.moderate_weight_reduction_lean"
+    bl_label = "Moderate Weight Reduction Tools (Lean)"
+    bl_description = "Generates models with reduced polygon mesh and optimized textures from the original model without undo step to save memory."
+    bl_options = {'REGISTER'}
+    lean_mode = True
+
+class HOLOLAB_OT_SaveBakedTexture(bpy.types.Operator):
+    bl_idname = "hololab.save_baked_texture"
+    bl_label = "Save Baked Texture"
+    bl_description = "Save baked texture to PNG, JPEG, WebP or KTX2 file for export the model as FBX file."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    directory: bpy.props.StringProperty(
+        name="directory_path",
+        default="",
+        maxlen=1024,
+        subtype='DIR_PATH',
+        description="",
+    )
+
+    filter_folder: bpy.props.BoolProperty(
+        default=True,
+        options={'HIDDEN'},
+    )
+
+    file_format: bpy.props.EnumProperty(
+        name="file_format",
+        description="File format of saved texture.",
+        default="PNG",
+        items=[
+            ("PNG", "PNG", "Lossless PNG file."),
+            ("JPEG", "JPEG", "Lossy JPEG file (alpha is not saved)."),
+            ("WEBP", "WebP", "Lossy WebP file."),
+            ("KTX2", "KTX2", "Basis Universal KTX2 file encoded with local toktx or basisu.")
+        ]
+    )
+
+    quality: bpy.props.IntProperty(
+        name="quality",
+        description="Quality of lossy compression.",
+        default=90,
+        min=1,
+        max=100
+    )
+
+    max_size: bpy.props.IntProperty(
+        name="max_size",
+        description="Maximum size of each texture file in KB. Quality and resolution are lowered to fit. (0 is not limited.)",
+        default=0,
+        min=0
+    )
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        self.report({'INFO'}, "execute save baked texture function")
+        self.report({'INFO'}, f"{self.file_format=}")
+        self.report({'INFO'}, f"{self.quality=}")
+        self.report({'INFO'}, f"{self.max_size=}")
+
+        previous_language = bpy.context.preferences.view.language
+        bpy.context.preferences.view.language = 'en_US'
+
+        try:
+            results = save_baked_textures(bpy.path.abspath(self.directory), self.file_format, self.quality, self.max_size * 1024)
+            for result in results:
+                self.report({'INFO'}, f"{result['filepath']}: {result['size'] / 1024:.1f}KB (quality {result['quality']}, {result['resolution']}px)")
+                if self.max_size > 0 and result["size"] > self.max_size * 1024:
+                    self.report({'WARNING'}, f"{result['texture']} does not fit in {self.max_size}KB.")
+        except Exception as e:
+            self.report({'ERROR'}, f"{e}")
+            return {'CANCELLED'}
+        finally:
+            bpy.context.preferences.view.language = previous_language
+
+        return {'FINISHED'}
+
+class HOLOLAB_OT_DeleteOriginal(bpy.types.Operator):
+    bl_idname = "hololab.delete_original"
+    bl_label = "Delete Original"
+    bl_description = "Delete unnecessary original object and tetextures from project for export the model as USDZ file."
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        self.report({'INFO'}, "execute delete Original object and texture function")
+
+        previous_language = bpy.context.preferences.view.language
+        bpy.context.preferences.view.language = 'en_US'
+
+        try:
+            object_targets = get_result_objects()
+            self.delete_texture(object_targets)
+            self.delete_object(object_targets)
+        except Exception as e:
+            self.report({'ERROR'}, f"{e}")
+            return {'CANCELLED'}
+        finally:
+            bpy.context.preferences.view.language = previous_language
+
+        return {'FINISHED'}
+
+    # delete texture
+    def delete_texture(self, object_targets):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+
+        # get baked texture names
+        texture_names = [texture.name for o in object_targets for texture in get_baked_textures(o)]
+        if not texture_names:
+            return
+
+        # delete all textures without baked textures
+        images = [image for image in bpy.data.images if image.name not in texture_names]
+        for image in images:
+            bpy.data.images.remove(image=image)
+
+    # delete object
+    def delete_object(self, object_targets):
+        self.report({'INFO'}, f"{sys._getframe().f_code.co_name}")
+
+        # get source objects
+        object_sources = [o.hololab_source for o in object_targets if o.hololab_source is not None]
+        object_sources += [o for o in bpy.data.objects if o.hololab_merged_result in object_targets and o not in object_sources]
+        if not object_sources:
+            return
+
+        # delete object
+        with bpy.context.temp_override(selected_objects=object_sources):
+            bpy.ops.object.delete()
+
+class HOLOLAB_PT_SideBar(bpy.types.Panel):
+    bl_idname = "HOLOLAB_PT_SideBar"
+    bl_label = "HoloLab"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "HoloLab"
+
+    def draw_header(self, context):
         layout = self.layout
         layout.label(text="Moderate Weight Reduction Tools", icon='PLUGIN')
 
@@ -503,23 +3346,150 @@ class HOLOLAB_PT_SideBar(bpy.types.Panel):
         box = layout.box()
         box.label(text="Mesh Setting:")
         box.prop(scene, "remove_doubles")
-        box.prop(scene, "decimate_rate")
+        if scene.remove_doubles:
+            box.prop(scene, "remove_doubles_threshold")
+        box.prop(scene, "mesh_processing")
+        box.prop(scene, "merge_mode")
+        if scene.merge_mode == 'COLLECTION':
+            box.prop_search(scene, "merge_collection", bpy.data, "collections")
+        box.prop(scene, "decimate_mode")
+        if scene.decimate_mode == 'TRIANGLES':
+            box.prop(scene, "target_triangles")
+        else:
+            box.prop(scene, "decimate_rate")
+        box.prop(scene, "lod_levels")
+        box.prop(scene, "lod_texture")
 
         box = layout.box()
         box.label(text="Texture Setting:")
         box.prop(scene, "texture_name")
         box.prop(scene, "texture_resolution")
 
-        op = layout.operator(HOLOLAB_OT_ModerateWeightReduction.bl_idname, text='Start', icon='PLAY')
+        box = layout.box()
+        box.label(text="UV Setting:")
+        box.prop(scene, "uv_method")
+        box.prop(scene, "uv_island_margin")
+        box.prop(scene, "uv_pack_islands")
+        if scene.uv_pack_islands:
+            box.prop(scene, "uv_pack_rotate")
+        box.prop(scene, "uv_texel_density")
+
+        box = layout.box()
+        box.label(text="Bake Setting:")
+        box.prop(scene, "bake_normal")
+        box.prop(scene, "bake_roughness")
+        box.prop(scene, "bake_metallic")
+        box.prop(scene, "bake_ao")
+        box.prop(scene, "pack_orm")
+        box.prop(scene, "bake_profile")
+        box.prop(scene, "bake_threads")
+        box.prop(scene, "bake_tile_size")
+        box.prop(scene, "bake_method")
+        if scene.bake_method == 'CYCLES':
+            box.prop(scene, "bake_ray_mode")
+            if scene.bake_ray_mode == 'FIXED':
+                box.prop(scene, "bake_cage_extrusion")
+            box.prop(scene, "bake_check_missed_texels")
+
+        box = layout.box()
+        box.label(text="Cache Setting:")
+        box.prop(scene, "use_cache")
+        box.prop(scene, "cache_directory")
+        box.prop(scene, "cache_max_size")
+
+        box = layout.box()
+        box.label(text="Report Setting:")
+        box.prop(scene, "report_directory")
+        box.prop(scene, "profile_stage")
+        box.prop(scene, "measure_quality")
+
+        box = layout.box()
+        box.label(text="Memory Setting:")
+        box.prop(scene, "lean_mode")
+
+        box = layout.box()
+        box.label(text="glTF Setting:")
+        box.prop(scene, "export_directory")
+        box.prop(scene, "export_format")
+        box.prop(scene, "export_compression")
+        if scene.export_compression == 'DRACO':
+            box.prop(scene, "export_draco_level")
+            box.prop(scene, "export_draco_position_bits")
+            box.prop(scene, "export_draco_normal_bits")
+            box.prop(scene, "export_draco_texcoord_bits")
+        box.prop(scene, "export_image_format")
+
+        # progress of modal run
+        window_manager = context.window_manager
+        if window_manager.hololab_running:
+            box = layout.box()
+            box.label(text=f"Running: {window_manager.hololab_stage}")
+            box.prop(window_manager, "hololab_progress", slider=True)
+            eta = f"{window_manager.hololab_eta:.0f}s" if window_manager.hololab_eta >= 0.0 else "-"
+            box.label(text=f"Elapsed: {window_manager.hololab_elapsed:.0f}s  ETA: {eta}")
+            box.label(text="Press Esc to cancel.")
+
+        row = layout.row()
+        row.enabled = not window_manager.hololab_running
+        operator_class = HOLOLAB_OT_ModerateWeightReductionLean if scene.lean_mode else HOLOLAB_OT_ModerateWeightReduction
+        op = row.operator(operator_class.bl_idname, text='Start', icon='PLAY')
         op.remove_doubles = scene.remove_doubles
+        op.remove_doubles_threshold = scene.remove_doubles_threshold
+        op.mesh_processing = scene.mesh_processing
+        op.merge_mode = scene.merge_mode
+        op.merge_collection = scene.merge_collection
+        op.decimate_mode = scene.decimate_mode
+        op.target_triangles = scene.target_triangles
         op.decimate_rate = scene.decimate_rate
+        op.lod_levels = scene.lod_levels
+        op.lod_texture = scene.lod_texture
         op.texture_name = scene.texture_name
         op.texture_resolution = scene.texture_resolution
+        op.uv_method = scene.uv_method
+        op.uv_island_margin = scene.uv_island_margin
+        op.uv_pack_islands = scene.uv_pack_islands
+        op.uv_pack_rotate = scene.uv_pack_rotate
+        op.uv_texel_density = scene.uv_texel_density
+        op.bake_normal = scene.bake_normal
+        op.bake_roughness = scene.bake_roughness
+        op.bake_metallic = scene.bake_metallic
+        op.bake_ao = scene.bake_ao
+        op.pack_orm = scene.pack_orm
+        op.bake_profile = scene.bake_profile
+        op.bake_threads = scene.bake_threads
+        op.bake_tile_size = scene.bake_tile_size
+        op.bake_method = scene.bake_method
+        op.bake_ray_mode = scene.bake_ray_mode
+        op.bake_cage_extrusion = scene.bake_cage_extrusion
+        op.bake_check_missed_texels = scene.bake_check_missed_texels
+        op.use_cache = scene.use_cache
+        op.cache_directory = scene.cache_directory
+        op.cache_max_size = scene.cache_max_size
+        op.report_directory = scene.report_directory
+        op.profile_stage = scene.profile_stage
+        op.measure_quality = scene.measure_quality
+        op.export_directory = scene.export_directory
+        op.export_format = scene.export_format
+        op.export_compression = scene.export_compression
+        op.export_image_format = scene.export_image_format
+        op.export_draco_level = scene.export_draco_level
+        op.export_draco_position_bits = scene.export_draco_position_bits
+        op.export_draco_normal_bits = scene.export_draco_normal_bits
+        op.export_draco_texcoord_bits = scene.export_draco_texcoord_bits
 
         layout.separator()
         layout.label(text="Export:")
 
+        box = layout.box()
+        box.prop(scene, "save_texture_format")
+        if scene.save_texture_format != 'PNG':
+            box.prop(scene, "save_texture_quality")
+        box.prop(scene, "save_texture_max_size")
+
         op = layout.operator(HOLOLAB_OT_SaveBakedTexture.bl_idname, text='Texture', icon='FILE_TICK')
+        op.file_format = scene.save_texture_format
+        op.quality = scene.save_texture_quality
+        op.max_size = scene.save_texture_max_size
 
         layout.label(text="Delete:")
 
@@ -537,6 +3507,59 @@ def register_properies():
         default=False
     )
 
+    scene.remove_doubles_threshold = bpy.props.FloatProperty(
+        name="Merge Distance",
+        description="Maximum distance between vertices to be joined.",
+        default=0.001,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    scene.mesh_processing = bpy.props.EnumProperty(
+        name="Mesh Processing",
+        description="Method of mesh integration and triangulation.",
+        default="BMESH",
+        items=[
+            ("NUMPY", "NumPy", "Weld vertices within merge distance found by vectorized grid search and triangulate with bmesh."),
+            ("BMESH", "BMesh", "Process mesh data directly without entering edit mode."),
+            ("OPERATOR", "Operator", "Process mesh with edit mode operators.")
+        ]
+    )
+
+    scene.merge_mode = bpy.props.EnumProperty(
+        name="Merge Mode",
+        description="Reduce source objects separately or join them into one result with one texture.",
+        default="SEPARATE",
+        items=[
+            ("SEPARATE", "Separate", "Reduce each selected object into its own result."),
+            ("SELECTION", "Selection", "Join selected objects into one result with one texture."),
+            ("COLLECTION", "Collection", "Join mesh objects in collection into one result with one texture.")
+        ]
+    )
+
+    scene.merge_collection = bpy.props.StringProperty(
+        name="Collection",
+        description="Name of collection whose mesh objects are joined.",
+        default=""
+    )
+
+    scene.decimate_mode = bpy.props.EnumProperty(
+        name="Reduction Mode",
+        description="Specify polygon mesh left after reduction by ratio or triangle count.",
+        default="RATIO",
+        items=[
+            ("RATIO", "Ratio", "Ratio of polygon mesh left after reduction."),
+            ("TRIANGLES", "Triangle Count", "Triangle count left after reduction.")
+        ]
+    )
+
+    scene.target_triangles = bpy.props.IntProperty(
+        name="Triangle Count",
+        description="Maximum triangle count left after reduction.",
+        default=20000,
+        min=4
+    )
+
     scene.decimate_rate = bpy.props.FloatProperty(
         name="Rate of Polygon Left",
         description="Ratio of polygon mesh left after reduction.",
@@ -545,6 +3568,23 @@ def register_properies():
         max=1.0
     )
 
+    scene.lod_levels = bpy.props.StringProperty(
+        name="LOD Levels",
+        description="Comma separated ratios (or triangle counts) of coarser LODs. Each LOD is decimated from previous LOD and reuses its UV and textures.",
+        default=""
+    )
+
+    scene.lod_texture = bpy.props.EnumProperty(
+        name="LOD Texture",
+        description="Textures of coarser LODs.",
+        default="SHARE",
+        items=[
+            ("SHARE", "Share", "Coarser LODs share material and textures of LOD0."),
+            ("DOWNSAMPLE", "Downsample", "Textures of coarser LODs are downsampled to half resolution per level with box filter."),
+            ("DOWNSAMPLE_LANCZOS", "Downsample (Lanczos)", "Textures of coarser LODs are downsampled to half resolution per level with lanczos filter.")
+        ]
+    )
+
     scene.texture_name = bpy.props.StringProperty(
         name="Name",
         description="Name of new texture.",
@@ -558,22 +3598,430 @@ def register_properies():
         items=[
             ("256", "256 x 256", "256 x 256"),
             ("512", "512 x 512", "512 x 512"),
+            ("1024", "1024 x 1024", "1024 x 1024"),
+            ("2048", "2048 x 2048", "2048 x 2048"),
+            ("4096", "4096 x 4096", "4096 x 4096"),
+            ("8192", "8192 x 8192", "8192 x 8192"),
+            ("16384", "16384 x 16384", "16384 x 16384")
+        ]
+    )
+
+    scene.uv_method = bpy.props.EnumProperty(
+        name="Method",
+        description="Method of uv unwrap.",
+        default="SMART_PROJECT",
+        items=[
+            ("SMART_PROJECT", "Smart UV Project", "Unwrap islands split by angle."),
+            ("LIGHTMAP", "Lightmap Pack", "Fast unwrap with one island per face for already low poly mesh.")
+        ]
+    )
+
+    scene.uv_island_margin = bpy.props.FloatProperty(
+        name="Island Margin",
+        description="Margin between uv islands.",
+        default=0.001,
+        min=0.0,
+        max=1.0
+    )
+
+    scene.uv_pack_islands = bpy.props.BoolProperty(
+        name="Pack Islands",
+        description="Pack uv islands to fill texture space.",
+        default=False
+    )
+
+    scene.uv_pack_rotate = bpy.props.BoolProperty(
+        name="Rotate",
+        description="Rotate uv islands for best fit in packing.",
+        default=True
+    )
+
+    scene.uv_texel_density = bpy.props.FloatProperty(
+        name="Texel Density (px/m)",
+        description="Texel density (pixels per meter) that selects texture resolution. (0 uses resolution setting.)",
+        default=0.0,
+        min=0.0
+    )
+
+    scene.bake_normal = bpy.props.BoolProperty(
+        name="Normal",
+        description="Bake tangent space normal map.",
+        default=False
+    )
+
+    scene.bake_roughness = bpy.props.BoolProperty(
+        name="Roughness",
+        description="Bake roughness map.",
+        default=False
+    )
+
+    scene.bake_metallic = bpy.props.BoolProperty(
+        name="Metallic",
+        description="Bake metallic map.",
+        default=False
+    )
+
+    scene.bake_ao = bpy.props.BoolProperty(
+        name="Ambient Occlusion",
+        description="Bake ambient occlusion map.",
+        default=False
+    )
+
+    scene.pack_orm = bpy.props.BoolProperty(
+        name="Pack ORM",
+        description="Bake ambient occlusion, roughness and metallic and pack them into one ORM texture.",
+        default=False
+    )
+
+    scene.bake_profile = bpy.props.EnumProperty(
+        name="Profile",
+        description="Quality profile of bake.",
+        default="FINAL",
+        items=[
+            ("PREVIEW", "Preview", "Fast bake with 1 sample and low resolution texture."),
+            ("FINAL", "Final", "Bake with samples tuned for each map.")
+        ]
+    )
+
+    scene.bake_threads = bpy.props.IntProperty(
+        name="Threads",
+        description="Number of CPU threads of bake. (0 is all cores.)",
+        default=0,
+        min=0,
+        max=1024
+    )
+
+    scene.bake_tile_size = bpy.props.EnumProperty(
+        name="Tile Size",
+        description="Textures larger than tile size are baked tile by tile in uv space to bound memory usage.",
+        default="4096",
+        items=[
             ("1024", "1024 x 1024", "1024 x 1024"),
             ("2048", "2048 x 2048", "2048 x 2048"),
             ("4096", "4096 x 4096", "4096 x 4096")
         ]
     )
 
+    scene.bake_method = bpy.props.EnumProperty(
+        name="Method",
+        description="Method to create base color texture.",
+        default="CYCLES",
+        items=[
+            ("CYCLES", "Cycles Bake", "Bake maps with selected to active bake of cycles."),
+            ("TRANSFER", "Fast Transfer", "Transfer base color of image texture or color attribute from nearest surface of original mesh without render engine.")
+        ]
+    )
+
+    scene.bake_ray_mode = bpy.props.EnumProperty(
+        name="Ray Mode",
+        description="How extrusion and max ray distance of bake are decided.",
+        default="FIXED",
+        items=[
+            ("FIXED", "Fixed", "Use fixed cage extrusion."),
+            ("AUTO", "Auto", "Derive extrusion and max ray distance from deviation between original and reduced mesh."),
+            ("CAGE", "Auto Cage", "Derive extrusion from deviation and bake with explicit cage object.")
+        ]
+    )
+
+    scene.bake_cage_extrusion = bpy.props.FloatProperty(
+        name="Extrusion",
+        description="Cage extrusion of fixed ray mode.",
+        default=0.1,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    scene.bake_check_missed_texels = bpy.props.BoolProperty(
+        name="Check Missed Texels",
+        description="Report ratio of texels whose rays missed original mesh after bake.",
+        default=True
+    )
+
+    scene.measure_quality = bpy.props.BoolProperty(
+        name="Measure Quality",
+        description="Measure geometric deviation and render difference (PSNR and SSIM) between original and result models after bake.",
+        default=False
+    )
+
+    scene.lean_mode = bpy.props.BoolProperty(
+        name="Lean Mode",
+        description="Run without undo step, free high poly mesh after reduction and purge orphan data after reduction and bake.",
+        default=False
+    )
+
+    scene.use_cache = bpy.props.BoolProperty(
+        name="Use Cache",
+        description="Reuse result of same source mesh, textures and settings from cache.",
+        default=False
+    )
+
+    scene.cache_directory = bpy.props.StringProperty(
+        name="Directory",
+        description="Directory of result cache. (Empty is user data directory.)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    scene.cache_max_size = bpy.props.IntProperty(
+        name="Max Size (MB)",
+        description="Maximum size of result cache in MB. Least recently used results are removed.",
+        default=4096,
+        min=1
+    )
+
+    scene.report_directory = bpy.props.StringProperty(
+        name="Directory",
+        description="Directory to write timing and memory report of each stage. (Empty is not written.)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    scene.profile_stage = bpy.props.EnumProperty(
+        name="Profile Stage",
+        description="Stage to capture cProfile statistics into report directory.",
+        default="NONE",
+        items=[
+            ("NONE", "None", "Do not capture cProfile statistics."),
+            ("clone_target_object", "Clone", "clone_target_object"),
+            ("integration_polygon", "Mesh Integration", "integration_polygon"),
+            ("reduction_polygon", "Reduction", "reduction_polygon"),
+            ("expand_uv", "UV", "expand_uv"),
+            ("set_material_and_texture", "Material", "set_material_and_texture"),
+            ("apply_auto_smooth", "Auto Smooth", "apply_auto_smooth"),
+            ("settings_bake_configurations", "Bake Settings", "settings_bake_configurations"),
+            ("execute_bake", "Bake", "execute_bake"),
+            ("measure_quality_metrics", "Quality", "measure_quality_metrics"),
+            ("purge_orphan_data", "Purge", "purge_orphan_data"),
+            ("triangulate_faces", "Triangulate", "triangulate_faces"),
+            ("export_gltf", "Export", "export_gltf")
+        ]
+    )
+
+    scene.export_directory = bpy.props.StringProperty(
+        name="Directory",
+        description="Directory to export reduced models as glTF files. (If empty, models are not exported.)",
+        default="",
+        maxlen=1024,
+        subtype='DIR_PATH'
+    )
+
+    scene.export_format = bpy.props.EnumProperty(
+        name="Format",
+        description="Format of exported glTF files.",
+        default="GLB",
+        items=[
+            ("GLB", "glTF Binary (.glb)", "Mesh and textures are embedded in one file."),
+            ("GLTF_SEPARATE", "glTF Separate (.gltf + .bin + textures)", "Mesh and textures are written as external files.")
+        ]
+    )
+
+    scene.export_compression = bpy.props.EnumProperty(
+        name="Compression",
+        description="Compression of mesh data.",
+        default="NONE",
+        items=[
+            ("NONE", "None", "Do not compress mesh data."),
+            ("DRACO", "Draco", "Compress mesh data with Draco (KHR_draco_mesh_compression)."),
+            ("MESHOPT", "Meshopt", "Compress mesh data with gltfpack (EXT_meshopt_compression). gltfpack must be found in PATH.")
+        ]
+    )
+
+    scene.export_image_format = bpy.props.EnumProperty(
+        name="Image Format",
+        description="Format of textures in exported glTF files.",
+        default="AUTO",
+        items=[
+            ("AUTO", "Automatic", "Save PNG textures as PNG and JPEG textures as JPEG."),
+            ("JPEG", "JPEG", "Save textures as JPEG."),
+            ("WEBP", "WebP", "Save textures as WebP. (Blender 4.1 or later.)")
+        ]
+    )
+
+    scene.export_draco_level = bpy.props.IntProperty(
+        name="Draco Level",
+        description="Compression level of Draco (higher is smaller and slower).",
+        default=6,
+        min=0,
+        max=10
+    )
+
+    scene.export_draco_position_bits = bpy.props.IntProperty(
+        name="Position Bits",
+        description="Quantization bits of position.",
+        default=14,
+        min=0,
+        max=30
+    )
+
+    scene.export_draco_normal_bits = bpy.props.IntProperty(
+        name="Normal Bits",
+        description="Quantization bits of normal.",
+        default=10,
+        min=0,
+        max=30
+    )
+
+    scene.export_draco_texcoord_bits = bpy.props.IntProperty(
+        name="Texcoord Bits",
+        description="Quantization bits of texture coordinates.",
+        default=12,
+        min=0,
+        max=30
+    )
+
+    scene.save_texture_format = bpy.props.EnumProperty(
+        name="Format",
+        description="File format of saved texture.",
+        default="PNG",
+        items=[
+            ("PNG", "PNG", "Lossless PNG file."),
+            ("JPEG", "JPEG", "Lossy JPEG file (alpha is not saved)."),
+            ("WEBP", "WebP", "Lossy WebP file."),
+            ("KTX2", "KTX2", "Basis Universal KTX2 file encoded with local toktx or basisu.")
+        ]
+    )
+
+    scene.save_texture_quality = bpy.props.IntProperty(
+        name="Quality",
+        description="Quality of lossy compression.",
+        default=90,
+        min=1,
+        max=100
+    )
+
+    scene.save_texture_max_size = bpy.props.IntProperty(
+        name="Max Size (KB)",
+        description="Maximum size of each texture file in KB. Quality and resolution are lowered to fit. (0 is not limited.)",
+        default=0,
+        min=0
+    )
+
+    window_manager = bpy.types.WindowManager
+
+    window_manager.hololab_running = bpy.props.BoolProperty(
+        name="Running",
+        description="Moderate weight reduction is running.",
+        default=False
+    )
+
+    window_manager.hololab_stage = bpy.props.StringProperty(
+        name="Stage",
+        description="Stage that runs next.",
+        default=""
+    )
+
+    window_manager.hololab_progress = bpy.props.FloatProperty(
+        name="Progress",
+        description="Progress of moderate weight reduction.",
+        default=0.0,
+        min=0.0,
+        max=100.0,
+        subtype='PERCENTAGE'
+    )
+
+    window_manager.hololab_elapsed = bpy.props.FloatProperty(
+        name="Elapsed",
+        description="Elapsed time of moderate weight reduction.",
+        default=0.0
+    )
+
+    window_manager.hololab_eta = bpy.props.FloatProperty(
+        name="ETA",
+        description="Estimated remaining time based on previous runs.",
+        default=-1.0
+    )
+
+    bpy.types.Object.hololab_result = bpy.props.BoolProperty(
+        name="Result",
+        description="Object is generated by moderate weight reduction.",
+        default=False
+    )
+
+    bpy.types.Object.hololab_source = bpy.props.PointerProperty(
+        name="Source",
+        description="Source object of generated object.",
+        type=bpy.types.Object
+    )
+
+    bpy.types.Object.hololab_merged_result = bpy.props.PointerProperty(
+        name="Merged Result",
+        description="Generated object that this object is joined into.",
+        type=bpy.types.Object
+    )
+
+    bpy.types.Object.hololab_lod_level = bpy.props.IntProperty(
+        name="LOD Level",
+        description="LOD level of generated object.",
+        default=0,
+        min=0
+    )
+
 def unregister_properies():
     scene = bpy.types.Scene
 
     del scene.remove_doubles
+    del scene.remove_doubles_threshold
+    del scene.mesh_processing
+    del scene.merge_mode
+    del scene.merge_collection
+    del scene.decimate_mode
+    del scene.target_triangles
     del scene.decimate_rate
+    del scene.lod_levels
+    del scene.lod_texture
     del scene.texture_name
     del scene.texture_resolution
+    del scene.uv_method
+    del scene.uv_island_margin
+    del scene.uv_pack_islands
+    del scene.uv_pack_rotate
+    del scene.uv_texel_density
+    del scene.bake_normal
+    del scene.bake_roughness
+    del scene.bake_metallic
+    del scene.bake_ao
+    del scene.pack_orm
+    del scene.bake_profile
+    del scene.bake_threads
+    del scene.bake_tile_size
+    del scene.bake_method
+    del scene.bake_ray_mode
+    del scene.bake_cage_extrusion
+    del scene.bake_check_missed_texels
+    del scene.measure_quality
+    del scene.lean_mode
+    del scene.use_cache
+    del scene.cache_directory
+    del scene.cache_max_size
+    del scene.report_directory
+    del scene.profile_stage
+    del scene.export_directory
+    del scene.export_format
+    del scene.export_compression
+    del scene.export_image_format
+    del scene.export_draco_level
+    del scene.export_draco_position_bits
+    del scene.export_draco_normal_bits
+    del scene.export_draco_texcoord_bits
+    del scene.save_texture_format
+    del scene.save_texture_quality
+    del scene.save_texture_max_size
+
+    window_manager = bpy.types.WindowManager
+    del window_manager.hololab_running
+    del window_manager.hololab_stage
+    del window_manager.hololab_progress
+    del window_manager.hololab_elapsed
+    del window_manager.hololab_eta
+
+    del bpy.types.Object.hololab_result
+    del bpy.types.Object.hololab_source
+    del bpy.types.Object.hololab_merged_result
+    del bpy.types.Object.hololab_lod_level
 
 classes = [
     HOLOLAB_OT_ModerateWeightReduction,
+    HOLOLAB_OT_ModerateWeightReductionLean,
     HOLOLAB_OT_SaveBakedTexture,
     HOLOLAB_OT_DeleteOriginal,
     HOLOLAB_PT_SideBar
@@ -589,5 +4037,804 @@ def unregister():
     for c in reversed(classes):
         bpy.utils.unregister_class(c)
 
+# supported source model formats in batch mode
+SOURCE_EXTENSIONS = (".glb", ".gltf", ".fbx", ".obj", ".blend")
+
+# status of jobs in queue of serve command
+JOB_STATUSES = ["queued", "running", "succeeded", "failed"]
+
+# add operator settings to command line parser
+def add_operator_arguments(parser):
+    parser.add_argument("--remove-doubles", action="store_true", help="If the mesh is split, overlapping vertices are joined.")
+    parser.add_argument("--remove-doubles-threshold", type=float, default=0.001, help="Maximum distance between vertices to be joined.")
+    parser.add_argument("--mesh-processing", default="BMESH", choices=["NUMPY", "BMESH", "OPERATOR"], help="Method of mesh integration and triangulation.")
+    parser.add_argument("--merge-objects", action="store_true", help="Keep mesh objects of model separate and decimate them with triangle budget split by surface area (one texture atlas).")
+    parser.add_argument("--target-triangles", type=int, default=0, help="Triangle count left after reduction (overrides --decimate-rate).")
+    parser.add_argument("--decimate-rate", type=float, default=0.05, help="Ratio of polygon mesh left after reduction.")
+    parser.add_argument("--lod-levels", default="", help="Comma separated ratios (or triangle counts) of coarser LODs.")
+    parser.add_argument("--lod-texture", default="SHARE", choices=["SHARE", "DOWNSAMPLE", "DOWNSAMPLE_LANCZOS"], help="Textures of coarser LODs.")
+    parser.add_argument("--texture-name", default="texture", help="Name of new texture.")
+    parser.add_argument("--texture-resolution", default="1024", choices=["256", "512", "1024", "2048", "4096", "8192", "16384"], help="Resolution of new texture.")
+    parser.add_argument("--uv-method", default="SMART_PROJECT", choices=["SMART_PROJECT", "LIGHTMAP"], help="Method of uv unwrap.")
+    parser.add_argument("--uv-island-margin", type=float, default=0.001, help="Margin between uv islands.")
+    parser.add_argument("--uv-pack-islands", action="store_true", help="Pack uv islands to fill texture space.")
+    parser.add_argument("--uv-texel-density", type=float, default=0.0, help="Texel density (pixels per meter) that selects texture resolution.")
+    parser.add_argument("--bake-normal", action="store_true", help="Bake tangent space normal map.")
+    parser.add_argument("--bake-roughness", action="store_true", help="Bake roughness map.")
+    parser.add_argument("--bake-metallic", action="store_true", help="Bake metallic map.")
+    parser.add_argument("--bake-ao", action="store_true", help="Bake ambient occlusion map.")
+    parser.add_argument("--pack-orm", action="store_true", help="Bake ambient occlusion, roughness and metallic and pack them into one ORM texture.")
+    parser.add_argument("--bake-profile", default="FINAL", choices=["PREVIEW", "FINAL"], help="Quality profile of bake.")
+    parser.add_argument("--bake-tile-size", default="4096", choices=["1024", "2048", "4096"], help="Textures larger than tile size are baked tile by tile.")
+    parser.add_argument("--bake-method", default="CYCLES", choices=["CYCLES", "TRANSFER"], help="Method to create base color texture.")
+    parser.add_argument("--bake-ray-mode", default="FIXED", choices=["FIXED", "AUTO", "CAGE"], help="How extrusion and max ray distance of bake are decided.")
+    parser.add_argument("--bake-cage-extrusion", type=float, default=0.1, help="Cage extrusion of fixed ray mode.")
+    parser.add_argument("--no-check-missed-texels", action="store_true", help="Do not check ratio of texels whose rays missed original mesh.")
+    parser.add_argument("--cache-directory", default="", help="Reuse results of same source models and settings from cache in this directory.")
+    parser.add_argument("--cache-max-size", type=int, default=4096, help="Maximum size of result cache in MB.")
+    parser.add_argument("--report-directory", default="", help="Directory to write timing and memory report of each stage.")
+    parser.add_argument("--profile-stage", default="NONE", help="Stage to capture cProfile statistics into report directory.")
+    parser.add_argument("--measure-quality", action="store_true", help="Measure geometric deviation and render difference between original and result models.")
+    parser.add_argument("--lean", action="store_true", help="Run without undo step and purge intermediate data to save memory.")
+    parser.add_argument("--export-format", default="GLB", choices=["GLB", "GLTF_SEPARATE"], help="Format of exported glTF files.")
+    parser.add_argument("--export-compression", default="NONE", choices=["NONE", "DRACO", "MESHOPT"], help="Compression of mesh data.")
+    parser.add_argument("--export-image-format", default="AUTO", choices=["AUTO", "JPEG", "WEBP"], help="Format of textures in exported glTF files.")
+    parser.add_argument("--export-draco-level", type=int, default=6, help="Compression level of Draco.")
+    parser.add_argument("--export-draco-position-bits", type=int, default=14, help="Quantization bits of position.")
+    parser.add_argument("--export-draco-normal-bits", type=int, default=10, help="Quantization bits of normal.")
+    parser.add_argument("--export-draco-texcoord-bits", type=int, default=12, help="Quantization bits of texture coordinates.")
+
+# add settings of saved textures to command line parser
+def add_texture_arguments(parser):
+    parser.add_argument("--save-textures", action="store_true", help="save baked textures of each model to <name>_textures directory.")
+    parser.add_argument("--save-texture-format", default="PNG", choices=["PNG", "JPEG", "WEBP", "KTX2"], help="file format of saved textures.")
+    parser.add_argument("--save-texture-quality", type=int, default=90, help="quality of lossy compression of saved textures.")
+    parser.add_argument("--save-texture-max-size", type=int, default=0, help="maximum size of each saved texture file in KB.")
+
+# convert command line arguments to settings of saved textures (none if textures are not saved)
+def texture_settings(args):
+    if not args.save_textures:
+        return None
+    return {
+        "file_format": args.save_texture_format,
+        "quality": args.save_texture_quality,
+        "max_size": args.save_texture_max_size,
+    }
+
+# convert command line arguments to operator settings
+def operator_settings(args):
+    return {
+        "remove_doubles": args.remove_doubles,
+        "remove_doubles_threshold": args.remove_doubles_threshold,
+        "mesh_processing": args.mesh_processing,
+        "merge_mode": 'SELECTION' if args.merge_objects else 'SEPARATE',
+        "merge_collection": "",
+        "decimate_mode": 'TRIANGLES' if args.target_triangles > 0 else 'RATIO',
+        "target_triangles": args.target_triangles if args.target_triangles > 0 else 20000,
+        "decimate_rate": args.decimate_rate,
+        "lod_levels": args.lod_levels,
+        "lod_texture": args.lod_texture,
+        "texture_name": args.texture_name,
+        "texture_resolution": args.texture_resolution,
+        "uv_method": args.uv_method,
+        "uv_island_margin": args.uv_island_margin,
+        "uv_pack_islands": args.uv_pack_islands,
+        "uv_texel_density": args.uv_texel_density,
+        "bake_normal": args.bake_normal,
+        "bake_roughness": args.bake_roughness,
+        "bake_metallic": args.bake_metallic,
+        "bake_ao": args.bake_ao,
+        "pack_orm": args.pack_orm,
+        "bake_profile": args.bake_profile,
+        "bake_tile_size": args.bake_tile_size,
+        "bake_method": args.bake_method,
+        "bake_ray_mode": args.bake_ray_mode,
+        "bake_cage_extrusion": args.bake_cage_extrusion,
+        "bake_check_missed_texels": not args.no_check_missed_texels,
+        "use_cache": bool(args.cache_directory),
+        "cache_directory": os.path.abspath(args.cache_directory) if args.cache_directory else "",
+        "cache_max_size": args.cache_max_size,
+        "report_directory": os.path.abspath(args.report_directory) if args.report_directory else "",
+        "profile_stage": args.profile_stage,
+        "measure_quality": args.measure_quality,
+        "export_format": args.export_format,
+        "export_compression": args.export_compression,
+        "export_image_format": args.export_image_format,
+        "export_draco_level": args.export_draco_level,
+        "export_draco_position_bits": args.export_draco_position_bits,
+        "export_draco_normal_bits": args.export_draco_normal_bits,
+        "export_draco_texcoord_bits": args.export_draco_texcoord_bits,
+    }
+
+# parse command line arguments after "--"
+def parse_arguments(argv):
+    argv = argv[argv.index("--") + 1:] if "--" in argv else []
+
+    parser = argparse.ArgumentParser(
+        prog="blender -b --python moderate_weight_reduction_tools.py --",
+        description="Generates models with reduced polygon mesh and optimized textures from the original models."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch_parser = subparsers.add_parser("batch", help="reduce all source models in a directory or manifest file.")
+    batch_parser.add_argument("--input", required=True, help="directory or manifest file (.txt or .json) of source models.")
+    batch_parser.add_argument("--output", required=True, help="directory to write reduced models and summary.")
+    batch_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of background blender processes.")
+    add_texture_arguments(batch_parser)
+    add_operator_arguments(batch_parser)
+
+    serve_parser = subparsers.add_parser("serve", help="watch a directory and reduce new or changed source models with warm background blender workers.")
+    serve_parser.add_argument("--input", required=True, help="directory to watch for source models.")
+    serve_parser.add_argument("--output", required=True, help="directory to write reduced models, queue, status and logs (outside of input directory).")
+    serve_parser.add_argument("--workers", type=int, default=1, help="number of warm background blender processes.")
+    serve_parser.add_argument("--poll-interval", type=float, default=5.0, help="seconds between scans of input directory.")
+    serve_parser.add_argument("--settle-time", type=float, default=10.0, help="seconds that source model must be unchanged before it is queued (file is still copied).")
+    serve_parser.add_argument("--max-attempts", type=int, default=3, help="number of attempts of job whose worker stopped while processing.")
+    serve_parser.add_argument("--once", action="store_true", help="process source models in input directory and exit when queue is empty.")
+    add_texture_arguments(serve_parser)
+    add_operator_arguments(serve_parser)
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="measure processing time of pipeline stages (or numpy, bmesh and operator mesh stages) on synthetic meshes.")
+    benchmark_parser.add_argument("--suite", default="pipeline", choices=["pipeline", "mesh"], help="time all stages of operator, or compare mesh processing methods.")
+    benchmark_parser.add_argument("--faces", type=int, nargs="+", default=[10000, 100000, 1000000, 5000000], help="face counts of synthetic meshes.")
+    benchmark_parser.add_argument("--vertices", nargs="+", default=["split", "joined"], choices=["split", "joined"], help="synthetic meshes with split or joined vertices (pipeline suite).")
+    benchmark_parser.add_argument("--materials", type=int, nargs="+", default=[1, 8], help="material counts of synthetic meshes (pipeline suite).")
+    benchmark_parser.add_argument("--texture-resolutions", nargs="+", default=["1024", "2048"], choices=["256", "512", "1024", "2048", "4096", "8192", "16384"], help="texture resolutions to measure (pipeline suite).")
+    benchmark_parser.add_argument("--repeat", type=int, default=3, help="number of measurements of each stage.")
+    benchmark_parser.add_argument("--output", default="", help="json file to write results.")
+    benchmark_parser.add_argument("--baseline", default="", help="json file of earlier results to compare with (exit code is 1 if a stage regresses).")
+    benchmark_parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown ratio of each stage against baseline.")
+    benchmark_parser.add_argument("--min-time", type=float, default=0.05, help="stages faster than this time (seconds) in baseline are not compared.")
+    add_operator_arguments(benchmark_parser)
+
+    worker_parser = subparsers.add_parser("worker", help="(internal) process a shard of models.")
+    worker_parser.add_argument("--shard", required=True, help="shard file written by batch command.")
+
+    serve_worker_parser = subparsers.add_parser("serve-worker", help="(internal) process jobs in queue of serve command.")
+    serve_worker_parser.add_argument("--config", required=True, help="config file written by serve command.")
+    serve_worker_parser.add_argument("--worker-id", type=int, required=True, help="index of worker.")
+    serve_worker_parser.add_argument("--parent-pid", type=int, required=True, help="process id of serve command (worker exits when it stops).")
+
+    return parser.parse_args(argv)
+
+# collect source model files from directory or manifest file
+def collect_source_files(input_path):
+    input_path = os.path.abspath(input_path)
+
+    # manifest file
+    if os.path.isfile(input_path):
+        base_directory = os.path.dirname(input_path)
+        with open(input_path, encoding="utf-8") as f:
+            if input_path.lower().endswith(".json"):
+                entries = json.load(f)
+            else:
+                entries = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+        files = [os.path.normpath(os.path.join(base_directory, entry)) for entry in entries]
+        return [(filepath, os.path.splitext(os.path.basename(filepath))[0]) for filepath in files]
+
+    # directory
+    files = []
+    for root, _, filenames in os.walk(input_path):
+        for filename in sorted(filenames):
+            if filename.lower().endswith(SOURCE_EXTENSIONS):
+                filepath = os.path.join(root, filename)
+                files.append((filepath, os.path.splitext(os.path.relpath(filepath, input_path))[0]))
+    return sorted(files)
+
+# split files into shards with similar total file size (largest first)
+def shard_source_files(files, count):
+    shards = [[] for _ in range(count)]
+    loads = [0] * count
+    for filepath, name in sorted(files, key=lambda file: -os.path.getsize(file[0]) if os.path.exists(file[0]) else 0):
+        index = loads.index(min(loads))
+        shards[index].append((filepath, name))
+        loads[index] += os.path.getsize(filepath) if os.path.exists(filepath) else 0
+    return [shard for shard in shards if shard]
+
+# resolve output path of each source model (same names get index, recorded output paths are kept)
+def resolve_output_paths(files, output_directory, extension, recorded_paths=None):
+    output_paths = {}
+    used_paths = set()
+    for filepath, _ in files:
+        if recorded_paths and filepath in recorded_paths:
+            output_paths[filepath] = recorded_paths[filepath]
+            used_paths.add(recorded_paths[filepath].lower())
+    for filepath, name in files:
+        if filepath in output_paths:
+            continue
+        output_path = os.path.join(output_directory, f"{name}{extension}")
+        index = 1
+        while output_path.lower() in used_paths:
+            output_path = os.path.join(output_directory, f"{name}_{index}{extension}")
+            index += 1
+        used_paths.add(output_path.lower())
+        output_paths[filepath] = output_path
+    return output_paths
+
+# run batch command
+def run_batch(args):
+    output_directory = os.path.abspath(args.output)
+    log_directory = os.path.join(output_directory, "logs")
+    os.makedirs(log_directory, exist_ok=True)
+
+    files = collect_source_files(args.input)
+    if not files:
+        print(f"source models are not found in {args.input}.")
+        return 1
+
+    # resolve output path of each source model (avoid collision of same names)
+    output_paths = resolve_output_paths(files, output_directory, '.glb' if args.export_format == 'GLB' else '.gltf')
+    jobs = [(filepath, output_paths[filepath]) for filepath, _ in files]
+
+    # cycles threads per worker to avoid oversubscription of cpu cores
+    worker_count = max(1, min(args.workers, len(jobs)))
+    threads = max(1, (os.cpu_count() or 1) // worker_count)
+    settings = operator_settings(args)
+
+    # launch background blender workers
+    start_time = time.perf_counter()
+    processes = []
+    for index, shard in enumerate(shard_source_files(jobs, worker_count)):
+        shard_path = os.path.join(log_directory, f"shard_{index}.json")
+        with open(shard_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": settings,
+                "texture_settings": texture_settings(args),
+                "lean": args.lean,
+                "threads": threads,
+                "jobs": [{"input": filepath, "output": output_path} for filepath, output_path in shard],
+                "result": os.path.join(log_directory, f"result_{index}.json"),
+            }, f, indent=2)
+
+        command = [bpy.app.binary_path, "-b", "--factory-startup", "-noaudio", "--python", os.path.abspath(__file__), "--", "worker", "--shard", shard_path]
+        log_file = open(os.path.join(log_directory, f"worker_{index}.log"), "w", encoding="utf-8")
+        processes.append((subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT), log_file, shard_path))
+    print(f"process {len(jobs)} models with {len(processes)} workers ({threads} threads per worker).")
+
+    # wait for workers and gather results
+    models = []
+    for process, log_file, shard_path in processes:
+        return_code = process.wait()
+        log_file.close()
+
+        with open(shard_path, encoding="utf-8") as f:
+            shard = json.load(f)
+        results = {}
+        if os.path.exists(shard["result"]):
+            with open(shard["result"], encoding="utf-8") as f:
+                results = {result["input"]: result for result in json.load(f)}
+        for job in shard["jobs"]:
+            models.append(results.get(job["input"], {
+                "input": job["input"],
+                "output": job["output"],
+                "status": "failed",
+                "elapsed": 0.0,
+                "error": f"worker exited with code {return_code}.",
+            }))
+
+    # write summary
+    summary = {
+        "settings": settings,
+        "workers": len(processes),
+        "threads_per_worker": threads,
+        "elapsed": time.perf_counter() - start_time,
+        "succeeded": len([model for model in models if model["status"] == "succeeded"]),
+        "failed": len([model for model in models if model["status"] != "succeeded"]),
+        "models": sorted(models, key=lambda model: model["input"]),
+    }
+    summary_path = os.path.join(output_directory, "summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    print(f"{summary['succeeded']} succeeded, {summary['failed']} failed in {summary['elapsed']:.1f}s. summary: {summary_path}")
+
+    return 0 if summary["failed"] == 0 else 1
+
+# load source model into empty scene and make it active
+def load_source_model(filepath, join=True):
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension == ".blend":
+        bpy.ops.wm.open_mainfile(filepath=filepath)
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+        if extension in (".glb", ".gltf"):
+            bpy.ops.import_scene.gltf(filepath=filepath)
+        elif extension == ".fbx":
+            bpy.ops.import_scene.fbx(filepath=filepath)
+        elif extension == ".obj":
+            bpy.ops.wm.obj_import(filepath=filepath)
+        else:
+            raise Exception(f"unsupported file format: {extension}")
+
+    # join mesh objects into one source object (merge mode joins them in operator)
+    mesh_objects = [o for o in bpy.context.view_layer.objects if o.type == 'MESH']
+    if not mesh_objects:
+        raise Exception("mesh object is not found.")
+    bpy.ops.object.select_all(action='DESELECT')
+    for mesh_object in mesh_objects:
+        mesh_object.select_set(True)
+    bpy.context.view_layer.objects.active = mesh_objects[0]
+    if join and len(mesh_objects) > 1:
+        bpy.ops.object.join()
+
+# reduce one source model and export result
+def process_model(filepath, output_path, settings, threads, texture_settings=None, lean=False):
+    load_source_model(filepath, settings["merge_mode"] == 'SEPARATE')
+
+    operator = bpy.ops.hololab.moderate_weight_reduction_lean if lean else bpy.ops.hololab.moderate_weight_reduction
+    result = operator(**settings, bake_threads=threads)
+    if result != {'FINISHED'}:
+        raise Exception("moderate weight reduction is cancelled.")
+
+    # export result objects (coarser lods are exported as separate files)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    export_options = get_gltf_export_options(settings["export_format"], settings["export_compression"], settings["export_image_format"], settings["export_draco_level"], settings["export_draco_position_bits"], settings["export_draco_normal_bits"], settings["export_draco_texcoord_bits"])
+    extension = ".glb" if settings["export_format"] == 'GLB' else ".gltf"
+    output_paths = []
+    object_targets = get_result_objects()
+    for level in sorted(set(o.hololab_lod_level for o in object_targets)):
+        lod_output_path = f"{os.path.splitext(output_path)[0]}{'' if level == 0 else f'_LOD{level}'}{extension}"
+        export_gltf_file([o for o in object_targets if o.hololab_lod_level == level], lod_output_path, export_options, settings["export_compression"] == 'MESHOPT')
+        output_paths.append(lod_output_path)
+
+    # save baked textures without image editor
+    if texture_settings is not None:
+        texture_directory = f"{os.path.splitext(output_path)[0]}_textures"
+        for result in save_baked_textures(texture_directory, texture_settings["file_format"], texture_settings["quality"], texture_settings["max_size"] * 1024):
+            output_paths.append(result["filepath"])
+    return output_paths
+
+# get total size of output files (including external buffers and images of gltf files)
+def get_output_size(outputs):
+    return sum(get_gltf_file_size(output) if output.lower().endswith((".glb", ".gltf")) else os.path.getsize(output) for output in outputs)
+
+# run worker command
+def run_worker(args):
+    with open(args.shard, encoding="utf-8") as f:
+        shard = json.load(f)
+
+    results = []
+    for job in shard["jobs"]:
+        start_time = time.perf_counter()
+        result = {"input": job["input"], "output": job["output"], "status": "succeeded", "error": ""}
+        try:
+            result["outputs"] = process_model(job["input"], job["output"], shard["settings"], shard["threads"], shard.get("texture_settings"), shard.get("lean", False))
+            result["output_size"] = get_output_size(result["outputs"])
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{e}"
+        result["elapsed"] = time.perf_counter() - start_time
+        print(f"{result['status']}: {job['input']} ({result['elapsed']:.1f}s)")
+
+        # write results after each model to keep them if worker crashes
+        results.append(result)
+        with open(shard["result"], "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+# hash content of file
+def hash_file(filepath):
+    hasher = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 ** 2), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+# persistent job queue of serve command in sqlite database (shared by service and worker processes)
+class JobQueue:
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path, timeout=60.0, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS files (input TEXT PRIMARY KEY, mtime REAL, size INTEGER, hash TEXT)")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, input TEXT, output TEXT, hash TEXT, status TEXT, worker INTEGER, "
+            "attempts INTEGER DEFAULT 0, error TEXT DEFAULT '', outputs TEXT DEFAULT '[]', output_size INTEGER DEFAULT 0, elapsed REAL DEFAULT 0.0, "
+            "log TEXT DEFAULT '', queued REAL, finished REAL)"
+        )
+
+    def close(self):
+        self.connection.close()
+
+    # run function in one write transaction (other processes wait for lock)
+    def transaction(self, function):
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            result = function(self.connection)
+            self.connection.execute("COMMIT")
+            return result
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    # get recorded modification time, size and hash of source file
+    def get_file(self, filepath):
+        return self.connection.execute("SELECT mtime, size, hash FROM files WHERE input = ?", (filepath,)).fetchone()
+
+    # record state of source file without queueing job (file is touched but content is not changed)
+    def update_file(self, filepath, mtime, size, file_hash):
+        self.connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (filepath, mtime, size, file_hash))
+
+    # record state of source file and queue job (queued job of same file is updated instead of adding new job)
+    def enqueue(self, filepath, output_path, mtime, size, file_hash):
+        def enqueue_job(connection):
+            connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (filepath, mtime, size, file_hash))
+            cursor = connection.execute("UPDATE jobs SET hash = ?, output = ?, queued = ? WHERE input = ? AND status = 'queued'", (file_hash, output_path, time.time(), filepath))
+            if cursor.rowcount == 0:
+                connection.execute("INSERT INTO jobs (input, output, hash, status, queued) VALUES (?, ?, ?, 'queued', ?)", (filepath, output_path, file_hash, time.time()))
+        self.transaction(enqueue_job)
+
+    # take oldest queued job for worker (none if queue is empty)
+    def claim(self, worker):
+        def claim_job(connection):
+            row = connection.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1 WHERE id = ?", (worker, row["id"]))
+            return dict(row)
+        return self.transaction(claim_job)
+
+    # record result of job
+    def finish(self, job_id, result):
+        self.connection.execute(
+            "UPDATE jobs SET status = ?, error = ?, outputs = ?, output_size = ?, elapsed = ?, log = ?, finished = ? WHERE id = ?",
+            (result["status"], result["error"], json.dumps(result["outputs"]), result["output_size"], result["elapsed"], result["log"], time.time(), job_id)
+        )
+
+    # queue jobs again that were running when service or worker stopped (jobs that stopped too often are failed)
+    def requeue_running(self, max_attempts, worker=None):
+        self.connection.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+            "error = CASE WHEN attempts >= ? THEN 'worker stopped while processing.' ELSE error END "
+            "WHERE status = 'running'" + ("" if worker is None else " AND worker = ?"),
+            (max_attempts, max_attempts) if worker is None else (max_attempts, max_attempts, worker)
+        )
+
+    # count jobs of each status
+    def count(self):
+        counts = {status: 0 for status in JOB_STATUSES}
+        for row in self.connection.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["count"]
+        return counts
+
+    # get output path of latest job of each source file
+    def get_output_paths(self):
+        rows = self.connection.execute("SELECT input, output FROM jobs WHERE id IN (SELECT MAX(id) FROM jobs GROUP BY input)").fetchall()
+        return {row["input"]: row["output"] for row in rows}
+
+    # get latest job of each source file
+    def get_latest_jobs(self):
+        rows = self.connection.execute("SELECT * FROM jobs WHERE id IN (SELECT MAX(id) FROM jobs GROUP BY input) ORDER BY input").fetchall()
+        return [dict(row, outputs=json.loads(row["outputs"])) for row in rows]
+
+# queue source models that are new or changed (by modification time and content hash) and are unchanged for settle time
+def enqueue_changed_files(queue, input_directory, output_directory, extension, settle_time):
+    now = time.time()
+    files = collect_source_files(input_directory)
+    output_paths = resolve_output_paths(files, output_directory, extension, queue.get_output_paths())
+    for filepath, _ in files:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            continue
+        if now - stat.st_mtime < settle_time:
+            continue
+        recorded = queue.get_file(filepath)
+        if recorded is not None and recorded["mtime"] == stat.st_mtime and recorded["size"] == stat.st_size:
+            continue
+        file_hash = hash_file(filepath)
+        if recorded is not None and recorded["hash"] == file_hash:
+            queue.update_file(filepath, stat.st_mtime, stat.st_size, file_hash)
+            continue
+        queue.enqueue(filepath, output_paths[filepath], stat.st_mtime, stat.st_size, file_hash)
+        print(f"queued: {filepath}")
+
+# write counts of jobs and latest job of each source model into status file
+def write_serve_status(queue, filepath):
+    temp_path = f"{filepath}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"updated": time.strftime("%Y-%m-%d %H:%M:%S"), "counts": queue.count(), "jobs": queue.get_latest_jobs()}, f, indent=2)
+    os.replace(temp_path, filepath)
+
+# start warm background blender process that takes jobs from queue
+def start_serve_worker(config_path, log_directory, index):
+    command = [bpy.app.binary_path, "-b", "--factory-startup", "-noaudio", "--python", os.path.abspath(__file__), "--", "serve-worker", "--config", config_path, "--worker-id", str(index), "--parent-pid", str(os.getpid())]
+    log_file = open(os.path.join(log_directory, f"serve_worker_{index}.log"), "a", encoding="utf-8")
+    return subprocess.Popen(command, stdout=log_file, stderr=subprocess.STDOUT), log_file
+
+# run serve command
+def run_serve(args):
+    input_directory = os.path.abspath(args.input)
+    output_directory = os.path.abspath(args.output)
+    if not os.path.isdir(input_directory):
+        print(f"input directory is not found: {input_directory}")
+        return 1
+    if os.path.commonpath([input_directory, output_directory]) == input_directory:
+        print("output directory must be outside of input directory.")
+        return 1
+    log_directory = os.path.join(output_directory, "logs")
+    os.makedirs(log_directory, exist_ok=True)
+
+    # write config of workers (cycles threads per worker to avoid oversubscription of cpu cores)
+    worker_count = max(1, args.workers)
+    threads = max(1, (os.cpu_count() or 1) // worker_count)
+    queue_path = os.path.join(output_directory, "queue.sqlite3")
+    config_path = os.path.join(log_directory, "serve.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "settings": operator_settings(args),
+            "texture_settings": texture_settings(args),
+            "lean": args.lean,
+            "threads": threads,
+            "queue": queue_path,
+            "log_directory": log_directory,
+            "poll_interval": args.poll_interval,
+        }, f, indent=2)
+
+    # jobs that were running when service stopped are queued again (finished jobs are kept)
+    queue = JobQueue(queue_path)
+    queue.requeue_running(args.max_attempts)
+    extension = ".glb" if args.export_format == 'GLB' else ".gltf"
+    settle_time = 0.0 if args.once else args.settle_time
+    status_path = os.path.join(output_directory, "status.json")
+
+    workers = [None] * worker_count
+    counts = queue.count()
+    print(f"watch {input_directory} with {worker_count} workers ({threads} threads per worker).")
+    try:
+        while True:
+            enqueue_changed_files(queue, input_directory, output_directory, extension, settle_time)
+
+            # start workers (job of worker that stopped is queued again)
+            for index, worker in enumerate(workers):
+                if worker is not None and worker[0].poll() is None:
+                    continue
+                if worker is not None:
+                    worker[1].close()
+                    queue.requeue_running(args.max_attempts, index)
+                    print(f"worker {index} exited with code {worker[0].returncode}.")
+                workers[index] = start_serve_worker(config_path, log_directory, index)
+
+            write_serve_status(queue, status_path)
+            counts = queue.count()
+            if args.once and counts["queued"] == 0 and counts["running"] == 0:
+                break
+            time.sleep(args.poll_interval)
+    except KeyboardInterrupt:
+        print("serve is stopped.")
+    finally:
+        for worker in workers:
+            if worker is not None:
+                worker[0].terminate()
+                worker[0].wait()
+                worker[1].close()
+        write_serve_status(queue, status_path)
+        queue.close()
+
+    print(f"succeeded {counts['succeeded']}, failed {counts['failed']}, queued {counts['queued']}.")
+    return 1 if args.once and counts["failed"] > 0 else 0
+
+# redirect stdout and stderr of process (including messages of blender) into file, and return descriptors to restore them
+def redirect_output(file):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    descriptors = (os.dup(1), os.dup(2))
+    os.dup2(file.fileno(), 1)
+    os.dup2(file.fileno(), 2)
+    return descriptors
+
+# restore stdout and stderr that are redirected
+def restore_output(descriptors):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(descriptors[0], 1)
+    os.dup2(descriptors[1], 2)
+    os.close(descriptors[0])
+    os.close(descriptors[1])
+
+# run serve worker command (blender process stays warm and takes jobs until serve command stops)
+def run_serve_worker(args):
+    with open(args.config, encoding="utf-8") as f:
+        config = json.load(f)
+
+    queue = JobQueue(config["queue"])
+    try:
+        while os.getppid() == args.parent_pid:
+            job = queue.claim(args.worker_id)
+            if job is None:
+                time.sleep(config["poll_interval"])
+                continue
+
+            # write messages of job into log of job
+            start_time = time.perf_counter()
+            result = {"status": "succeeded", "error": "", "outputs": [], "output_size": 0}
+            result["log"] = os.path.join(config["log_directory"], f"job_{job['id']}.log")
+            with open(result["log"], "w", encoding="utf-8") as log_file:
+                descriptors = redirect_output(log_file)
+                try:
+                    result["outputs"] = process_model(job["input"], job["output"], config["settings"], config["threads"], config["texture_settings"], config["lean"])
+                    result["output_size"] = get_output_size(result["outputs"])
+                except Exception as e:
+                    result["status"] = "failed"
+                    result["error"] = f"{e}"
+                    print(f"{e}")
+                finally:
+                    restore_output(descriptors)
+            result["elapsed"] = time.perf_counter() - start_time
+            queue.finish(job["id"], result)
+            print(f"{result['status']}: {job['input']} ({result['elapsed']:.1f}s)")
+    finally:
+        queue.close()
+
+    return 0
+
+# create material of principled bsdf with generated image texture for benchmark
+def create_benchmark_material(name):
+    material = bpy.data.materials.new(name=name)
+    material.use_nodes = True
+    nodes = material.node_tree.nodes
+    principled_bsdf = [node for node in nodes if node.bl_idname == 'ShaderNodeBsdfPrincipled'][0]
+    image_node = nodes.new('ShaderNodeTexImage')
+    image_node.image = bpy.data.images.new(name=name, width=1024, height=1024)
+    image_node.image.generated_type = 'UV_GRID'
+    material.node_tree.links.new(image_node.outputs['Color'], principled_bsdf.inputs['Base Color'])
+    return material
+
+# create synthetic mesh object for benchmark (wavy grid with uv map, split vertices and materials in bands of faces)
+def create_benchmark_object(face_count, split=True, material_count=0):
+    segments = max(2, int(math.sqrt(face_count)))
+    mesh = bpy.data.meshes.new("Benchmark")
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    bmesh.ops.create_grid(bm, x_segments=segments, y_segments=segments, size=1.0, calc_uvs=True)
+    if split:
+        bmesh.ops.split_edges(bm, edges=bm.edges[:])
+    bm.to_mesh(mesh)
+    bm.free()
+
+    # wave surface so that decimation and bake have detail to keep
+    coordinates = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get("co", coordinates)
+    coordinates = coordinates.reshape(-1, 3)
+    coordinates[:, 2] = 0.05 * numpy.sin(coordinates[:, 0] * 20.0) * numpy.cos(coordinates[:, 1] * 20.0)
+    mesh.vertices.foreach_set("co", coordinates.ravel())
+
+    for index in range(material_count):
+        mesh.materials.append(create_benchmark_material(f"Benchmark_{index}"))
+    if material_count > 1:
+        polygon_count = len(mesh.polygons)
+        mesh.polygons.foreach_set("material_index", (numpy.arange(polygon_count) * material_count // polygon_count).astype(numpy.int32))
+    mesh.update()
+
+    object_benchmark = bpy.data.objects.new("Benchmark", mesh)
+    bpy.context.scene.collection.objects.link(object_benchmark)
+    return object_benchmark
+
+# run operator on synthetic model and return face count and wall time of each stage
+def run_benchmark_pipeline(face_count, split, material_count, settings, lean=False):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    object_benchmark = create_benchmark_object(face_count, split, material_count)
+    faces = len(object_benchmark.data.polygons)
+    object_benchmark.select_set(True)
+    bpy.context.view_layer.objects.active = object_benchmark
+
+    # report and exported files are written into work directory
+    work_directory = tempfile.mkdtemp(prefix="hololab_benchmark_")
+    try:
+        report_directory = os.path.join(work_directory, "report")
+        settings = dict(settings, use_cache=False, cache_directory="", report_directory=report_directory, export_directory=os.path.join(work_directory, "export"))
+        operator = bpy.ops.hololab.moderate_weight_reduction_lean if lean else bpy.ops.hololab.moderate_weight_reduction
+        result = operator(**settings)
+        if result != {'FINISHED'}:
+            raise Exception("moderate weight reduction is cancelled.")
+        report_name = [name for name in os.listdir(report_directory) if name.endswith(".json")][0]
+        with open(os.path.join(report_directory, report_name), encoding="utf-8") as f:
+            report = json.load(f)
+    finally:
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+    stage_times = {}
+    for record in report["stages"]:
+        stage_times[record["stage"]] = stage_times.get(record["stage"], 0.0) + record["wall_time"]
+    stage_times["total"] = report["elapsed"]
+    return faces, stage_times
+
+# measure wall time of all operator stages on each synthetic model and texture resolution
+def run_benchmark_pipeline_suite(args):
+    results = []
+    for face_count in args.faces:
+        for vertices in args.vertices:
+            for material_count in args.materials:
+                for texture_resolution in args.texture_resolutions:
+                    settings = dict(operator_settings(args), texture_resolution=texture_resolution)
+                    timings = {}
+                    for _ in range(args.repeat):
+                        faces, stage_times = run_benchmark_pipeline(face_count, vertices == "split", material_count, settings, args.lean)
+                        for stage, wall_time in stage_times.items():
+                            timings.setdefault(stage, []).append(wall_time)
+                    for stage, stage_timings in timings.items():
+                        results.append({"stage": stage, "faces": faces, "vertices": vertices, "materials": material_count, "texture_resolution": texture_resolution, "min": min(stage_timings), "mean": sum(stage_timings) / len(stage_timings)})
+                        print(f"{stage:32} {faces:>10} faces {vertices:7} {material_count:>2} materials {texture_resolution:>5}px  min {min(stage_timings):8.3f}s  mean {sum(stage_timings) / len(stage_timings):8.3f}s")
+    return results
+
+# compare processing time of numpy, bmesh and operator mesh stages
+def run_benchmark_mesh_suite(args):
+    stages = [
+        ("remove_doubles", "NUMPY", lambda o: remove_doubles_numpy(o, 0.001)),
+        ("remove_doubles", "BMESH", lambda o: remove_doubles_bmesh(o, 0.001)),
+        ("remove_doubles", "OPERATOR", lambda o: remove_doubles_operator(o, 0.001)),
+        ("triangulate", "BMESH", triangulate_bmesh),
+        ("triangulate", "OPERATOR", triangulate_operator),
+    ]
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    results = []
+    for face_count in args.faces:
+        for stage, method, function in stages:
+            timings = []
+            for _ in range(args.repeat):
+                object_benchmark = create_benchmark_object(face_count)
+                faces = len(object_benchmark.data.polygons)
+                start_time = time.perf_counter()
+                function(object_benchmark)
+                timings.append(time.perf_counter() - start_time)
+                mesh = object_benchmark.data
+                bpy.data.objects.remove(object_benchmark)
+                bpy.data.meshes.remove(mesh)
+            results.append({"stage": stage, "method": method, "faces": faces, "min": min(timings), "mean": sum(timings) / len(timings)})
+            print(f"{stage:16} {method:10} {faces:>10} faces  min {min(timings):8.3f}s  mean {sum(timings) / len(timings):8.3f}s")
+    return results
+
+# find stages that are slower than baseline beyond tolerance (minimum time of same stage and case is compared)
+def compare_benchmark_results(results, baseline_results, tolerance, min_time):
+    def get_key(result):
+        return tuple(sorted((key, value) for key, value in result.items() if key not in ("min", "mean")))
+
+    baselines = {get_key(result): result for result in baseline_results}
+    regressions = []
+    for result in results:
+        baseline = baselines.get(get_key(result))
+        if baseline is None or baseline["min"] < min_time:
+            continue
+        ratio = result["min"] / baseline["min"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(dict(result, baseline=baseline["min"], ratio=ratio))
+    return regressions
+
+# run benchmark command
+def run_benchmark(args):
+    results = run_benchmark_pipeline_suite(args) if args.suite == "pipeline" else run_benchmark_mesh_suite(args)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"blender_version": bpy.app.version_string, "suite": args.suite, "results": results}, f, indent=2)
+
+    # compare with baseline (results of earlier versions are list of results)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    baseline_results = baseline["results"] if isinstance(baseline, dict) else baseline
+    regressions = compare_benchmark_results(results, baseline_results, args.tolerance, args.min_time)
+    for regression in regressions:
+        case = ", ".join(f"{key}={value}" for key, value in regression.items() if key not in ("stage", "min", "mean", "baseline", "ratio"))
+        print(f"regression: {regression['stage']} ({case})  {regression['baseline']:.3f}s -> {regression['min']:.3f}s (x{regression['ratio']:.2f})")
+    print(f"{len(regressions)} regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    return 1 if regressions else 0
+
+def main(argv):
+    args = parse_arguments(argv)
+    if args.command == "batch":
+        sys.exit(run_batch(args))
+    if args.command == "benchmark":
+        sys.exit(run_benchmark(args))
+    if args.command == "worker":
+        sys.exit(run_worker(args))
+    if args.command == "serve":
+        sys.exit(run_serve(args))
+    if args.command == "serve-worker":
+        sys.exit(run_serve_worker(args))
+
 if __name__ == "__main__":
     register()
+    main(sys.argv)